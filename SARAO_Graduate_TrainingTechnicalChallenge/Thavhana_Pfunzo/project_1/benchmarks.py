@@ -0,0 +1,239 @@
+"""
+Benchmarks for the word counter.
+
+Run from the Thavhana_Pfunzo directory, for example:
+
+    python -m project_1.benchmarks parallel --megabytes 256
+    python -m project_1.benchmarks tokenizer --megabytes 16
+    python -m project_1.benchmarks memory --sizes 1000000 10000000 50000000
+    python -m project_1.benchmarks top --sizes 10000 100000 1000000
+"""
+import argparse
+import os
+import random
+import re
+import resource
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from .word_counter import CompactWordCounter, WordCounter, count_file_parallel, count_words
+except ImportError:
+    from word_counter import CompactWordCounter, WordCounter, count_file_parallel, count_words
+
+BACKENDS = {"dict": WordCounter, "compact": CompactWordCounter}
+
+
+def legacy_count_words(text: str) -> dict:
+    """The original per-token process_text loop, kept as the benchmark reference."""
+    word_counts = {}
+    words = re.findall(r"\b[\w']+\b", text.lower())
+    for word in words:
+        clean_word = re.sub(r"[^a-z']", '', word)
+        if clean_word and any(c.isalpha() for c in clean_word):
+            word_counts[clean_word] = word_counts.get(clean_word, 0) + 1
+    return word_counts
+
+
+def generate_corpus(path: str, megabytes: int, seed: int = 0) -> None:
+    """
+    Write a reproducible corpus of random words with a Zipf-like frequency distribution.
+
+    Args:
+        path (str): Where to write the corpus
+        megabytes (int): Approximate size of the corpus in MiB
+        seed (int): Random seed, so every run uses the same corpus (default: 0)
+    """
+    rng = random.Random(seed)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    vocabulary = ["".join(rng.choice(letters) for _ in range(rng.randint(2, 10))) for _ in range(50000)]
+    weights = [1 / rank for rank in range(1, len(vocabulary) + 1)]
+    punctuation = [" ", " ", " ", " ", ", ", ". ", "! ", "'s ", "\n"]
+
+    target = megabytes << 20
+    written = 0
+    with open(path, "w", encoding="utf-8") as f:
+        while written < target:
+            words = rng.choices(vocabulary, weights, k=10000)
+            block = "".join(word.capitalize() + rng.choice(punctuation) for word in words)
+            f.write(block)
+            written += len(block)
+
+
+def bench_parallel(megabytes: int = 64, workers_list=None) -> None:
+    """
+    Compare single-process counting of a file with count_file_parallel.
+
+    Args:
+        megabytes (int): Size of the generated corpus in MiB (default: 64)
+        workers_list (list, optional): Worker counts to try. Defaults to powers of two
+            up to the CPU count.
+    """
+    cpus = os.cpu_count() or 1
+    if workers_list is None:
+        workers_list = [1]
+        while workers_list[-1] * 2 <= cpus:
+            workers_list.append(workers_list[-1] * 2)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "corpus.txt")
+        generate_corpus(path, megabytes)
+
+        start = time.perf_counter()
+        baseline = WordCounter()
+        baseline.process_file(path)
+        serial = time.perf_counter() - start
+        print(f"Corpus: {megabytes} MiB, {sum(baseline.word_counts.values())} words")
+        print(f"{'workers':>8} {'seconds':>10} {'MiB/s':>10} {'speedup':>8}")
+        print(f"{'serial':>8} {serial:10.3f} {megabytes / serial:10.1f} {1.0:8.2f}")
+
+        for workers in workers_list:
+            start = time.perf_counter()
+            counter = count_file_parallel(path, workers=workers)
+            elapsed = time.perf_counter() - start
+            assert counter.word_counts == baseline.word_counts
+            print(f"{workers:8d} {elapsed:10.3f} {megabytes / elapsed:10.1f} {serial / elapsed:8.2f}")
+
+
+def bench_tokenizer(megabytes: int = 16, repeats: int = 3) -> None:
+    """
+    Compare tokens/sec of the original tokenizer loop with count_words and process_text.
+
+    Args:
+        megabytes (int): Size of the generated corpus in MiB (default: 16)
+        repeats (int): Number of timed runs; the best is reported (default: 3)
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "corpus.txt")
+        generate_corpus(path, megabytes)
+        with open(path, encoding="utf-8") as f:
+            text = f.read()
+
+    expected = legacy_count_words(text)
+    assert count_words(text) == expected
+    tokens = sum(expected.values())
+
+    def process_text(text):
+        WordCounter().process_text(text)
+
+    print(f"Corpus: {megabytes} MiB, {tokens} tokens")
+    print(f"{'implementation':>16} {'seconds':>10} {'tokens/s':>14}")
+    for name, function in (("legacy loop", legacy_count_words),
+                           ("count_words", count_words),
+                           ("process_text", process_text)):
+        best = min(_timed(function, text) for _ in range(repeats))
+        print(f"{name:>16} {best:10.3f} {tokens / best:14,.0f}")
+
+
+def _timed(function, *args) -> float:
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def synthetic_word(i: int) -> str:
+    """Return the i-th distinct lowercase word (base-26 digits, at least 5 letters)."""
+    letters = []
+    for _ in range(5):
+        i, digit = divmod(i, 26)
+        letters.append(chr(97 + digit))
+    while i:
+        i, digit = divmod(i, 26)
+        letters.append(chr(97 + digit))
+    return "".join(letters)
+
+
+def _measure_backend(backend: str, size: int) -> tuple:
+    """Count size distinct words with a backend and return (peak RSS growth in bytes, seconds)."""
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    counter = BACKENDS[backend]()
+    for i in range(size):
+        counter.process_word(synthetic_word(i))
+    elapsed = time.perf_counter() - start
+    after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    assert len(counter.word_counts) == size
+    return (after - before) * 1024, elapsed  # ru_maxrss is in KiB on Linux
+
+
+def bench_memory(sizes=(1000000, 10000000, 50000000), backends=("dict", "compact")) -> None:
+    """
+    Compare the memory used by the dict and compact backends for many distinct words.
+
+    Each measurement runs in a fresh process and reports its peak RSS growth, so the
+    backends do not share allocator state. The 50M dict run needs several GiB of RAM.
+
+    Args:
+        sizes (tuple): Numbers of distinct words to count
+        backends (tuple): Names of the backends to compare ("dict", "compact")
+    """
+    print(f"{'backend':>8} {'words':>12} {'MiB':>10} {'bytes/word':>11} {'seconds':>9}")
+    for size in sizes:
+        for backend in backends:
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                grown, elapsed = pool.submit(_measure_backend, backend, size).result()
+            print(f"{backend:>8} {size:12,d} {grown / 2**20:10.1f} {grown / size:11.1f} {elapsed:9.1f}")
+
+
+def bench_top(sizes=(10000, 100000, 1000000), n: int = 10, reads: int = 1000) -> None:
+    """
+    Time get_top_words on vocabularies of singletons while new words keep arriving.
+
+    Every word is counted once, so each read reaches into the count-1 bucket, which
+    holds the whole vocabulary: the worst case for the frequency index.
+
+    Args:
+        sizes (tuple): Numbers of distinct words in the vocabulary
+        n (int): Number of top words read (default: 10)
+        reads (int): Number of timed reads, each after one more new word (default: 1000)
+    """
+    print(f"{'words':>10} {'full sort us':>13} {'index us':>9}")
+    for size in sizes:
+        counter = WordCounter()
+        for i in range(size):
+            counter.process_word(synthetic_word(i))
+        full_sort = _timed(lambda: sorted(counter.word_counts.items(), key=lambda x: (-x[1], x[0]))[:n])
+        counter.get_top_words(n)  # The first partial read of a bucket builds its heap
+        start = time.perf_counter()
+        for i in range(size, size + reads):
+            counter.process_word(synthetic_word(i))
+            counter.get_top_words(n)
+        index = (time.perf_counter() - start) / reads
+        assert counter.get_top_words(n) == sorted(counter.word_counts.items(), key=lambda x: (-x[1], x[0]))[:n]
+        print(f"{size:10,d} {full_sort * 1e6:13.0f} {index * 1e6:9.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Word counter benchmarks")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    parallel = subparsers.add_parser("parallel", help="Multi-process counting speedup")
+    parallel.add_argument("--megabytes", type=int, default=64)
+    parallel.add_argument("--workers", type=int, nargs="*")
+
+    tokenizer = subparsers.add_parser("tokenizer", help="Tokenizer throughput before and after")
+    tokenizer.add_argument("--megabytes", type=int, default=16)
+    tokenizer.add_argument("--repeats", type=int, default=3)
+
+    memory = subparsers.add_parser("memory", help="Memory of the dict and compact backends")
+    memory.add_argument("--sizes", type=int, nargs="+", default=[1000000, 10000000, 50000000])
+    memory.add_argument("--backends", nargs="+", choices=sorted(BACKENDS), default=["dict", "compact"])
+
+    top = subparsers.add_parser("top", help="Top-n reads from the frequency index")
+    top.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    top.add_argument("--reads", type=int, default=1000)
+
+    args = parser.parse_args()
+    if args.benchmark == "parallel":
+        bench_parallel(args.megabytes, args.workers)
+    elif args.benchmark == "tokenizer":
+        bench_tokenizer(args.megabytes, args.repeats)
+    elif args.benchmark == "memory":
+        bench_memory(args.sizes, args.backends)
+    elif args.benchmark == "top":
+        bench_top(args.sizes, reads=args.reads)
+
+
+if __name__ == "__main__":
+    main()
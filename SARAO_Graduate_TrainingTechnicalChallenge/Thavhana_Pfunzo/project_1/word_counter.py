@@ -1,7 +1,58 @@
+import codecs
+import mmap
+import os
+import re
+import struct
+import sys
+import time
+from array import array
+from bisect import bisect_left, insort
+from collections import Counter, deque
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from heapq import heapify, heappop, heappush, heapreplace, merge as heap_merge, nlargest, nsmallest
+from itertools import compress
+from typing import Callable, Iterable, Optional, Union
+
+# Split on word boundaries, keeping apostrophes within words
+_TOKEN_PATTERN = re.compile(r"\b[\w']+\b")
+# Anything that is not a lowercase ASCII letter or an apostrophe is stripped from a token
+_NON_WORD_CHARS = re.compile(r"[^a-z']+")
+_LETTER = re.compile(r"[a-z]")
+
+
+def count_words(text: str) -> Counter:
+    """
+    Tokenize text and count its normalized words in bulk.
+    
+    Tokens are counted with a single C-level Counter pass over the regex matches;
+    only the distinct tokens that are not plain ASCII letters are then cleaned,
+    so normalization costs scale with the vocabulary rather than the text.
+    
+    Args:
+        text (str): The text to tokenize
+        
+    Returns:
+        Counter: Counts of the lowercase words, with every character other than a-z and
+        apostrophes removed, and tokens without any letter dropped
+    """
+    counts = Counter(_TOKEN_PATTERN.findall(text.lower()))
+    for token in [token for token in counts if not (token.isascii() and token.isalpha())]:
+        count = counts.pop(token)
+        clean_token = _NON_WORD_CHARS.sub("", token)
+        if _LETTER.search(clean_token):
+            counts[clean_token] += count
+    return counts
+
+
 class WordCounter:
     """
     A class to track and retrieve the n most frequently used words from a given text.
     
+    Counts are mirrored in a frequency index that is updated on every increment, so
+    reading the top words does not re-sort the whole vocabulary. ``word_counts`` should
+    therefore only be modified through the process methods.
+    
     Attributes:
         word_counts (dict): A dictionary to store word counts
         n (int): Number of top frequent words to track
@@ -16,6 +67,10 @@ class WordCounter:
         """
         self.word_counts = {}
         self.n = n
+        self._index = _CountBuckets()
+        # State of the counts when they were last saved to each snapshot path, so that
+        # save(path, append=True) only appends what changed since (see _saved_state)
+        self._saved = {}
     
     def process_word(self, word: str) -> None:
         """
@@ -28,8 +83,19 @@ class WordCounter:
             return
             
         # Convert to lowercase to make the count case-insensitive
-        word = word.lower()
-        self.word_counts[word] = self.word_counts.get(word, 0) + 1
+        self._add(word.lower())
+    
+    def _add(self, word: str, count: int = 1) -> None:
+        """
+        Add count occurrences of an already normalized word.
+        
+        Args:
+            word (str): The normalized (lowercase) word
+            count (int): Number of occurrences to add (default: 1)
+        """
+        old = self.word_counts.get(word, 0)
+        self.word_counts[word] = old + count
+        self._index.move(word, old, old + count)
     
     def get_top_words(self, n: int = None) -> list:
         """
@@ -41,14 +107,9 @@ class WordCounter:
         Returns:
             list: List of tuples containing (word, count) sorted by frequency (descending)
         """
-        # Sort words by count in descending order, then alphabetically
-        sorted_words = sorted(
-            self.word_counts.items(),
-            key=lambda x: (-x[1], x[0])
-        )
-        # Return top n words, but handle empty input case
+        # Read the highest buckets of the frequency index (count descending, then alphabetically)
         top_n = n if n is not None else self.n
-        return sorted_words[:min(top_n, len(sorted_words))] if top_n > 0 else []
+        return self._index.top(top_n)
     
     def process_text(self, text: str) -> None:
         """
@@ -57,14 +118,1135 @@ class WordCounter:
         Args:
             text (str): The text to process
         """
-        import re
-        # Split on word boundaries, keeping apostrophes within words
-        words = re.findall(r"\b[\w']+\b", text.lower())
-        for word in words:
-            # Remove any remaining non-alphabetic characters except apostrophes
-            clean_word = re.sub(r"[^a-z']", '', word)
-            if clean_word and any(c.isalpha() for c in clean_word):
-                self.word_counts[clean_word] = self.word_counts.get(clean_word, 0) + 1
+        for word, count in count_words(text).items():
+            self._add(word, count)
+    
+    def process_stream(self, chunks: Iterable[Union[str, bytes]], encoding: str = "utf-8") -> None:
+        """
+        Process text arriving in chunks, without holding more than one chunk in memory.
+        
+        A word split across a chunk boundary is carried over and counted once it is
+        complete, so the counts are identical to calling process_text on the joined text.
+        
+        Args:
+            chunks (Iterable[Union[str, bytes]]): Text chunks; bytes chunks (e.g. slices
+                of an mmap) are decoded incrementally, so multi-byte characters may be split
+            encoding (str): Encoding used to decode bytes chunks (default: "utf-8")
+        """
+        decoder = codecs.getincrementaldecoder(encoding)()
+        carry = ""
+        for chunk in chunks:
+            if not isinstance(chunk, str):
+                chunk = decoder.decode(chunk)
+            carry = self._process_complete_words(carry + chunk)
+        carry += decoder.decode(b"", final=True)
+        self.process_text(carry)
+    
+    def process_file(self, path: str, encoding: str = "utf-8", chunk_size: int = 1 << 20) -> None:
+        """
+        Process a text file by memory-mapping it and reading it in fixed-size chunks.
+        
+        Args:
+            path (str): Path of the file to process
+            encoding (str): Encoding of the file (default: "utf-8")
+            chunk_size (int): Number of bytes to decode at a time (default: 1 MiB)
+        """
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                self.process_stream(
+                    (mapped[start:start + chunk_size] for start in range(0, len(mapped), chunk_size)),
+                    encoding,
+                )
+    
+    def _process_complete_words(self, text: str) -> str:
+        """
+        Process text up to its last word boundary and return the trailing partial word.
+        
+        Args:
+            text (str): The text to process
+            
+        Returns:
+            str: The trailing run of word characters and apostrophes, which may continue
+            in the next chunk
+        """
+        split = len(text)
+        while split and _is_word_char(text[split - 1]):
+            split -= 1
+        if split:
+            self.process_text(text[:split])
+        return text[split:]
+    
+    def merge(self, other: "WordCounter") -> "WordCounter":
+        """
+        Add the counts of another counter of the same kind into this one.
+        
+        Args:
+            other (WordCounter): The counter to merge in; it is left unchanged
+            
+        Returns:
+            WordCounter: This counter, to allow chaining
+            
+        Raises:
+            TypeError: If other is not a counter of the same kind
+        """
+        if type(other) is not type(self):
+            raise TypeError(f"Cannot merge {type(other).__name__} into {type(self).__name__}")
+        for word, count in other.word_counts.items():
+            self._add(word, count)
+        return self
+    
+    def __add__(self, other: "WordCounter") -> "WordCounter":
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._empty_like().merge(self).merge(other)
+    
+    def _empty_like(self) -> "WordCounter":
+        """Create an empty counter with the same configuration as this one."""
+        return type(self)(self.n)
+    
+    def save(self, path: str, append: bool = False) -> None:
+        """
+        Save the counts as a memory-mappable snapshot (see WordCountSnapshot).
+        
+        Args:
+            path (str): Path of the snapshot file
+            append (bool): Append the counts as a new segment of an existing snapshot
+                instead of replacing it (default: False). Counts in later segments are
+                added to earlier ones, so if this counter saved to the same path before,
+                only the counts added since that save are appended; otherwise all counts
+                are. A path that does not exist yet gets all counts.
+        """
+        key = os.path.abspath(path)
+        if append and os.path.exists(path):
+            state = self._saved.get(key)
+            counts = self.word_counts if state is None else self._counts_since(state)
+            if counts:
+                with open(path, "ab") as f:
+                    f.write(_encode_segment(counts))
+        else:
+            # Write to a temporary file first so an open mapping of the old file stays valid
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(_SNAPSHOT_HEADER.pack(_SNAPSHOT_MAGIC, _SNAPSHOT_VERSION))
+                f.write(_encode_segment(self.word_counts))
+            os.replace(tmp_path, path)
+        self._saved[key] = self._saved_state()
+    
+    def _saved_state(self):
+        """Record the current counts, for a later call to _counts_since."""
+        return dict(self.word_counts)
+    
+    def _counts_since(self, state) -> dict:
+        """
+        Return the counts added since state was recorded with _saved_state.
+        
+        Counts that did not grow are left out, since a snapshot segment can only add.
+        """
+        return {word: count - state.get(word, 0) for word, count in self.word_counts.items()
+                if count > state.get(word, 0)}
+    
+    @staticmethod
+    def load(path: str) -> "WordCountSnapshot":
+        """
+        Open a snapshot written by save without reading it into memory.
+        
+        Args:
+            path (str): Path of the snapshot file
+            
+        Returns:
+            WordCountSnapshot: A read-only view answering lookups and top-n queries
+            straight from the mapped file; use to_counter() to get a mutable WordCounter
+        """
+        return WordCountSnapshot(path)
+
+
+def _is_word_char(char: str) -> bool:
+    """Return True for characters matched by the tokenizer's [\\w'] class."""
+    return char.isalnum() or char == "_" or char == "'"
+
+
+class _CountBuckets:
+    """
+    Groups words by their current count so the smallest and largest counts are found in O(1).
+    
+    Moving a word between counts costs O(log D + log B), where D is the number of distinct
+    counts (at most about sqrt(2 * total occurrences)) and B the size of the bucket.
+    
+    Buckets keep their words in a set. The first time only part of a bucket is read,
+    it also gets a binary heap of its words in alphabetical order, which is maintained
+    from then on, so later reads take the first k words without touching the rest of
+    it. Words leaving a bucket are only dropped from its set; the heap keeps them as
+    stale entries until they make up half of it, and then is rebuilt from the set.
+    
+    Attributes:
+        buckets (dict): Maps each count to the set of words that currently have it
+        heaps (dict): Maps the counts of partially read buckets to a heap of their words,
+            possibly with stale entries
+        counts (list): The distinct counts held in ``buckets``, in ascending order
+    """
+    
+    def __init__(self):
+        self.buckets = {}
+        self.heaps = {}
+        self.counts = []
+    
+    def insert(self, word: str, count: int) -> None:
+        """Place a word into the bucket for count, creating the bucket if needed."""
+        bucket = self.buckets.get(count)
+        if bucket is None:
+            bucket = self.buckets[count] = set()
+            insort(self.counts, count)
+        bucket.add(word)
+        heap = self.heaps.get(count)
+        if heap is not None:
+            heappush(heap, word)
+    
+    def remove(self, word: str, count: int) -> None:
+        """Take a word out of the bucket for count, dropping the bucket once empty."""
+        bucket = self.buckets[count]
+        bucket.discard(word)
+        if not bucket:
+            del self.buckets[count]
+            self.heaps.pop(count, None)
+            del self.counts[bisect_left(self.counts, count)]
+        elif count in self.heaps and len(self.heaps[count]) > 2 * len(bucket) + 16:
+            # Rebuilding costs O(B) once at least B entries went stale, so O(1) per removal
+            self._build_heap(count)
+    
+    def _build_heap(self, count: int) -> list:
+        heap = self.heaps[count] = list(self.buckets[count])
+        heapify(heap)
+        return heap
+    
+    def move(self, word: str, old_count: int, new_count: int) -> None:
+        """Move a word from the bucket for old_count to the bucket for new_count."""
+        if old_count:
+            self.remove(word, old_count)
+        if new_count:
+            self.insert(word, new_count)
+    
+    def min_count(self) -> int:
+        """Return the smallest count currently held (0 when empty)."""
+        return self.counts[0] if self.counts else 0
+    
+    def smallest(self, count: int, k: int) -> list:
+        """
+        Return the k alphabetically first words of the bucket for count.
+        
+        A bucket with at most k words is simply sorted. Otherwise its heap (built on the
+        first such read) is walked best-first from the root, so only the entries that
+        sort before the kth word, and their children, are visited: O(k log k) plus the
+        stale entries among them, independent of the size of the bucket.
+        
+        Args:
+            count (int): The count whose bucket is read
+            k (int): Number of words to return
+            
+        Returns:
+            list: Up to k words in alphabetical order
+        """
+        bucket = self.buckets[count]
+        if len(bucket) <= k:
+            return sorted(bucket)
+        heap = self.heaps.get(count) or self._build_heap(count)
+        words = []
+        frontier = [(heap[0], 0)]
+        while frontier and len(words) < k:
+            word, i = heappop(frontier)
+            # Skip stale entries; a word removed and re-inserted has two adjacent entries
+            if word in bucket and (not words or words[-1] != word):
+                words.append(word)
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < len(heap):
+                    heappush(frontier, (heap[child], child))
+        return words
+    
+    def top(self, n: int) -> list:
+        """
+        Get the n words with the highest counts by walking the buckets downwards.
+        
+        Only the buckets that contribute to the result are visited, and the last one is
+        read only as far as needed through its heap, so apart from building that heap
+        the first time, a read costs O(n log n) regardless of the vocabulary size (plus
+        any stale heap entries it passes).
+        
+        Args:
+            n (int): Number of words to return
+            
+        Returns:
+            list: List of (word, count) tuples sorted by count (descending), then alphabetically
+        """
+        result = []
+        if n <= 0:
+            return result
+        for count in reversed(self.counts):
+            result.extend((word, count) for word in self.smallest(count, n - len(result)))
+            if len(result) >= n:
+                break
+        return result
+
+
+class SpaceSaving:
+    """
+    Space-Saving heavy-hitters summary with a fixed number of monitored words.
+    
+    Every monitored word carries an estimated count and the maximum amount by which
+    that estimate can exceed the true count. When the summary is full, a new word
+    replaces the word with the smallest count and inherits that count as its error.
+    Any word whose true count exceeds total / capacity is guaranteed to be monitored.
+    
+    Attributes:
+        capacity (int): Maximum number of monitored words
+        counts (dict): Estimated count of each monitored word (never an underestimate)
+        errors (dict): Maximum overestimation of each monitored word's count
+        total (int): Total number of occurrences added to the summary
+    """
+    
+    def __init__(self, capacity: int):
+        """
+        Initialize an empty summary.
+        
+        Args:
+            capacity (int): Maximum number of monitored words
+            
+        Raises:
+            ValueError: If capacity is not a positive integer
+        """
+        if capacity < 1:
+            raise ValueError("Capacity must be a positive integer")
+        self.capacity = capacity
+        self.counts = {}
+        self.errors = {}
+        self.total = 0
+        self._buckets = _CountBuckets()
+    
+    def add(self, word: str, count: int = 1) -> None:
+        """
+        Record count occurrences of a word.
+        
+        Args:
+            word (str): The word to record
+            count (int): Number of occurrences (default: 1)
+        """
+        self.total += count
+        old = self.counts.get(word)
+        if old is not None:
+            self.counts[word] = old + count
+            self._buckets.move(word, old, old + count)
+            return
+        
+        error = 0
+        if len(self.counts) >= self.capacity:
+            # Evict one of the words with the smallest count; the newcomer inherits it
+            error = self._buckets.min_count()
+            evicted = self._buckets.buckets[error].pop()
+            if not self._buckets.buckets[error]:
+                self._buckets.remove(evicted, error)
+            del self.counts[evicted]
+            del self.errors[evicted]
+        
+        self.counts[word] = error + count
+        self.errors[word] = error
+        self._buckets.insert(word, error + count)
+    
+    def top(self, n: int) -> list:
+        """
+        Get the n monitored words with the highest estimated counts.
+        
+        Args:
+            n (int): Number of words to return
+            
+        Returns:
+            list: List of (word, count, error) tuples sorted by count (descending), then
+            alphabetically. The true count of each word lies in [count - error, count].
+        """
+        return [(word, count, self.errors[word]) for word, count in self._buckets.top(n)]
+    
+    def merge(self, other: "SpaceSaving") -> None:
+        """
+        Merge another summary into this one, keeping the error bounds valid.
+        
+        A word missing from a full summary may have occurred up to that summary's
+        smallest count, so that amount is added to both its count and its error.
+        
+        Args:
+            other (SpaceSaving): The summary to merge in; it is left unchanged
+        """
+        own_floor = self.min_count_if_full()
+        other_floor = other.min_count_if_full()
+        merged = []
+        for word in self.counts.keys() | other.counts.keys():
+            count = self.counts.get(word, own_floor) + other.counts.get(word, other_floor)
+            error = self.errors.get(word, own_floor) + other.errors.get(word, other_floor)
+            merged.append((word, count, error))
+        merged.sort(key=lambda x: (-x[1], x[0]))
+        
+        self.counts.clear()
+        self.errors.clear()
+        self._buckets = _CountBuckets()
+        for word, count, error in merged[:self.capacity]:
+            self.counts[word] = count
+            self.errors[word] = error
+            self._buckets.insert(word, count)
+        self.total += other.total
+    
+    def min_count_if_full(self) -> int:
+        """Return the smallest monitored count if the summary is full, otherwise 0."""
+        return self._buckets.min_count() if len(self.counts) >= self.capacity else 0
+
+
+class ApproximateWordCounter(WordCounter):
+    """
+    A WordCounter whose memory is fixed by a capacity instead of the vocabulary size.
+    
+    Counts are tracked with a Space-Saving summary, so only the ``capacity`` most
+    frequent words are monitored and their counts may be overestimated. Use it when the
+    vocabulary is too large to keep every distinct word in memory.
+    
+    Attributes:
+        sketch (SpaceSaving): The heavy-hitters summary holding the counts
+        word_counts (dict): Estimated counts of the monitored words
+        n (int): Number of top frequent words to track
+    """
+    
+    def __init__(self, n=10, capacity=1000):
+        """
+        Initialize the ApproximateWordCounter.
+        
+        Args:
+            n (int): Number of top frequent words to track (default: 10)
+            capacity (int): Number of distinct words to monitor (default: 1000). Must
+                be at least n for the top words to be meaningful.
+                
+        Raises:
+            ValueError: If capacity is not a positive integer
+        """
+        super().__init__(n)
+        self.sketch = SpaceSaving(capacity)
+        self.word_counts = self.sketch.counts
+    
+    def _add(self, word: str, count: int = 1) -> None:
+        self.sketch.add(word, count)
+    
+    def get_top_words(self, n: int = None) -> list:
+        """
+        Get the top n most frequently used words with error bounds.
+        
+        Args:
+            n (int, optional): Number of top words to return. Defaults to the n set in __init__.
+            
+        Returns:
+            list: List of (word, count, error) tuples sorted by count (descending), then
+            alphabetically. The true count of each word lies in [count - error, count].
+        """
+        return self.sketch.top(n if n is not None else self.n)
+    
+    def merge(self, other: "ApproximateWordCounter") -> "ApproximateWordCounter":
+        """
+        Merge the summary of another ApproximateWordCounter into this one.
+        
+        Args:
+            other (ApproximateWordCounter): The counter to merge in; it is left unchanged
+            
+        Returns:
+            ApproximateWordCounter: This counter, to allow chaining
+            
+        Raises:
+            TypeError: If other is not an ApproximateWordCounter
+        """
+        if type(other) is not type(self):
+            raise TypeError(f"Cannot merge {type(other).__name__} into {type(self).__name__}")
+        self.sketch.merge(other.sketch)
+        return self
+    
+    def _empty_like(self) -> "ApproximateWordCounter":
+        return type(self)(self.n, self.sketch.capacity)
+
+
+class _CompactVocabulary:
+    """
+    Interned word table stored in a few flat arrays instead of one object per word.
+    
+    Words are appended as UTF-8 to a single bytes arena and addressed by id through an
+    offsets array; counts live in an array('Q') indexed by the same id. Lookups use an
+    open-addressing hash table of ids (array('I'), linear probing), so no per-word
+    Python objects are kept alive.
+    
+    Attributes:
+        arena (bytearray): The UTF-8 bytes of every word, back to back
+        offsets (array): Start of each word in the arena, plus the end of the last word
+        counts (array): Count of each word, indexed by word id
+    """
+    
+    _EMPTY = 0xFFFFFFFF
+    
+    def __init__(self):
+        self.arena = bytearray()
+        self.offsets = array("Q", [0])
+        self.counts = array("Q")
+        self._table = array("I", [self._EMPTY]) * 8
+        self._mask = 7
+    
+    def __len__(self) -> int:
+        return len(self.counts)
+    
+    def word_bytes(self, word_id: int) -> bytes:
+        return bytes(self.arena[self.offsets[word_id]:self.offsets[word_id + 1]])
+    
+    def _slot(self, key: bytes) -> int:
+        """Return the table slot holding key, or the empty slot where it belongs."""
+        table, offsets, arena, mask = self._table, self.offsets, self.arena, self._mask
+        slot = hash(key) & mask
+        while True:
+            word_id = table[slot]
+            if word_id == self._EMPTY or arena[offsets[word_id]:offsets[word_id + 1]] == key:
+                return slot
+            slot = (slot + 1) & mask
+    
+    def find(self, key: bytes) -> int:
+        """Return the id of a word, or -1 if it has not been interned."""
+        word_id = self._table[self._slot(key)]
+        return -1 if word_id == self._EMPTY else word_id
+    
+    def add(self, key: bytes, count: int) -> None:
+        """Add count to a word, interning it first if it is new."""
+        slot = self._slot(key)
+        word_id = self._table[slot]
+        if word_id != self._EMPTY:
+            self.counts[word_id] += count
+            return
+        
+        word_id = len(self.counts)
+        self.arena += key
+        self.offsets.append(len(self.arena))
+        self.counts.append(count)
+        self._table[slot] = word_id
+        # Keep the load factor at or below 2/3 so probe sequences stay short
+        if 3 * len(self.counts) > 2 * len(self._table):
+            self._grow()
+    
+    def _grow(self) -> None:
+        self._table = array("I", [self._EMPTY]) * (2 * len(self._table))
+        self._mask = len(self._table) - 1
+        for word_id in range(len(self.counts)):
+            self._table[self._slot(self.word_bytes(word_id))] = word_id
+    
+    def top(self, n: int) -> list:
+        """
+        Get the ids of the n words with the highest counts, ties ordered alphabetically.
+        
+        The nth highest count is found first, then only the ids reaching it are ranked,
+        so the whole vocabulary is scanned with C-level iterators rather than sorted.
+        
+        Args:
+            n (int): Number of ids to return
+            
+        Returns:
+            list: Word ids sorted by count (descending), then alphabetically
+        """
+        if n <= 0 or not self.counts:
+            return []
+        counts = self.counts
+        threshold = nlargest(n, counts)[-1]
+        candidates = compress(range(len(counts)), map(threshold.__le__, counts))
+        return nsmallest(n, candidates, key=lambda i: (-counts[i], self.word_bytes(i)))
+
+
+class _CompactCounts(Mapping):
+    """Read-only dict-like view of a _CompactVocabulary, exposed as word_counts."""
+    
+    def __init__(self, vocabulary: _CompactVocabulary):
+        self._vocabulary = vocabulary
+    
+    def __getitem__(self, word: str) -> int:
+        word_id = self._vocabulary.find(word.encode("utf-8"))
+        if word_id < 0:
+            raise KeyError(word)
+        return self._vocabulary.counts[word_id]
+    
+    def __iter__(self):
+        for word_id in range(len(self._vocabulary)):
+            yield self._vocabulary.word_bytes(word_id).decode("utf-8")
+    
+    def __len__(self) -> int:
+        return len(self._vocabulary)
+
+
+class CompactWordCounter(WordCounter):
+    """
+    A WordCounter that stores its vocabulary compactly for very large vocabularies.
+    
+    Instead of a str key and an int value per word, words are interned into one bytes
+    arena with an offsets array and counts are kept in an array('Q'), which costs a few
+    tens of bytes per distinct word. The public API is unchanged; ``word_counts`` is a
+    read-only mapping over the compact store. Top words are found by scanning the
+    counts array on each call instead of through an incremental index.
+    
+    Attributes:
+        word_counts (Mapping): Read-only mapping of words to counts
+        n (int): Number of top frequent words to track
+    """
+    
+    def __init__(self, n=10):
+        """
+        Initialize the CompactWordCounter with a default of top 10 words.
+        
+        Args:
+            n (int): Number of top frequent words to track (default: 10)
+        """
+        super().__init__(n)
+        self._vocabulary = _CompactVocabulary()
+        self.word_counts = _CompactCounts(self._vocabulary)
+        self._index = None
+    
+    def _add(self, word: str, count: int = 1) -> None:
+        self._vocabulary.add(word.encode("utf-8"), count)
+    
+    def _saved_state(self) -> array:
+        # A copy of the counts array (8 bytes per word), indexed by word id
+        return array("Q", self._vocabulary.counts)
+    
+    def _counts_since(self, state: array) -> dict:
+        vocabulary = self._vocabulary
+        counts = vocabulary.counts
+        # Ids are assigned in order, so words interned after the save have ids >= len(state)
+        old = len(state)
+        delta = {}
+        for word_id in compress(range(old), map(int.__lt__, state, counts)):
+            delta[vocabulary.word_bytes(word_id).decode("utf-8")] = counts[word_id] - state[word_id]
+        for word_id in range(old, len(counts)):
+            delta[vocabulary.word_bytes(word_id).decode("utf-8")] = counts[word_id]
+        return delta
+    
+    def get_top_words(self, n: int = None) -> list:
+        """
+        Get the top n most frequently used words.
+        
+        Args:
+            n (int, optional): Number of top words to return. Defaults to the n set in __init__.
+            
+        Returns:
+            list: List of tuples containing (word, count) sorted by frequency (descending)
+        """
+        vocabulary = self._vocabulary
+        return [
+            (vocabulary.word_bytes(word_id).decode("utf-8"), vocabulary.counts[word_id])
+            for word_id in vocabulary.top(n if n is not None else self.n)
+        ]
+
+
+class WindowedWordCounter(WordCounter):
+    """
+    A WordCounter that only reflects the words seen within a sliding window.
+    
+    The window is split into a ring of buckets. New words are counted in the newest
+    bucket, and when the oldest bucket expires its counts are subtracted from the
+    totals instead of recounting the window. The window therefore slides in steps of
+    one bucket, and memory is bounded by the number of buckets times the vocabulary
+    active in each of them.
+    
+    The window is measured in seconds of the given clock, or in messages when clock is
+    None. In message mode every process_word or process_text call (including each chunk
+    of process_stream) counts as one message.
+    
+    Attributes:
+        word_counts (dict): Counts of the words within the window
+        n (int): Number of top frequent words to track
+        window (float): Length of the window in seconds or messages
+        bucket_span (float): Length of a single bucket in seconds or messages
+    """
+    
+    def __init__(self, n=10, window: float = 60, buckets: int = 6,
+                 clock: Optional[Callable[[], float]] = time.monotonic):
+        """
+        Initialize the WindowedWordCounter.
+        
+        Args:
+            n (int): Number of top frequent words to track (default: 10)
+            window (float): Length of the window in seconds, or in messages when clock
+                is None (default: 60)
+            buckets (int): Number of buckets the window is split into (default: 6)
+            clock (Callable[[], float], optional): Time source (default: time.monotonic).
+                Pass None to measure the window in messages.
+                
+        Raises:
+            ValueError: If window is not positive or buckets is less than 1
+        """
+        if window <= 0:
+            raise ValueError("Window must be positive")
+        if buckets < 1:
+            raise ValueError("Number of buckets must be at least 1")
+        super().__init__(n)
+        self.window = window
+        self.bucket_span = window / buckets
+        self._clock = clock
+        self._messages = 0
+        self._ring = deque(Counter() for _ in range(buckets))
+        self._bucket_end = self._now() + self.bucket_span
+    
+    def _now(self) -> float:
+        return self._clock() if self._clock is not None else self._messages
+    
+    def _advance(self) -> None:
+        """Expire every bucket that has fallen out of the window."""
+        now = self._now()
+        if now < self._bucket_end:
+            return
+        
+        steps = int((now - self._bucket_end) // self.bucket_span) + 1
+        if steps >= len(self._ring):
+            # The whole window has expired; start over instead of subtracting bucket by bucket
+            self.word_counts.clear()
+            self._index = _CountBuckets()
+            for bucket in self._ring:
+                bucket.clear()
+        else:
+            for _ in range(steps):
+                self._subtract(self._ring.popleft())
+                self._ring.append(Counter())
+        self._bucket_end += steps * self.bucket_span
+    
+    def _subtract(self, counts: Counter) -> None:
+        """Remove the counts of an expired bucket from the window totals."""
+        for word, count in counts.items():
+            old = self.word_counts[word]
+            if old == count:
+                del self.word_counts[word]
+            else:
+                self.word_counts[word] = old - count
+            self._index.move(word, old, old - count)
+    
+    def _add(self, word: str, count: int = 1) -> None:
+        super()._add(word, count)
+        self._ring[-1][word] += count
+    
+    def process_word(self, word: str) -> None:
+        self._advance()
+        super().process_word(word)
+        self._messages += 1
+    
+    def process_text(self, text: str) -> None:
+        self._advance()
+        super().process_text(text)
+        self._messages += 1
+    
+    def get_top_words(self, n: int = None) -> list:
+        """
+        Get the top n most frequently used words within the current window.
+        
+        Args:
+            n (int, optional): Number of top words to return. Defaults to the n set in __init__.
+            
+        Returns:
+            list: List of tuples containing (word, count) sorted by frequency (descending)
+        """
+        # In message mode the window only moves when a new message arrives
+        if self._clock is not None:
+            self._advance()
+        return super().get_top_words(n)
+    
+    def merge(self, other: "WordCounter") -> "WordCounter":
+        """
+        Windowed counters cannot be merged, because their buckets cover different times.
+        
+        Raises:
+            TypeError: Always
+        """
+        raise TypeError("WindowedWordCounter instances cannot be merged")
+
+
+# Snapshot layout (little-endian): file header, then one or more segments. Each segment
+# holds a segment header, the word offsets (n + 1 uint64), the counts (n uint64), the word
+# ids ranked by count (n uint64) and the sorted UTF-8 words, padded to 8 bytes.
+_SNAPSHOT_MAGIC = b"WCNT"
+_SNAPSHOT_VERSION = 1
+_SNAPSHOT_HEADER = struct.Struct("<4sI")
+_SEGMENT_MAGIC = b"WSEG"
+_SEGMENT_HEADER = struct.Struct("<4s4xQQ")
+
+
+def _encode_segment(word_counts: dict) -> bytes:
+    """Serialize word counts into one snapshot segment."""
+    words = sorted(word_counts)
+    encoded = [word.encode("utf-8") for word in words]
+    counts = array("Q", (word_counts[word] for word in words))
+    # Words are sorted, so ordering ids by (-count, id) orders ties alphabetically
+    ranks = array("Q", sorted(range(len(words)), key=lambda i: -counts[i]))
+    offsets = array("Q", [0])
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+    blob = b"".join(encoded)
+    blob += b"\0" * (-len(blob) % 8)
+    if sys.byteorder != "little":
+        for values in (offsets, counts, ranks):
+            values.byteswap()
+    return b"".join((
+        _SEGMENT_HEADER.pack(_SEGMENT_MAGIC, len(words), len(blob)),
+        offsets.tobytes(), counts.tobytes(), ranks.tobytes(), blob,
+    ))
+
+
+class _Segment:
+    """One segment of a snapshot, read through views of the mapped file."""
+    
+    def __init__(self, view: memoryview, start: int):
+        magic, size, blob_size = _SEGMENT_HEADER.unpack_from(view, start)
+        if magic != _SEGMENT_MAGIC:
+            raise ValueError("Corrupt snapshot segment")
+        start += _SEGMENT_HEADER.size
+        self.size = size
+        self.end = start + 8 * (3 * size + 1) + blob_size
+        if self.end > len(view):
+            raise ValueError("Truncated snapshot segment")
+        self.offsets = _uint64_view(view[start:start + 8 * (size + 1)])
+        start += 8 * (size + 1)
+        self.counts = _uint64_view(view[start:start + 8 * size])
+        start += 8 * size
+        self.ranks = _uint64_view(view[start:start + 8 * size])
+        self.blob = view[start + 8 * size:self.end]
+    
+    def word_bytes(self, i: int) -> bytes:
+        return bytes(self.blob[self.offsets[i]:self.offsets[i + 1]])
+    
+    def items(self):
+        """Iterate over (word bytes, count) pairs in sorted order."""
+        for i in range(self.size):
+            yield self.word_bytes(i), self.counts[i]
+    
+    def find(self, key: bytes) -> int:
+        """Binary search the sorted words for key; return its id or -1."""
+        lo, hi = 0, self.size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.word_bytes(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo if lo < self.size and self.word_bytes(lo) == key else -1
+    
+    def release(self) -> None:
+        for view in (self.offsets, self.counts, self.ranks, self.blob):
+            if isinstance(view, memoryview):
+                view.release()
+
+
+def _uint64_view(view: memoryview):
+    """View little-endian uint64 data without copying it where the platform allows."""
+    if sys.byteorder == "little":
+        return view.cast("Q")
+    values = array("Q", view)
+    values.byteswap()
+    return values
+
+
+class WordCountSnapshot:
+    """
+    A read-only, memory-mapped view of word counts saved with WordCounter.save.
+    
+    Opening a snapshot only maps the file, so it is close to instant whatever its size.
+    Lookups binary search the sorted word table and top-n queries read the precomputed
+    ranking, both straight from the mapped file. A snapshot with appended segments is
+    queried as the sum of its segments; top-n queries then use the threshold algorithm
+    over the per-segment rankings, which stays exact but reads more of the file.
+    
+    Attributes:
+        path (str): Path of the snapshot file
+    """
+    
+    def __init__(self, path: str):
+        """
+        Map a snapshot file.
+        
+        Args:
+            path (str): Path of the snapshot file
+            
+        Raises:
+            ValueError: If the file is not a valid snapshot
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            self._mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mapped)
+        self._segments = []
+        try:
+            magic, version = _SNAPSHOT_HEADER.unpack_from(self._view, 0)
+            if magic != _SNAPSHOT_MAGIC or version != _SNAPSHOT_VERSION:
+                raise ValueError(f"{path} is not a word count snapshot")
+            start = _SNAPSHOT_HEADER.size
+            while start < len(self._view):
+                segment = _Segment(self._view, start)
+                self._segments.append(segment)
+                start = segment.end
+        except (ValueError, struct.error):
+            self.close()
+            raise
+    
+    def get(self, word: str, default: int = 0) -> int:
+        """
+        Get the count of a word.
+        
+        Args:
+            word (str): The normalized (lowercase) word to look up
+            default (int): Value returned when the word is absent (default: 0)
+            
+        Returns:
+            int: The count of the word, summed over all segments
+        """
+        key = word.encode("utf-8")
+        total = 0
+        found = False
+        for segment in self._segments:
+            i = segment.find(key)
+            if i >= 0:
+                total += segment.counts[i]
+                found = True
+        return total if found else default
+    
+    def __contains__(self, word: str) -> bool:
+        return self.get(word, None) is not None
+    
+    def items(self):
+        """
+        Iterate over (word, count) pairs in alphabetical order.
+        
+        Returns:
+            Iterator[Tuple[str, int]]: Each word once, with its counts summed over all segments
+        """
+        current, total = None, 0
+        streams = [segment.items() for segment in self._segments]
+        for key, count in heap_merge(*streams, key=lambda item: item[0]):
+            if key != current:
+                if current is not None:
+                    yield current.decode("utf-8"), total
+                current, total = key, 0
+            total += count
+        if current is not None:
+            yield current.decode("utf-8"), total
+    
+    def get_top_words(self, n: int = 10) -> list:
+        """
+        Get the top n most frequently used words.
+        
+        Args:
+            n (int): Number of top words to return (default: 10)
+            
+        Returns:
+            list: List of tuples containing (word, count) sorted by frequency (descending),
+            then alphabetically
+        """
+        if n <= 0 or not self._segments:
+            return []
+        if len(self._segments) == 1:
+            segment = self._segments[0]
+            return [
+                (segment.word_bytes(i).decode("utf-8"), segment.counts[i])
+                for i in (segment.ranks[rank] for rank in range(min(n, segment.size)))
+            ]
+        
+        # Threshold algorithm: read every ranking in step; a word not seen yet cannot
+        # total more than the sum of the counts at the current depth
+        totals = {}
+        best = []  # min-heap of the n largest totals seen so far
+        for depth in range(max(segment.size for segment in self._segments)):
+            threshold = 0
+            for segment in self._segments:
+                if depth >= segment.size:
+                    continue
+                i = segment.ranks[depth]
+                threshold += segment.counts[i]
+                word = segment.word_bytes(i).decode("utf-8")
+                if word not in totals:
+                    total = totals[word] = self.get(word)
+                    if len(best) < n:
+                        heappush(best, total)
+                    elif total > best[0]:
+                        heapreplace(best, total)
+            if len(best) == n and best[0] > threshold:
+                break
+        return sorted(totals.items(), key=lambda x: (-x[1], x[0]))[:n]
+    
+    def to_counter(self, n: int = 10) -> WordCounter:
+        """
+        Load the snapshot into a mutable WordCounter.
+        
+        Args:
+            n (int): Number of top frequent words the counter tracks (default: 10)
+            
+        Returns:
+            WordCounter: A counter holding the snapshot's counts. It counts as saved to
+            this snapshot's path, so save(path, append=True) appends only the counts
+            added after loading.
+        """
+        counter = WordCounter(n)
+        for word, count in self.items():
+            counter._add(word, count)
+        counter._saved[os.path.abspath(self.path)] = counter._saved_state()
+        return counter
+    
+    def close(self) -> None:
+        """Release the views and unmap the file."""
+        for segment in self._segments:
+            segment.release()
+        self._segments = []
+        self._view.release()
+        self._mapped.close()
+    
+    def __enter__(self) -> "WordCountSnapshot":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+# ASCII whitespace never occurs inside a multi-byte UTF-8 character or a word
+_SHARD_BOUNDARY_BYTES = re.compile(rb"[ \t\n\r\f\v]")
+_SHARD_BOUNDARY_CHARS = re.compile(r"\s")
+
+
+def _count_file_range(path: str, start: int, end: int, encoding: str) -> dict:
+    """Count the words in bytes [start, end) of a file (runs in a worker process)."""
+    counter = WordCounter()
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        chunk_size = 1 << 20
+        counter.process_stream(
+            (mapped[i:min(i + chunk_size, end)] for i in range(start, end, chunk_size)),
+            encoding,
+        )
+    return counter.word_counts
+
+
+def _count_text(text: str) -> dict:
+    """Count the words in a shard of text (runs in a worker process)."""
+    return count_words(text)
+
+
+def _shard_bounds(length: int, shards: int, find_boundary) -> list:
+    """
+    Split [0, length) into up to shards ranges that end on safe word boundaries.
+    
+    Args:
+        length (int): Total length of the input
+        shards (int): Desired number of ranges
+        find_boundary (callable): Returns the first boundary position at or after an offset
+        
+    Returns:
+        list: List of (start, end) tuples covering the input without gaps
+    """
+    bounds = []
+    start = 0
+    for i in range(1, shards + 1):
+        end = length if i == shards else max(start, find_boundary(length * i // shards))
+        if end > start:
+            bounds.append((start, end))
+            start = end
+    return bounds
+
+
+def _reduce_counts(partials, n: int) -> WordCounter:
+    """Combine the word_counts dicts returned by the workers into one WordCounter."""
+    counter = WordCounter(n)
+    for partial in partials:
+        for word, count in partial.items():
+            counter._add(word, count)
+    return counter
+
+
+def _shard_count(length: int, workers: int, min_shard_size: int) -> int:
+    """Number of shards to split an input into: one per worker, but none below min_shard_size."""
+    if min_shard_size < 1:
+        raise ValueError("Minimum shard size must be a positive integer")
+    return max(1, min(workers, length // min_shard_size))
+
+
+def count_file_parallel(path: str, n: int = 10, workers: int = None, encoding: str = "utf-8",
+                        min_shard_size: int = 1 << 20) -> WordCounter:
+    """
+    Count the words of a large file using one worker process per shard.
+    
+    The file is split on ASCII whitespace, so every shard holds whole words and the
+    result is identical to processing the whole file in one process. The encoding must
+    keep ASCII whitespace bytes out of multi-byte characters (e.g. UTF-8 or Latin-1).
+    With a single worker, or a file too small for more than one shard, the file is
+    counted in the calling process without starting a pool.
+    
+    Args:
+        path (str): Path of the file to count
+        n (int): Number of top frequent words the returned counter tracks (default: 10)
+        workers (int, optional): Number of worker processes. Defaults to the CPU count.
+        encoding (str): Encoding of the file (default: "utf-8")
+        min_shard_size (int): Smallest shard worth a worker process, in bytes
+            (default: 1 MiB)
+        
+    Returns:
+        WordCounter: A counter holding the combined counts
+        
+    Raises:
+        ValueError: If min_shard_size is not positive
+    """
+    workers = workers or os.cpu_count() or 1
+    size = os.path.getsize(path)
+    shards = _shard_count(size, workers, min_shard_size)
+    if shards == 1:
+        counter = WordCounter(n)
+        if size:
+            counter.process_file(path, encoding)
+        return counter
+    
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        def find_boundary(offset):
+            match = _SHARD_BOUNDARY_BYTES.search(mapped, offset)
+            return match.end() if match else size
+        bounds = _shard_bounds(size, shards, find_boundary)
+    if len(bounds) == 1:
+        counter = WordCounter(n)
+        counter.process_file(path, encoding)
+        return counter
+    
+    with ProcessPoolExecutor(max_workers=len(bounds)) as pool:
+        futures = [pool.submit(_count_file_range, path, start, end, encoding) for start, end in bounds]
+        return _reduce_counts((future.result() for future in futures), n)
+
+
+def count_text_parallel(text: str, n: int = 10, workers: int = None,
+                        min_shard_size: int = 1 << 20) -> WordCounter:
+    """
+    Count the words of a large string using one worker process per shard.
+    
+    The text is split on whitespace, so the result is identical to a single
+    process_text call on the whole string. With a single worker, or a text too short
+    for more than one shard, it is counted in the calling process without a pool.
+    
+    Args:
+        text (str): The text to count
+        n (int): Number of top frequent words the returned counter tracks (default: 10)
+        workers (int, optional): Number of worker processes. Defaults to the CPU count.
+        min_shard_size (int): Smallest shard worth a worker process, in characters
+            (default: 1 Mi characters)
+        
+    Returns:
+        WordCounter: A counter holding the combined counts
+        
+    Raises:
+        ValueError: If min_shard_size is not positive
+    """
+    workers = workers or os.cpu_count() or 1
+    shards = _shard_count(len(text), workers, min_shard_size)
+    bounds = [(0, len(text))]
+    if shards > 1:
+        def find_boundary(offset):
+            match = _SHARD_BOUNDARY_CHARS.search(text, offset)
+            return match.end() if match else len(text)
+        bounds = _shard_bounds(len(text), shards, find_boundary)
+    if len(bounds) == 1:
+        counter = WordCounter(n)
+        counter.process_text(text)
+        return counter
+    
+    with ProcessPoolExecutor(max_workers=len(bounds)) as pool:
+        futures = [pool.submit(_count_text, text[start:end]) for start, end in bounds]
+        return _reduce_counts((future.result() for future in futures), n)
 
 
 def main():
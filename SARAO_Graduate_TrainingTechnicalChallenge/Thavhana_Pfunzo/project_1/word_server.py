@@ -0,0 +1,426 @@
+"""
+Asyncio service that feeds a WordCounter from many producers over TCP or Unix sockets.
+
+The protocol is line based and UTF-8 encoded:
+
+    TEXT <text>    Queue text for counting (no reply)
+    TOP <n>        Reply with a JSON list of [word, count] pairs
+    FLUSH          Reply "OK" once all text queued so far has been counted
+
+Every command except TEXT gets exactly one reply line, and malformed ones get an
+"ERROR <reason>" reply while the connection stays open. TEXT lines longer than the
+server's line_limit are dropped and reported by the next FLUSH, which then replies
+"ERROR line too long (<count> TEXT lines dropped)" instead of "OK".
+
+Run a server and a load generator from the Thavhana_Pfunzo directory, for example:
+
+    python -m project_1.word_server serve --port 8765
+    python -m project_1.word_server load --port 8765 --producers 8 --messages 20000
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from typing import Optional, Tuple
+
+try:
+    from .word_counter import WordCounter
+except ImportError:
+    from word_counter import WordCounter
+
+
+class WordCountServer:
+    """
+    Accepts text from many clients on one event loop and batches it into a WordCounter.
+
+    Each client connection is a coroutine, so no thread is needed per client. Incoming
+    text goes through a bounded queue: when counting falls behind, client handlers wait
+    on the queue and stop reading their sockets, which pushes back on the producers via
+    TCP flow control. A single ingestion task joins queued chunks into batches of up to
+    batch_bytes and passes them to process_text, yielding to the loop between batches
+    so TOP queries are answered from the counter's index without waiting for the queue
+    to drain.
+
+    Attributes:
+        counter (WordCounter): The counter being fed
+        batch_bytes (int): Maximum size of the text passed to one process_text call
+        max_pending (int): Maximum number of queued chunks before producers are paused
+        line_limit (int): Longest command line accepted, in bytes
+    """
+
+    def __init__(self, counter: Optional[WordCounter] = None, batch_bytes: int = 1 << 16,
+                 max_pending: int = 1024, line_limit: Optional[int] = None):
+        """
+        Initialize the WordCountServer.
+
+        Args:
+            counter (WordCounter, optional): The counter to feed. Defaults to a new WordCounter.
+            batch_bytes (int): Maximum size of one ingestion batch (default: 64 KiB)
+            max_pending (int): Maximum number of queued chunks (default: 1024)
+            line_limit (int, optional): Longest command line accepted, in bytes. Defaults
+                to four times batch_bytes but at least 64 KiB, and is never less than
+                batch_bytes.
+        """
+        self.counter = counter if counter is not None else WordCounter()
+        self.batch_bytes = batch_bytes
+        self.max_pending = max_pending
+        if line_limit is None:
+            line_limit = max(4 * batch_bytes, 1 << 16)
+        self.line_limit = max(line_limit, batch_bytes)
+        self._queue = None
+        self._ingest_task = None
+        self._servers = []
+        self._clients = set()
+
+    async def start_tcp(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.AbstractServer:
+        """
+        Start listening on a TCP port.
+
+        Args:
+            host (str): Interface to bind (default: "127.0.0.1")
+            port (int): Port to bind; 0 picks a free port (default: 0)
+
+        Returns:
+            asyncio.AbstractServer: The listening server, e.g. to read the bound port
+        """
+        self._start_ingestion()
+        server = await asyncio.start_server(self._handle_client, host, port, limit=self.line_limit)
+        self._servers.append(server)
+        return server
+
+    async def start_unix(self, path: str) -> asyncio.AbstractServer:
+        """
+        Start listening on a Unix domain socket.
+
+        Args:
+            path (str): Filesystem path of the socket
+
+        Returns:
+            asyncio.AbstractServer: The listening server
+        """
+        self._start_ingestion()
+        server = await asyncio.start_unix_server(self._handle_client, path, limit=self.line_limit)
+        self._servers.append(server)
+        return server
+
+    async def close(self) -> None:
+        """Stop accepting clients, disconnect them, count the text still queued and stop ingestion."""
+        for server in self._servers:
+            server.close()
+        # wait_closed also waits for open connections (Python 3.12+), so close them first
+        for writer in list(self._clients):
+            writer.close()
+        for server in self._servers:
+            await server.wait_closed()
+        self._servers = []
+        if self._ingest_task is not None:
+            await self._queue.join()
+            self._ingest_task.cancel()
+            try:
+                await self._ingest_task
+            except asyncio.CancelledError:
+                pass
+            self._ingest_task = None
+
+    def _start_ingestion(self) -> None:
+        if self._ingest_task is None:
+            self._queue = asyncio.Queue(self.max_pending)
+            self._ingest_task = asyncio.get_running_loop().create_task(self._ingest())
+
+    async def _ingest(self) -> None:
+        """Drain the queue in batches and count them."""
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            size = len(batch[0])
+            while size < self.batch_bytes and not queue.empty():
+                batch.append(queue.get_nowait())
+                size += len(batch[-1])
+            try:
+                self.counter.process_text("\n".join(batch))
+            finally:
+                for _ in batch:
+                    queue.task_done()
+            # Let client handlers answer queries before the next batch
+            await asyncio.sleep(0)
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._clients.add(writer)
+        # Overlong TEXT lines since the last FLUSH; TEXT has no reply of its own to report them
+        dropped = 0
+        try:
+            while True:
+                line, complete = await self._read_line(reader)
+                if not line:
+                    break
+                command, _, argument = line.rstrip(b"\r\n").partition(b" ")
+                if not complete:
+                    if command == b"TEXT":
+                        dropped += 1
+                    else:
+                        writer.write(b"ERROR line too long\n")
+                        await writer.drain()
+                elif command == b"TEXT":
+                    await self._queue.put(argument.decode("utf-8", errors="replace"))
+                elif command == b"TOP":
+                    try:
+                        n = int(argument) if argument else None
+                    except ValueError:
+                        writer.write(b"ERROR invalid count\n")
+                    else:
+                        writer.write(json.dumps(self.counter.get_top_words(n)).encode() + b"\n")
+                    await writer.drain()
+                elif command == b"FLUSH":
+                    await self._queue.join()
+                    if dropped:
+                        writer.write(b"ERROR line too long (%d TEXT lines dropped)\n" % dropped)
+                        dropped = 0
+                    else:
+                        writer.write(b"OK\n")
+                    await writer.drain()
+                else:
+                    writer.write(b"ERROR unknown command\n")
+                    await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._clients.discard(writer)
+            writer.close()
+
+    @staticmethod
+    async def _read_line(reader: asyncio.StreamReader) -> Tuple[bytes, bool]:
+        """
+        Read one command line, or b"" at the end of the stream.
+
+        A line longer than the stream limit is read and discarded up to its newline,
+        so the next command is parsed from the start of a line. Only its first part
+        is returned then, which still holds the command.
+
+        Returns:
+            tuple: The line and whether it is complete
+        """
+        start = None
+        while True:
+            try:
+                line = await reader.readuntil(b"\n")
+            except asyncio.IncompleteReadError as error:
+                # The stream ended, possibly after a last line without a newline
+                line = error.partial
+            except asyncio.LimitOverrunError as error:
+                discarded = await reader.readexactly(error.consumed)
+                if start is None:
+                    start = discarded
+                continue
+            return (line, True) if start is None else (start, False)
+
+
+class WordCountClient:
+    """
+    Minimal asyncio client for a WordCountServer.
+
+    Attributes:
+        reader (asyncio.StreamReader): Stream the replies are read from
+        writer (asyncio.StreamWriter): Stream the commands are written to
+        chunk_bytes (int): Longest text sent in one TEXT command; longer text is split
+            at spaces, so it must stay below the server's line_limit
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                 chunk_bytes: int = 1 << 15):
+        self.reader = reader
+        self.writer = writer
+        self.chunk_bytes = chunk_bytes
+
+    @classmethod
+    async def connect(cls, host: str = "127.0.0.1", port: int = 8765, path: str = None) -> "WordCountClient":
+        """
+        Connect over TCP, or over a Unix socket when path is given.
+
+        Args:
+            host (str): Server host (default: "127.0.0.1")
+            port (int): Server port (default: 8765)
+            path (str, optional): Unix socket path; overrides host and port
+
+        Returns:
+            WordCountClient: The connected client
+        """
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def send_text(self, text: str) -> None:
+        """Queue text for counting, waiting while the server applies backpressure."""
+        # Newlines end a command; they separate words just like spaces do
+        data = text.replace("\n", " ").encode("utf-8")
+        while len(data) > self.chunk_bytes:
+            # Split at the last space that fits; a single longer word is sent whole,
+            # and the server drops it if it exceeds the line limit (see flush)
+            cut = data.rfind(b" ", 1, self.chunk_bytes + 1)
+            if cut < 0:
+                cut = data.find(b" ", 1)
+                if cut < 0:
+                    break
+            self.writer.write(b"TEXT " + data[:cut] + b"\n")
+            data = data[cut:]
+        self.writer.write(b"TEXT " + data + b"\n")
+        await self.writer.drain()
+
+    async def top(self, n: int = 10) -> list:
+        """
+        Return the server's current top n words as (word, count) tuples.
+
+        Raises:
+            RuntimeError: If the server replies with an error
+            ConnectionError: If the connection closes before the reply
+        """
+        self.writer.write(b"TOP %d\n" % n)
+        await self.writer.drain()
+        return [tuple(pair) for pair in json.loads(await self._reply())]
+
+    async def flush(self) -> None:
+        """
+        Wait until all text queued so far has been counted.
+
+        Raises:
+            RuntimeError: If the server does not confirm with OK, for example because
+                TEXT lines sent since the last flush were too long and were dropped
+            ConnectionError: If the connection closes before the reply
+        """
+        self.writer.write(b"FLUSH\n")
+        await self.writer.drain()
+        reply = await self._reply()
+        if reply != b"OK\n":
+            raise RuntimeError(f"Unexpected reply to FLUSH: {reply!r}")
+
+    async def _reply(self) -> bytes:
+        """Read one reply line, raising on errors and on a closed connection."""
+        reply = await self.reader.readline()
+        if not reply:
+            raise ConnectionError("Server closed the connection")
+        if reply.startswith(b"ERROR"):
+            raise RuntimeError(reply[len(b"ERROR"):].strip().decode("utf-8", errors="replace"))
+        return reply
+
+    async def close(self) -> None:
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+async def run_load(host: str = "127.0.0.1", port: int = 8765, path: str = None, producers: int = 8,
+                   messages: int = 10000, words_per_message: int = 20, query_clients: int = 1,
+                   seed: int = 0) -> dict:
+    """
+    Drive a WordCountServer with concurrent producers while timing TOP queries.
+
+    Args:
+        host (str): Server host (default: "127.0.0.1")
+        port (int): Server port (default: 8765)
+        path (str, optional): Unix socket path; overrides host and port
+        producers (int): Number of concurrent producer connections (default: 8)
+        messages (int): Messages sent by each producer (default: 10000)
+        words_per_message (int): Words in each message (default: 20)
+        query_clients (int): Connections issuing TOP 10 queries in a loop (default: 1)
+        seed (int): Random seed for the generated text (default: 0)
+
+    Returns:
+        dict: Ingestion throughput and query latency percentiles
+    """
+    rng = random.Random(seed)
+    vocabulary = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(2, 9)))
+                  for _ in range(5000)]
+    weights = [1 / rank for rank in range(1, len(vocabulary) + 1)]
+    corpus = [" ".join(rng.choices(vocabulary, weights, k=words_per_message)) for _ in range(1000)]
+
+    async def produce(offset):
+        client = await WordCountClient.connect(host, port, path)
+        for i in range(messages):
+            await client.send_text(corpus[(offset + i) % len(corpus)])
+        await client.flush()
+        await client.close()
+
+    latencies = []
+    done = asyncio.Event()
+
+    async def query():
+        client = await WordCountClient.connect(host, port, path)
+        while not done.is_set():
+            start = time.perf_counter()
+            await client.top(10)
+            latencies.append(time.perf_counter() - start)
+        await client.close()
+
+    queries = [asyncio.ensure_future(query()) for _ in range(query_clients)]
+    start = time.perf_counter()
+    await asyncio.gather(*(produce(i * 97) for i in range(producers)))
+    elapsed = time.perf_counter() - start
+    done.set()
+    await asyncio.gather(*queries)
+
+    latencies.sort()
+    total_messages = producers * messages
+
+    def percentile(p):
+        return latencies[min(len(latencies) - 1, int(p * len(latencies)))] if latencies else float("nan")
+
+    return {
+        "messages": total_messages,
+        "seconds": elapsed,
+        "messages_per_second": total_messages / elapsed,
+        "words_per_second": total_messages * words_per_message / elapsed,
+        "queries": len(latencies),
+        "query_p50_ms": percentile(0.50) * 1000,
+        "query_p99_ms": percentile(0.99) * 1000,
+    }
+
+
+async def _serve(args) -> None:
+    server = WordCountServer(batch_bytes=args.batch_bytes, max_pending=args.max_pending,
+                             line_limit=args.line_limit)
+    if args.unix:
+        await server.start_unix(args.unix)
+        print(f"Listening on {args.unix}")
+    else:
+        await server.start_tcp(args.host, args.port)
+        print(f"Listening on {args.host}:{args.port}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WordCounter ingestion server")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for name in ("serve", "load"):
+        sub = subparsers.add_parser(name)
+        sub.add_argument("--host", default="127.0.0.1")
+        sub.add_argument("--port", type=int, default=8765)
+        sub.add_argument("--unix", help="Use a Unix socket at this path instead of TCP")
+        if name == "serve":
+            sub.add_argument("--batch-bytes", type=int, default=1 << 16)
+            sub.add_argument("--max-pending", type=int, default=1024)
+            sub.add_argument("--line-limit", type=int, help="Longest command line in bytes")
+        else:
+            sub.add_argument("--producers", type=int, default=8)
+            sub.add_argument("--messages", type=int, default=10000)
+            sub.add_argument("--words", type=int, default=20)
+            sub.add_argument("--query-clients", type=int, default=1)
+
+    args = parser.parse_args()
+    if args.command == "serve":
+        try:
+            asyncio.run(_serve(args))
+        except KeyboardInterrupt:
+            pass
+    else:
+        results = asyncio.run(run_load(args.host, args.port, args.unix, args.producers,
+                                       args.messages, args.words, args.query_clients))
+        for key, value in results.items():
+            print(f"{key:>20}: {value:,.2f}" if isinstance(value, float) else f"{key:>20}: {value:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,329 @@
+"""
+Benchmarks for the weighted average filter.
+
+Run from the Thavhana_Pfunzo directory, for example:
+
+    python -m project_2.benchmarks crossover
+    python -m project_2.benchmarks process --windows 3 32 1024
+    python -m project_2.benchmarks parallel --samples 50000000 --window 256
+    python -m project_2.benchmarks suite --output results.json --baseline baseline.json
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from collections import deque
+
+import numpy as np
+
+try:
+    from .weighted_average import WeightedAverage, choose_convolution_method
+except ImportError:
+    from weighted_average import WeightedAverage, choose_convolution_method
+
+
+def _best_time(function, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+class LegacyWeightedAverage:
+    """The original deque-based per-sample filter, kept as the benchmark reference."""
+
+    def __init__(self, w):
+        self.weights = w
+        self.window_size = len(w)
+        self.buffer = deque([0.0] * self.window_size, maxlen=self.window_size)
+
+    def process(self, x):
+        self.buffer.appendleft(x)
+        return sum(w * x for w, x in zip(self.weights, self.buffer)) / self.window_size
+
+
+def bench_process(windows=(3, 8, 16, 32, 128, 1024), samples: int = 20000, repeats: int = 3) -> None:
+    """
+    Time per-sample process() calls of the original deque filter and WeightedAverage.
+
+    Random weights are used so the running-sum shortcut does not apply and the ring
+    buffer's weighted sum is what gets measured.
+
+    Args:
+        windows (tuple): Window lengths to try
+        samples (int): Number of process() calls per timed run (default: 20000)
+        repeats (int): Number of timed runs per case; the best is reported (default: 3)
+    """
+    rng = np.random.default_rng(0)
+    signal = rng.normal(size=samples).tolist()
+    print(f"{'window':>8} {'deque ns/sample':>16} {'ring ns/sample':>15} {'speedup':>8}")
+    for window in windows:
+        weights = rng.normal(size=window).tolist()
+        timings = []
+        for cls in (LegacyWeightedAverage, WeightedAverage):
+            def run():
+                process = cls(weights).process
+                for x in signal:
+                    process(x)
+            timings.append(_best_time(run, repeats) / samples * 1e9)
+        print(f"{window:8d} {timings[0]:16.1f} {timings[1]:15.1f} {timings[0] / timings[1]:8.2f}")
+
+
+def bench_crossover(windows=(16, 64, 256, 1024, 4096, 16384, 65536, 100000),
+                    blocks=(256, 4096, 65536), repeats: int = 3) -> None:
+    """
+    Time direct and FFT block convolution to show where the automatic switch lands.
+
+    Args:
+        windows (tuple): Window lengths to try
+        blocks (tuple): Block sizes passed to process_batch
+        repeats (int): Number of timed runs per case; the best is reported (default: 3)
+    """
+    rng = np.random.default_rng(0)
+    print(f"{'window':>8} {'block':>8} {'direct ns/sample':>17} {'fft ns/sample':>14} "
+          f"{'faster':>7} {'auto':>7}")
+    for window in windows:
+        weights = list(rng.normal(size=window))
+        for block in blocks:
+            signal = rng.normal(size=block)
+            timings = {}
+            for method in ("direct", "fft"):
+                wa = WeightedAverage(weights)
+                wa.process_batch(signal, method)  # Warm up (FFT length and kernel spectrum)
+                timings[method] = _best_time(lambda: wa.process_batch(signal, method), repeats) / block * 1e9
+            faster = min(timings, key=timings.get)
+            auto = choose_convolution_method(window, block, WeightedAverage.FFT_MIN_WINDOW,
+                                             WeightedAverage.FFT_COST_FACTOR)
+            print(f"{window:8d} {block:8d} {timings['direct']:17.1f} {timings['fft']:14.1f} "
+                  f"{faster:>7} {auto:>7}")
+
+
+def bench_parallel(samples: int = 20000000, window: int = 256, workers_list=None, repeats: int = 3) -> None:
+    """
+    Compare process_batch with process_parallel on one long signal.
+
+    Args:
+        samples (int): Length of the signal (default: 20M samples)
+        window (int): Number of weights (default: 256)
+        workers_list (list, optional): Worker counts to try. Defaults to powers of two
+            up to the CPU count.
+        repeats (int): Number of timed runs per case; the best is reported (default: 3)
+    """
+    cpus = os.cpu_count() or 1
+    if workers_list is None:
+        workers_list = [1]
+        while workers_list[-1] * 2 <= cpus:
+            workers_list.append(workers_list[-1] * 2)
+
+    rng = np.random.default_rng(0)
+    weights = list(rng.normal(size=window))
+    signal = rng.normal(size=samples)
+    expected = WeightedAverage(weights).process_batch(signal, "direct")
+    serial = _best_time(lambda: WeightedAverage(weights).process_batch(signal, "direct"), repeats)
+    print(f"Signal: {samples} samples, window {window}")
+    print(f"{'workers':>8} {'seconds':>10} {'Msamples/s':>11} {'speedup':>8}")
+    print(f"{'serial':>8} {serial:10.3f} {samples / serial / 1e6:11.1f} {1.0:8.2f}")
+    for workers in workers_list:
+        result = WeightedAverage(weights).process_parallel(signal, workers)
+        assert np.array_equal(result, expected)
+        elapsed = _best_time(lambda: WeightedAverage(weights).process_parallel(signal, workers), repeats)
+        print(f"{workers:8d} {elapsed:10.3f} {samples / elapsed / 1e6:11.1f} {serial / elapsed:8.2f}")
+
+
+WEIGHT_FAMILIES = {
+    "uniform": lambda window, rng: [1.0] * window,
+    "ramp": lambda window, rng: [float(window - k) for k in range(window)],
+    "random": lambda window, rng: rng.normal(size=window).tolist(),
+}
+SUITE_WINDOWS = (5, 50, 500, 5000, 100000)
+SUITE_BLOCKS = (1024, 65536)
+
+
+def _measure(function, samples: int, repeats: int) -> dict:
+    """Time function (which handles samples samples) and trace its peak NumPy/Python allocations."""
+    function()  # Warm up caches such as FFT kernel spectra
+    seconds = _best_time(function, repeats)
+    tracemalloc.start()
+    try:
+        function()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {
+        "samples_per_second": samples / seconds,
+        "ns_per_sample": seconds / samples * 1e9,
+        "peak_memory_bytes": peak,
+    }
+
+
+def run_suite(windows=SUITE_WINDOWS, blocks=SUITE_BLOCKS, families=tuple(WEIGHT_FAMILIES),
+              paths=("process", "batch"), process_samples: int = 2000, batch_samples: int = 262144,
+              repeats: int = 3) -> list:
+    """
+    Sweep window size, block size and weight family over the per-sample and batch paths.
+
+    Args:
+        windows (tuple): Window lengths to try
+        blocks (tuple): Block sizes for the batch path
+        families (tuple): Weight families, keys of WEIGHT_FAMILIES
+        paths (tuple): "process" (one process() call per sample) and/or "batch"
+            (process_batch over consecutive blocks)
+        process_samples (int): Samples fed to the per-sample path per run (default: 2000)
+        batch_samples (int): Samples fed to the batch path per run (default: 256 Ki)
+        repeats (int): Number of timed runs per case; the best is reported (default: 3)
+
+    Returns:
+        list: One dict per case with path, family, window, block, samples_per_second,
+        ns_per_sample and peak_memory_bytes (block is None for the per-sample path)
+    """
+    rng = np.random.default_rng(0)
+    signal = rng.normal(size=max(process_samples, batch_samples))
+    results = []
+    for family in families:
+        for window in windows:
+            weights = WEIGHT_FAMILIES[family](window, rng)
+            # Construction is left out of the timings; the filter state does not affect speed
+            wa = WeightedAverage(weights)
+            if "process" in paths:
+                values = signal[:process_samples].tolist()
+
+                def run():
+                    process = wa.process
+                    for x in values:
+                        process(x)
+                results.append({"path": "process", "family": family, "window": window, "block": None,
+                                **_measure(run, process_samples, repeats)})
+            if "batch" in paths:
+                for block in blocks:
+                    chunks = np.array_split(signal[:batch_samples], max(1, batch_samples // block))
+
+                    def run():
+                        for chunk in chunks:
+                            wa.process_batch(chunk)
+                    results.append({"path": "batch", "family": family, "window": window, "block": block,
+                                    **_measure(run, batch_samples, repeats)})
+    return results
+
+
+def _case_key(result: dict) -> tuple:
+    return result["path"], result["family"], result["window"], result["block"]
+
+
+def compare_results(results: list, baseline: list, threshold: float = 0.1) -> list:
+    """
+    Find cases whose throughput dropped by more than threshold against a baseline run.
+
+    Cases missing from either run are ignored.
+
+    Args:
+        results (list): Results of run_suite
+        baseline (list): Results of an earlier run_suite to compare against
+        threshold (float): Allowed relative drop in samples/sec (default: 0.1, i.e. 10%)
+
+    Returns:
+        list: One dict per regressed case with its key fields, the baseline and current
+        samples_per_second and the relative change
+    """
+    reference = {_case_key(result): result for result in baseline}
+    regressions = []
+    for result in results:
+        before = reference.get(_case_key(result))
+        if before is None:
+            continue
+        change = result["samples_per_second"] / before["samples_per_second"] - 1
+        if change < -threshold:
+            regressions.append({"path": result["path"], "family": result["family"],
+                                "window": result["window"], "block": result["block"],
+                                "baseline": before["samples_per_second"],
+                                "current": result["samples_per_second"], "change": change})
+    return regressions
+
+
+def bench_suite(args) -> int:
+    """Run the sweep, print and save it, and compare it with a baseline; returns the exit status."""
+    results = run_suite(args.windows, args.blocks, args.families, args.paths,
+                        args.process_samples, args.batch_samples, args.repeats)
+    print(f"{'path':>8} {'family':>8} {'window':>8} {'block':>7} {'samples/s':>14} "
+          f"{'ns/sample':>11} {'peak MiB':>9}")
+    for result in results:
+        block = "-" if result["block"] is None else result["block"]
+        print(f"{result['path']:>8} {result['family']:>8} {result['window']:8d} {block:>7} "
+              f"{result['samples_per_second']:14,.0f} {result['ns_per_sample']:11.1f} "
+              f"{result['peak_memory_bytes'] / 2**20:9.2f}")
+
+    if args.output:
+        report = {
+            "environment": {"python": platform.python_version(), "numpy": np.__version__,
+                            "machine": platform.machine(), "cpus": os.cpu_count()},
+            "results": results,
+        }
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare_results(results, baseline, args.threshold)
+        for regression in regressions:
+            block = "-" if regression["block"] is None else regression["block"]
+            print(f"REGRESSION {regression['path']} {regression['family']} window={regression['window']} "
+                  f"block={block}: {regression['baseline']:,.0f} -> {regression['current']:,.0f} "
+                  f"samples/s ({regression['change']:+.1%})")
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Weighted average benchmarks")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    crossover = subparsers.add_parser("crossover", help="Direct versus FFT block convolution")
+    crossover.add_argument("--windows", type=int, nargs="+",
+                           default=[16, 64, 256, 1024, 4096, 16384, 65536, 100000])
+    crossover.add_argument("--blocks", type=int, nargs="+", default=[256, 4096, 65536])
+    crossover.add_argument("--repeats", type=int, default=3)
+
+    process = subparsers.add_parser("process", help="Per-sample deque versus ring buffer")
+    process.add_argument("--windows", type=int, nargs="+", default=[3, 8, 16, 32, 128, 1024])
+    process.add_argument("--samples", type=int, default=20000)
+    process.add_argument("--repeats", type=int, default=3)
+
+    parallel = subparsers.add_parser("parallel", help="Multi-process chunked filtering speedup")
+    parallel.add_argument("--samples", type=int, default=20000000)
+    parallel.add_argument("--window", type=int, default=256)
+    parallel.add_argument("--workers", type=int, nargs="*")
+    parallel.add_argument("--repeats", type=int, default=3)
+
+    suite = subparsers.add_parser("suite", help="Sweep with JSON output and baseline comparison")
+    suite.add_argument("--windows", type=int, nargs="+", default=list(SUITE_WINDOWS))
+    suite.add_argument("--blocks", type=int, nargs="+", default=list(SUITE_BLOCKS))
+    suite.add_argument("--families", nargs="+", choices=sorted(WEIGHT_FAMILIES), default=list(WEIGHT_FAMILIES))
+    suite.add_argument("--paths", nargs="+", choices=["process", "batch"], default=["process", "batch"])
+    suite.add_argument("--process-samples", type=int, default=2000)
+    suite.add_argument("--batch-samples", type=int, default=262144)
+    suite.add_argument("--repeats", type=int, default=3)
+    suite.add_argument("--output", help="Write the results to this JSON file")
+    suite.add_argument("--baseline", help="Fail if throughput dropped against this JSON file")
+    suite.add_argument("--threshold", type=float, default=0.1,
+                       help="Allowed relative drop in samples/sec (default: 0.1)")
+
+    args = parser.parse_args()
+    if args.benchmark == "crossover":
+        bench_crossover(args.windows, args.blocks, args.repeats)
+    elif args.benchmark == "process":
+        bench_process(args.windows, args.samples, args.repeats)
+    elif args.benchmark == "parallel":
+        bench_parallel(args.samples, args.window, args.workers, args.repeats)
+    elif args.benchmark == "suite":
+        sys.exit(bench_suite(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,12 @@
-from typing import List
-from collections import deque
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from multiprocessing import shared_memory
+from operator import mul
+from typing import BinaryIO, Callable, Iterable, Iterator, List, Optional
+
+import numpy as np
 
 class WeightedAverage:
     """
@@ -9,8 +16,34 @@ class WeightedAverage:
     y[n] = (w[0]*x[0] + w[1]*x[1] + ... + w[n-1]*x[n-1]) / n
     
     where x holds the last n entries, with index 0 being the most recent entry.
+    
+    Uniform weights (a plain moving average) and linearly ramped weights such as
+    [5, 4, 3, 2, 1] are detected on construction and processed with running sums in
+    constant time per sample; any other weights use the direct weighted sum. Ramps are
+    only run this way when they have at least three taps and no zero or sign change.
+    
+    The last n entries live in a preallocated ring of 2 * n doubles. Every entry is
+    written twice, n apart, so the window (most recent first) is always the contiguous
+    slice ring[head:head + n] and nothing is shifted or reallocated per sample.
     """
     
+    # Number of samples between exact re-summations of the running sums (at least one window)
+    RESUM_INTERVAL = 1024
+    # Re-sum at once when a sample this many times larger than the magnitude of the rest
+    # of the window leaves it, since subtracting it cancels the low bits of the sums
+    RESUM_SPIKE_RATIO = 2.0 ** 20
+    
+    # process_batch switches to FFT convolution once the window is at least this long
+    # and the estimated FFT cost is lower than the direct N * L multiply-adds
+    FFT_MIN_WINDOW = 64
+    # Relative cost of one FFT "butterfly" (nfft * log2(nfft)) versus one multiply-add,
+    # calibrated with `python -m project_2.benchmarks crossover`
+    FFT_COST_FACTOR = 16.0
+    
+    # Up to this window length the per-sample weighted sum is cheaper in plain Python
+    # than through a NumPy call (see `python -m project_2.benchmarks process`)
+    PYTHON_SUM_MAX_WINDOW = 8
+    
     def __init__(self, w: List[float]):
         """
         Initialize the WeightedAverage with the given weights.
@@ -29,30 +62,496 @@ class WeightedAverage:
             
         self.weights = w
         self.window_size = len(w)
-        self.buffer = deque(maxlen=self.window_size)
+        self._kernel = np.asarray(w, dtype=float)
+        self._kernel_spectra = {}
+        
+        # Initialize the ring with zeros; ring[head] is the most recent entry
+        self._ring = np.zeros(2 * self.window_size)
+        self._ring_view = memoryview(self._ring)
+        self._head = 0
+        
+        # Weights w[k] = w[0] + k * step can be updated recursively from two running sums.
+        # w[0] * S + step * M cancels unless every weight has the same sign, so ramps
+        # through or onto zero use the direct sum, as do two-tap ramps, where it is as cheap
+        steps = {b - a for a, b in zip(w, w[1:])}
+        step = steps.pop() if len(steps) == 1 else None
+        self._running = step is not None and (
+            step == 0 or (self.window_size >= 3 and (min(w) > 0 or max(w) < 0)))
+        self._ramp_start = w[0]
+        self._ramp_step = step if self._running else 0
+        self._resum_interval = max(self.RESUM_INTERVAL, self.window_size)
+        self._resum()
+    
+    @property
+    def buffer(self) -> List[float]:
+        """
+        The last window_size entries, most recent first.
+        
+        This is a read-only property returning a new list on every access; modifying
+        the list does not change the filter. Use set_state to replace the history.
+        """
+        return self._window().tolist()
+    
+    def get_state(self) -> np.ndarray:
+        """
+        Return the filter state: the last window_size inputs, most recent first.
+        
+        Returns:
+            np.ndarray: A copy of the state, which can be passed to set_state later
+        """
+        return self._window().copy()
+    
+    def set_state(self, state) -> None:
+        """
+        Restore a state saved with get_state, so filtering resumes where it stopped.
         
-        # Initialize buffer with zeros
-        for _ in range(self.window_size):
-            self.buffer.appendleft(0.0)
+        Args:
+            state (array_like): The last window_size inputs, most recent first
+            
+        Raises:
+            ValueError: If the state does not hold exactly window_size values
+        """
+        window = np.asarray(state, dtype=float)
+        if window.shape != (self.window_size,):
+            raise ValueError(f"State must hold {self.window_size} values")
+        self._ring[:self.window_size] = window
+        self._ring[self.window_size:] = window
+        self._head = 0
+        self._resum()
+    
+    def _window(self) -> np.ndarray:
+        """View of the last window_size entries, most recent first."""
+        return self._ring[self._head:self._head + self.window_size]
+    
+    def _push(self, x: float) -> None:
+        """Overwrite the oldest entry of the ring with a new value."""
+        n = self.window_size
+        head = self._head = (self._head - 1) % n
+        self._ring_view[head] = x
+        self._ring_view[head + n] = x
     
     def process(self, x: float) -> float:
         """
         Process a new value and return the current weighted average.
         
+        The history is kept as doubles, so any input float() accepts other than a string
+        (int, Decimal, Fraction, NumPy scalars, ...) is converted to float and the result
+        is always a float.
+        
         Args:
             x (float): The new input value
             
         Returns:
             float: The current weighted average
+            
+        Raises:
+            TypeError: If x is a string or cannot be converted to float
         """
-        # Add new value to the front of the buffer
-        self.buffer.appendleft(x)
+        if not isinstance(x, float):
+            if isinstance(x, (str, bytes)):
+                raise TypeError("Input value must be a number")
+            x = float(x)
         
-        # Calculate weighted sum
-        weighted_sum = sum(w * x for w, x in zip(self.weights, self.buffer))
+        if self._running:
+            return self._process_running(x)
+        
+        # Add new value to the front of the window
+        self._push(x)
+        
+        # Calculate weighted sum over the contiguous window slice
+        n = self.window_size
+        if n <= self.PYTHON_SUM_MAX_WINDOW:
+            weighted_sum = sum(map(mul, self.weights, self._ring_view[self._head:self._head + n]))
+        else:
+            weighted_sum = float(self._kernel.dot(self._window()))
         
         # Calculate average (divide by number of weights)
-        return weighted_sum / self.window_size
+        return weighted_sum / n
+    
+    def _process_running(self, x: float) -> float:
+        """
+        Process a new value in O(1) using running sums (uniform or ramped weights only).
+        
+        With S = sum(x[k]) and M = sum(k * x[k]) over the window, the weighted sum is
+        w[0] * S + step * M. When a new value arrives and the oldest one leaves,
+        M grows by S - window_size * oldest and S by x - oldest.
+        
+        The sums are recomputed exactly every RESUM_INTERVAL samples, and at once when
+        a non-finite sample or one far larger than the rest of the window leaves it,
+        so a NaN, an infinity or a spike only affects the outputs while it is in the window.
+        
+        Args:
+            x (float): The new input value
+            
+        Returns:
+            float: The current weighted average
+        """
+        oldest = self._ring_view[self._head + self.window_size - 1]
+        new_sum = self._sum + x - oldest
+        if self._ramp_step:
+            self._moment += self._sum - self.window_size * oldest
+        self._sum = new_sum
+        self._magnitude += abs(x) - abs(oldest)
+        self._push(x)
+        
+        # Recompute the sums exactly now and then so rounding errors cannot accumulate, and
+        # straight away once a sample has left that the O(1) update cannot cancel exactly
+        # (the comparison is also False when the magnitude has become NaN)
+        self._since_resum += 1
+        if (self._since_resum >= self._resum_interval
+                or not abs(oldest) <= self.RESUM_SPIKE_RATIO * self._magnitude):
+            self._resum()
+        
+        return (self._ramp_start * self._sum + self._ramp_step * self._moment) / self.window_size
+    
+    def _resum(self) -> None:
+        """Recompute the running sums exactly from the window."""
+        self._since_resum = 0
+        if self._running:
+            window = self._window()
+            self._sum = float(window.sum())
+            self._magnitude = float(np.abs(window).sum())
+            self._moment = float(np.arange(self.window_size).dot(window)) if self._ramp_step else 0.0
+    
+    def process_batch(self, x, method: str = "auto") -> np.ndarray:
+        """
+        Process a block of values at once and return the weighted average after each one.
+        
+        The whole block is filtered with a single convolution. The last window_size
+        values are carried over, so calling process_batch on consecutive blocks (or
+        mixing it with process) gives the same results as processing every value
+        one at a time with process, up to floating-point rounding.
+        
+        Args:
+            x (array_like): One-dimensional block of input values
+            method (str): "direct" for np.convolve, "fft" for overlap-save FFT
+                convolution, or "auto" to pick the cheaper one for the window length and
+                block size (default: "auto")
+            
+        Returns:
+            np.ndarray: The weighted average after each input value
+            
+        Raises:
+            ValueError: If x is not one-dimensional or method is unknown
+        """
+        if method not in ("auto", "direct", "fft"):
+            raise ValueError(f"Unknown convolution method: {method}")
+        block = np.asarray(x, dtype=float)
+        if block.ndim != 1:
+            raise ValueError("Input block must be one-dimensional")
+        if block.size == 0:
+            return np.empty(0)
+        
+        extended = self._extend(block)
+        if method == "auto":
+            method = choose_convolution_method(self.window_size, block.size,
+                                               self.FFT_MIN_WINDOW, self.FFT_COST_FACTOR)
+        if method == "fft":
+            nfft = fft_segment_size(self.window_size, block.size)
+            spectrum = self._kernel_spectra.get(nfft)
+            if spectrum is None:
+                spectrum = self._kernel_spectra[nfft] = np.fft.rfft(self._kernel, nfft)
+            result = overlap_save(extended, spectrum, self.window_size, nfft) / self.window_size
+        else:
+            result = np.convolve(extended, self._kernel, mode="valid") / self.window_size
+        
+        self._advance(block)
+        return result
+    
+    def process_parallel(self, x, workers: int = None, chunk_size: int = None) -> np.ndarray:
+        """
+        Process a long block of values with direct convolution split across processes.
+        
+        Each output only depends on the window_size inputs ending at it, so the block is
+        cut into chunks that each read the window_size - 1 preceding inputs as a halo.
+        The input and output live in shared memory, so worker processes read and write
+        them in place instead of receiving pickled copies. Every output is computed by
+        the same dot product as in a serial call, so the result is bit-identical to
+        process_batch(x, method="direct"), and the filter state is updated the same way.
+        With a single worker or a single chunk, no processes are started.
+        
+        Args:
+            x (array_like): One-dimensional block of input values
+            workers (int, optional): Number of worker processes. Defaults to the CPU count.
+            chunk_size (int, optional): Number of outputs per task. Defaults to an even
+                split over the workers.
+            
+        Returns:
+            np.ndarray: The weighted average after each input value
+            
+        Raises:
+            ValueError: If x is not one-dimensional or chunk_size is not positive
+        """
+        block = np.asarray(x, dtype=float)
+        if block.ndim != 1:
+            raise ValueError("Input block must be one-dimensional")
+        workers = workers or os.cpu_count() or 1
+        if chunk_size is None:
+            chunk_size = max(1, -(-block.size // workers))
+        elif chunk_size < 1:
+            raise ValueError("Chunk size must be a positive integer")
+        if block.size == 0:
+            return np.empty(0)
+        bounds = [(start, min(start + chunk_size, block.size)) for start in range(0, block.size, chunk_size)]
+        
+        if workers == 1 or len(bounds) == 1:
+            extended = self._extend(block)
+            result = np.empty(block.size)
+            for start, end in bounds:
+                _filter_range(extended, self._kernel, result, start, end)
+        else:
+            source = shared_memory.SharedMemory(create=True, size=(block.size + self.window_size - 1) * 8)
+            target = shared_memory.SharedMemory(create=True, size=block.size * 8)
+            try:
+                np.ndarray(block.size + self.window_size - 1, buffer=source.buf)[:] = self._extend(block)
+                with ProcessPoolExecutor(max_workers=min(workers, len(bounds))) as pool:
+                    futures = [pool.submit(_filter_shared_range, source.name, target.name, block.size,
+                                           self._kernel, start, end) for start, end in bounds]
+                    for future in futures:
+                        future.result()
+                result = np.ndarray(block.size, buffer=target.buf).copy()
+            finally:
+                for segment in (source, target):
+                    segment.close()
+                    segment.unlink()
+        
+        self._advance(block)
+        return result
+    
+    def _extend(self, block: np.ndarray) -> np.ndarray:
+        """Prepend the previous window_size - 1 values (oldest first) to a block."""
+        history = self._window()[:self.window_size - 1][::-1]
+        return np.concatenate((history, block))
+    
+    def _advance(self, block: np.ndarray) -> None:
+        """Update the state after a whole block has been filtered."""
+        # The new window is the end of the block (most recent first), topped up with old entries
+        self.set_state(np.concatenate((block[::-1][:self.window_size], self._window()))[:self.window_size])
+    
+    def filter_blocks(self, blocks: Iterable, method: str = "auto") -> Iterator[np.ndarray]:
+        """
+        Lazily filter a stream of blocks, one process_batch call per block.
+        
+        Nothing is computed until the result is iterated, and only one block is held in
+        memory at a time, so stages can be chained into pipelines of any length:
+        
+            stage = second.filter_blocks(first.filter_blocks(sine_wave_blocks(10**9)))
+        
+        Args:
+            blocks (Iterable): Blocks of samples (array_like, one-dimensional)
+            method (str): Convolution engine passed to process_batch (default: "auto")
+            
+        Yields:
+            np.ndarray: The weighted averages of each block
+        """
+        for block in blocks:
+            yield self.process_batch(block, method)
+
+
+def _filter_range(extended: np.ndarray, kernel: np.ndarray, output: np.ndarray, start: int, end: int) -> None:
+    """Write outputs [start, end) of a direct convolution, reading the halo before start."""
+    window = kernel.size
+    output[start:end] = np.convolve(extended[start:end + window - 1], kernel, mode="valid") / window
+
+
+def _filter_shared_range(source_name: str, target_name: str, samples: int, kernel: np.ndarray,
+                         start: int, end: int) -> None:
+    """Filter one chunk between shared memory blocks (runs in a worker process)."""
+    source = shared_memory.SharedMemory(name=source_name)
+    target = shared_memory.SharedMemory(name=target_name)
+    try:
+        extended = np.ndarray(samples + kernel.size - 1, buffer=source.buf)
+        output = np.ndarray(samples, buffer=target.buf)
+        _filter_range(extended, kernel, output, start, end)
+        del extended, output  # Release the buffers before closing
+    finally:
+        source.close()
+        target.close()
+
+
+class MultiChannelWeightedAverage:
+    """
+    The weighted average of WeightedAverage applied to many channels at once.
+    
+    All channels share one (channels, window) circular buffer, and each call filters a
+    (channels, samples) block for every channel in one vectorized step instead of a
+    Python loop over separate WeightedAverage objects. The channels can share one set
+    of weights or each have their own.
+    
+    Attributes:
+        weights (np.ndarray): Weights of shape (window,), or (channels, window) per channel
+        channels (int): Number of channels
+        window_size (int): Number of weights per channel
+        buffer (np.ndarray): Circular buffer of the last window_size samples per channel
+        head (int): Column of the buffer holding the oldest sample
+    """
+    
+    def __init__(self, w, channels: int = None):
+        """
+        Initialize the filter for a number of channels.
+        
+        Args:
+            w (array_like): Weights shared by all channels, or a (channels, window) array
+                with one row of weights per channel
+            channels (int, optional): Number of channels. Required for shared weights and
+                inferred from per-channel weights.
+                
+        Raises:
+            ValueError: If the weights are empty or all zeros for a channel, or the number
+                of channels is missing or does not match the weights
+        """
+        weights = np.asarray(w, dtype=float)
+        if weights.ndim not in (1, 2) or weights.shape[-1] == 0:
+            raise ValueError("Weights list cannot be empty")
+        if np.any(np.all(weights == 0, axis=-1)):
+            raise ValueError("Weights cannot be all zeros")
+        if weights.ndim == 2:
+            if channels is not None and channels != weights.shape[0]:
+                raise ValueError("Number of channels does not match the per-channel weights")
+            channels = weights.shape[0]
+        if channels is None or channels < 1:
+            raise ValueError("Number of channels must be a positive integer")
+        
+        self.weights = weights
+        self.channels = channels
+        self.window_size = weights.shape[-1]
+        self.buffer = np.zeros((channels, self.window_size))
+        self.head = 0
+        self._kernel_spectra = {}
+    
+    def process(self, block) -> np.ndarray:
+        """
+        Process a block of samples for every channel.
+        
+        Args:
+            block (array_like): Samples of shape (channels, samples), or (channels,) for a
+                single sample per channel
+                
+        Returns:
+            np.ndarray: The weighted averages, with the same shape as block
+            
+        Raises:
+            ValueError: If the block does not have one row per channel
+        """
+        samples = np.asarray(block, dtype=float)
+        single = samples.ndim == 1
+        if single:
+            samples = samples[:, None]
+        if samples.ndim != 2 or samples.shape[0] != self.channels:
+            raise ValueError(f"Block must have shape ({self.channels}, samples)")
+        count = samples.shape[1]
+        if count == 0:
+            return np.empty_like(samples)
+        
+        window = self.window_size
+        # Oldest-first history: the buffer read from head, without its oldest sample
+        history = np.concatenate((self.buffer[:, self.head:], self.buffer[:, :self.head]), axis=1)[:, 1:]
+        extended = np.concatenate((history, samples), axis=1)
+        
+        if choose_convolution_method(window, count, WeightedAverage.FFT_MIN_WINDOW,
+                                     WeightedAverage.FFT_COST_FACTOR) == "fft":
+            nfft = fft_segment_size(window, count)
+            spectrum = self._kernel_spectra.get(nfft)
+            if spectrum is None:
+                spectrum = np.fft.rfft(self.weights, nfft)
+                if spectrum.ndim == 2:
+                    spectrum = spectrum[:, None, :]  # One spectrum per channel, for every segment
+                self._kernel_spectra[nfft] = spectrum
+            result = overlap_save(extended, spectrum, window, nfft)
+        else:
+            frames = np.lib.stride_tricks.sliding_window_view(extended, window, axis=1)
+            reversed_weights = self.weights[..., ::-1]
+            subscripts = "csw,cw->cs" if reversed_weights.ndim == 2 else "csw,w->cs"
+            result = np.einsum(subscripts, frames, reversed_weights)
+        result /= window
+        
+        # Write the newest samples over the oldest ones
+        newest = samples[:, -window:]
+        columns = (self.head + np.arange(newest.shape[1])) % window
+        self.buffer[:, columns] = newest
+        self.head = (self.head + newest.shape[1]) % window
+        
+        return result[:, 0] if single else result
+
+
+def fft_segment_size(window: int, block: int) -> int:
+    """
+    Choose the FFT length for overlap-save filtering of a block.
+    
+    Each segment of nfft samples yields nfft - window + 1 outputs, so the cost per output
+    is nfft * log2(nfft) / (nfft - window + 1). The power of two minimizing it is used,
+    without exceeding what the block needs.
+    
+    Args:
+        window (int): Length of the filter
+        block (int): Number of output samples to produce
+        
+    Returns:
+        int: The FFT length, a power of two of at least 2 * window
+    """
+    nfft = 1 << max(1, (2 * window - 1).bit_length())
+    largest = max(nfft, 1 << (block + window - 2).bit_length())
+    best, best_cost = nfft, float("inf")
+    while nfft <= largest:
+        cost = nfft * np.log2(nfft) / (nfft - window + 1)
+        if cost < best_cost:
+            best, best_cost = nfft, cost
+        nfft *= 2
+    return best
+
+
+def choose_convolution_method(window: int, block: int, min_window: int = 64,
+                              cost_factor: float = 16.0) -> str:
+    """
+    Pick direct or FFT convolution from a simple cost model.
+    
+    Direct convolution costs window * block multiply-adds. Overlap-save costs about
+    cost_factor * nfft * log2(nfft) per segment of nfft - window + 1 outputs.
+    
+    Args:
+        window (int): Length of the filter
+        block (int): Number of output samples to produce
+        min_window (int): Shortest window for which FFT convolution is considered
+        cost_factor (float): Cost of an FFT butterfly relative to a multiply-add
+        
+    Returns:
+        str: "direct" or "fft"
+    """
+    if window < min_window or block == 0:
+        return "direct"
+    nfft = fft_segment_size(window, block)
+    segments = -(-block // (nfft - window + 1))
+    fft_cost = cost_factor * segments * nfft * np.log2(nfft)
+    return "fft" if fft_cost < window * block else "direct"
+
+
+def overlap_save(extended: np.ndarray, kernel_spectrum: np.ndarray, window: int, nfft: int) -> np.ndarray:
+    """
+    Convolve with a filter using the overlap-save method, keeping only complete windows.
+    
+    The input is cut into overlapping segments of nfft samples, which are transformed
+    together; after multiplying by the filter spectrum, the first window - 1 samples of
+    every segment (corrupted by circular wrap-around) are discarded.
+    
+    Args:
+        extended (np.ndarray): Input whose first window - 1 samples are history
+        kernel_spectrum (np.ndarray): np.fft.rfft of the filter, zero-padded to nfft
+        window (int): Length of the filter
+        nfft (int): FFT length, at least window
+        
+    Returns:
+        np.ndarray: len(extended) - window + 1 samples, equal to
+        np.convolve(extended, kernel, mode="valid") up to rounding
+    """
+    outputs = extended.shape[-1] - window + 1
+    step = nfft - window + 1
+    segments = -(-outputs // step)
+    padded = np.zeros(extended.shape[:-1] + ((segments - 1) * step + nfft,))
+    padded[..., :extended.shape[-1]] = extended
+    frames = np.lib.stride_tricks.sliding_window_view(padded, nfft, axis=-1)[..., ::step, :]
+    filtered = np.fft.irfft(np.fft.rfft(frames, axis=-1) * kernel_spectrum, nfft, axis=-1)
+    result = filtered[..., window - 1:].reshape(extended.shape[:-1] + (-1,))
+    return result[..., :outputs]
 
 
 def generate_sine_wave(samples: int, frequency: float = 1.0, amplitude: float = 1.0) -> List[float]:
@@ -67,11 +566,379 @@ def generate_sine_wave(samples: int, frequency: float = 1.0, amplitude: float =
     Returns:
         List[float]: Generated sine wave samples
     """
-    import math
     # For 2Hz frequency, we need exactly 2 full cycles in the output
     # Each sample is i/samples of the total time, multiplied by 2*pi*frequency to get radians
-    return [amplitude * math.sin(2 * math.pi * frequency * i / samples * 2) 
-            for i in range(samples)]
+    return sine_wave(samples, frequency, amplitude).tolist()
+
+
+def sine_wave(samples: int, frequency: float = 1.0, amplitude: float = 1.0, dtype=np.float64,
+              out: np.ndarray = None) -> np.ndarray:
+    """
+    Generate the sine wave of generate_sine_wave as a NumPy array.
+    
+    Sample i is amplitude * sin(2 * pi * frequency * i / samples * 2), computed with one
+    vectorized np.sin call instead of one math.sin call per sample. Like the original
+    range()-based generate_sine_wave, this and the generators below return no samples
+    for a negative sample count.
+    
+    Args:
+        samples (int): Number of samples to generate
+        frequency (float): Frequency of the sine wave, as in generate_sine_wave
+        amplitude (float): Amplitude of the sine wave
+        dtype: Sample type of the result (default: np.float64)
+        out (np.ndarray, optional): Preallocated array of shape (samples,) to fill instead
+            of allocating a new one; its dtype is used
+            
+    Returns:
+        np.ndarray: The samples (out, when given)
+        
+    Raises:
+        ValueError: If out does not have shape (samples,)
+    """
+    samples = max(samples, 0)
+    return _sine(samples, frequency, amplitude, _signal_output(samples, dtype, out))
+
+
+def multi_tone(samples: int, frequencies, amplitudes=None, dtype=np.float64,
+               out: np.ndarray = None) -> np.ndarray:
+    """
+    Generate the sum of several sine waves.
+    
+    Args:
+        samples (int): Number of samples to generate
+        frequencies (array_like): Frequency of every tone, as in generate_sine_wave
+        amplitudes (array_like, optional): Amplitude of every tone (default: all 1.0)
+        dtype: Sample type of the result (default: np.float64)
+        out (np.ndarray, optional): Preallocated array of shape (samples,) to fill
+        
+    Returns:
+        np.ndarray: The samples (out, when given)
+        
+    Raises:
+        ValueError: If frequencies and amplitudes differ in length, or out does not have
+            shape (samples,)
+    """
+    frequencies = np.atleast_1d(np.asarray(frequencies, dtype=float))
+    if amplitudes is None:
+        amplitudes = np.ones_like(frequencies)
+    amplitudes = np.atleast_1d(np.asarray(amplitudes, dtype=float))
+    if frequencies.shape != amplitudes.shape:
+        raise ValueError("Every tone needs one frequency and one amplitude")
+    samples = max(samples, 0)
+    out = _signal_output(samples, dtype, out)
+    total = np.zeros(samples)
+    for frequency, amplitude in zip(frequencies, amplitudes):
+        phase = _phase(samples, 2 * np.pi * frequency)
+        np.sin(phase, out=phase)
+        phase *= amplitude
+        total += phase
+    np.copyto(out, total, casting="unsafe")
+    return out
+
+
+def chirp(samples: int, start_frequency: float, end_frequency: float, amplitude: float = 1.0,
+          dtype=np.float64, out: np.ndarray = None) -> np.ndarray:
+    """
+    Generate a linear chirp sweeping from start_frequency to end_frequency.
+    
+    Frequencies use the convention of generate_sine_wave, so a chirp whose start and end
+    frequencies are equal is the corresponding sine wave.
+    
+    Args:
+        samples (int): Number of samples to generate
+        start_frequency (float): Frequency at the first sample
+        end_frequency (float): Frequency reached at the end of the signal
+        amplitude (float): Amplitude of the chirp
+        dtype: Sample type of the result (default: np.float64)
+        out (np.ndarray, optional): Preallocated array of shape (samples,) to fill
+        
+    Returns:
+        np.ndarray: The samples (out, when given)
+        
+    Raises:
+        ValueError: If out does not have shape (samples,)
+    """
+    samples = max(samples, 0)
+    out = _signal_output(samples, dtype, out)
+    # Instantaneous frequency f0 + (f1 - f0) * t; its integral gives the phase
+    t = _index(samples) / samples
+    phase = t * (end_frequency - start_frequency) / 2
+    phase += start_frequency
+    phase *= t
+    phase *= 4 * np.pi
+    np.sin(phase, out=phase)
+    return np.multiply(phase, amplitude, out=out, casting="unsafe")
+
+
+def noise(samples: int, amplitude: float = 1.0, seed: int = None, dtype=np.float64,
+          out: np.ndarray = None) -> np.ndarray:
+    """
+    Generate Gaussian white noise.
+    
+    Args:
+        samples (int): Number of samples to generate
+        amplitude (float): Standard deviation of the noise
+        seed (int, optional): Seed for reproducible noise
+        dtype: Sample type of the result; float32 and float64 are drawn directly in that
+            type (default: np.float64)
+        out (np.ndarray, optional): Preallocated array of shape (samples,) to fill
+        
+    Returns:
+        np.ndarray: The samples (out, when given)
+        
+    Raises:
+        ValueError: If out does not have shape (samples,)
+    """
+    samples = max(samples, 0)
+    out = _signal_output(samples, dtype, out)
+    rng = np.random.default_rng(seed)
+    if out.dtype in (np.float32, np.float64):
+        rng.standard_normal(samples, dtype=out.dtype, out=out)
+    else:
+        np.copyto(out, rng.standard_normal(samples), casting="unsafe")
+    out *= amplitude
+    return out
+
+
+@lru_cache(maxsize=32)
+def _cached_sine_wave(samples: int, frequency: float, amplitude: float, dtype: np.dtype) -> np.ndarray:
+    wave = sine_wave(samples, frequency, amplitude, dtype)
+    wave.flags.writeable = False
+    return wave
+
+
+def cached_sine_wave(samples: int, frequency: float = 1.0, amplitude: float = 1.0,
+                     dtype=np.float64) -> np.ndarray:
+    """
+    Return a sine_wave from an LRU cache, for fixtures that are requested repeatedly.
+    
+    The same read-only array is returned for the same (samples, frequency, amplitude,
+    dtype), so callers cannot modify a signal that others share; copy it to modify it.
+    
+    Args:
+        samples (int): Number of samples to generate
+        frequency (float): Frequency of the sine wave, as in generate_sine_wave
+        amplitude (float): Amplitude of the sine wave
+        dtype: Sample type of the result (default: np.float64)
+        
+    Returns:
+        np.ndarray: The read-only samples
+    """
+    return _cached_sine_wave(samples, float(frequency), float(amplitude), np.dtype(dtype))
+
+
+def _signal_output(samples: int, dtype, out: np.ndarray) -> np.ndarray:
+    """Return the array a generator writes to, allocating it unless out is given."""
+    if out is None:
+        return np.empty(samples, dtype=dtype)
+    if out.shape != (samples,):
+        raise ValueError(f"Output array must have shape ({samples},)")
+    return out
+
+
+def _index(samples: int, start: int = 0, stop: int = None) -> np.ndarray:
+    return np.arange(start, samples if stop is None else stop, dtype=np.float64)
+
+
+def _phase(samples: int, scale: float, start: int = 0, stop: int = None) -> np.ndarray:
+    """Return scale * i / samples * 2 for every sample index i, in the order generate_sine_wave rounds."""
+    phase = _index(samples, start, stop)
+    phase *= scale
+    phase /= samples
+    phase *= 2
+    return phase
+
+
+def _sine(samples: int, frequency: float, amplitude: float, out: np.ndarray, start: int = 0) -> np.ndarray:
+    """Fill out with samples start, start + 1, ... of sine_wave(samples, frequency, amplitude)."""
+    phase = _phase(samples, 2 * np.pi * frequency, start, start + out.size)
+    np.sin(phase, out=phase)
+    return np.multiply(phase, amplitude, out=out, casting="unsafe")
+
+
+def sine_wave_blocks(samples: int, frequency: float = 1.0, amplitude: float = 1.0,
+                     block_size: int = 65536) -> Iterator[np.ndarray]:
+    """
+    Generate the samples of generate_sine_wave lazily, block_size samples at a time.
+    
+    Args:
+        samples (int): Total number of samples to generate
+        frequency (float): Frequency of the sine wave, as in generate_sine_wave
+        amplitude (float): Amplitude of the sine wave
+        block_size (int): Number of samples per block (default: 65536)
+        
+    Yields:
+        np.ndarray: Consecutive blocks of the sine wave; the last one may be shorter
+        
+    Raises:
+        ValueError: If block_size is not positive
+    """
+    if block_size < 1:
+        raise ValueError("Block size must be a positive integer")
+    for start in range(0, samples, block_size):
+        yield _sine(samples, frequency, amplitude, np.empty(min(block_size, samples - start)), start)
+
+
+def iter_blocks(signal: Iterable, block_size: int = 65536) -> Iterator[np.ndarray]:
+    """
+    Split a signal into blocks for a pipeline.
+    
+    Arrays are sliced without copying; any other iterable of numbers is consumed lazily.
+    
+    Args:
+        signal (Iterable): An array or an iterable of samples
+        block_size (int): Number of samples per block (default: 65536)
+        
+    Yields:
+        np.ndarray: Consecutive blocks of the signal; the last one may be shorter
+        
+    Raises:
+        ValueError: If block_size is not positive
+    """
+    if block_size < 1:
+        raise ValueError("Block size must be a positive integer")
+    if isinstance(signal, np.ndarray):
+        for start in range(0, signal.size, block_size):
+            yield signal[start:start + block_size]
+        return
+    iterator = iter(signal)
+    while True:
+        block = np.fromiter(islice(iterator, block_size), dtype=float)
+        if block.size == 0:
+            return
+        yield block
+        if block.size < block_size:
+            return
+
+
+def write_blocks(blocks: Iterable, file: BinaryIO, dtype=np.float64) -> int:
+    """
+    Pipeline sink writing blocks to a binary file as raw samples.
+    
+    Args:
+        blocks (Iterable): Blocks of samples
+        file (BinaryIO): File opened for binary writing
+        dtype: Sample type written to the file (default: np.float64)
+        
+    Returns:
+        int: Number of samples written
+    """
+    written = 0
+    for block in blocks:
+        data = np.asarray(block, dtype=dtype)
+        file.write(data.tobytes())
+        written += data.size
+    return written
+
+
+def collect_blocks(blocks: Iterable, out: np.ndarray = None) -> np.ndarray:
+    """
+    Pipeline sink gathering blocks into one array.
+    
+    Args:
+        blocks (Iterable): Blocks of samples
+        out (np.ndarray, optional): Preallocated array to fill. When given, the blocks are
+            copied into it and the filled part is returned.
+            
+    Returns:
+        np.ndarray: The concatenated samples
+        
+    Raises:
+        ValueError: If out is too small for the blocks
+    """
+    if out is None:
+        parts = [np.asarray(block, dtype=float) for block in blocks]
+        return np.concatenate(parts) if parts else np.empty(0)
+    filled = 0
+    for block in blocks:
+        block = np.asarray(block)
+        if filled + block.size > out.size:
+            raise ValueError("Output array is too small for the blocks")
+        out[filled:filled + block.size] = block
+        filled += block.size
+    return out[:filled]
+
+
+def filter_file(wa: WeightedAverage, input_path: str, output_path: str, dtype=np.float64,
+                output_dtype=None, block_size: int = 1 << 20,
+                progress: Optional[Callable[[int, int], None]] = None,
+                checkpoint_path: Optional[str] = None) -> int:
+    """
+    Filter a raw binary sample file into another one, block by block, through memory maps.
+    
+    Neither file is loaded into RAM: the input is memory-mapped read-only, the output
+    is created as a memory-mapped file of the same length, and each block of block_size
+    samples goes through process_batch.
+    
+    With checkpoint_path, the number of samples done and the filter state are saved
+    after every block (once the output has been flushed). If the checkpoint already
+    exists, filtering resumes from it into the existing output file; the checkpoint is
+    removed once the whole file has been filtered.
+    
+    Args:
+        wa (WeightedAverage): The filter; its state carries over from before the call
+            unless a checkpoint is restored
+        input_path (str): File of raw samples
+        output_path (str): File to write the weighted averages to
+        dtype: Sample type of the input file (default: np.float64)
+        output_dtype: Sample type of the output file (default: the input type)
+        block_size (int): Number of samples per block (default: 1 Mi samples)
+        progress (callable, optional): Called as progress(done, total) after every block
+        checkpoint_path (str, optional): Where to save and restore progress
+        
+    Returns:
+        int: Number of samples filtered by this call
+        
+    Raises:
+        ValueError: If block_size is not positive, the checkpoint belongs to a different
+            filter, or the output file does not match the input
+    """
+    if block_size < 1:
+        raise ValueError("Block size must be a positive integer")
+    dtype = np.dtype(dtype)
+    output_dtype = dtype if output_dtype is None else np.dtype(output_dtype)
+    total = os.path.getsize(input_path) // dtype.itemsize
+    
+    start = 0
+    resume = checkpoint_path is not None and os.path.exists(checkpoint_path)
+    if resume:
+        with np.load(checkpoint_path) as checkpoint:
+            if not np.array_equal(checkpoint["weights"], wa._kernel):
+                raise ValueError("Checkpoint was saved by a filter with different weights")
+            start = int(checkpoint["position"])
+            wa.set_state(checkpoint["state"])
+        if os.path.getsize(output_path) != total * output_dtype.itemsize:
+            raise ValueError("Output file does not match the input being resumed")
+    if total == 0:
+        open(output_path, "ab" if resume else "wb").close()
+        start = 0
+    else:
+        source = np.memmap(input_path, dtype=dtype, mode="r", shape=(total,))
+        target = np.memmap(output_path, dtype=output_dtype, mode="r+" if resume else "w+", shape=(total,))
+        try:
+            for position in range(start, total, block_size):
+                end = min(position + block_size, total)
+                target[position:end] = wa.process_batch(source[position:end])
+                if checkpoint_path is not None:
+                    target.flush()
+                    _save_checkpoint(checkpoint_path, wa, end)
+                if progress is not None:
+                    progress(end, total)
+            target.flush()
+        finally:
+            del source, target
+    if checkpoint_path is not None and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    return total - start
+
+
+def _save_checkpoint(path: str, wa: WeightedAverage, position: int) -> None:
+    """Atomically replace the checkpoint, so an interruption never leaves a partial one."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        np.savez(f, position=position, state=wa.get_state(), weights=wa._kernel)
+    os.replace(tmp_path, path)
+
 
 def main():
     # Example usage with the given test case
@@ -0,0 +1,207 @@
+"""
+Benchmarks for the pangram checker.
+
+Run from the Thavhana_Pfunzo directory, for example:
+
+    python -m project_3.benchmarks engine --megabytes 1 16
+    python -m project_3.benchmarks many --rows 1000000 --workers 1 4
+    python -m project_3.benchmarks alphabets
+    python -m project_3.benchmarks windows --megabytes 1 4
+"""
+import argparse
+import os
+import random
+import string
+import time
+
+try:
+    from .pangram_checker import PangramChecker, is_pangram, is_pangram_many, shortest_pangram_window
+except ImportError:
+    from pangram_checker import PangramChecker, is_pangram, is_pangram_many, shortest_pangram_window
+
+GERMAN_ALPHABET = string.ascii_lowercase + "äöüß"
+TSHIVENDA_ALPHABET = "abdḓefghiklḽmnṅṋoprstṱuvwxyz"
+
+
+def legacy_is_pangram(input_string: str, alphabet: str = string.ascii_lowercase) -> bool:
+    """The original per-letter rescanning is_pangram, kept as the benchmark reference."""
+    if not isinstance(input_string, str) or not isinstance(alphabet, str):
+        raise TypeError("Input must be a string")
+    if not alphabet:
+        return True
+    input_lower = input_string.lower()
+    if alphabet != string.ascii_lowercase:
+        required_chars = {char.lower() for char in alphabet if char.isalpha()}
+        if not required_chars:
+            return True
+        return all(any(c == char for c in input_lower) for char in required_chars)
+    return all(any(c == letter for c in input_lower) for letter in string.ascii_lowercase)
+
+
+def generate_inputs(megabytes: float, seed: int = 0) -> dict:
+    """
+    Build megabyte-sized inputs for the typical cases.
+
+    Args:
+        megabytes (float): Approximate size of every input in MiB
+        seed (int): Random seed, so every run uses the same inputs (default: 0)
+
+    Returns:
+        dict: Maps a case name to (text, alphabet, expected result)
+    """
+    rng = random.Random(seed)
+    size = int(megabytes * (1 << 20))
+    # Filler text without the letters "q", "x" and "z"
+    letters = "abcdefghijklmnoprstuvwy    ,.ABCDEFGHIJ"
+    filler = "".join(rng.choice(letters) for _ in range(min(size, 1 << 16)))
+    filler = (filler * (size // len(filler) + 1))[:size]
+    pangram = "The quick brown fox jumps over the lazy dog. "
+    return {
+        "early": (pangram + filler, string.ascii_lowercase, True),
+        "late": (filler + pangram, string.ascii_lowercase, True),
+        "missing": (filler, string.ascii_lowercase, False),
+        "custom late": (filler + "Quiz Xylophon Äpfel Öl Über Straße", GERMAN_ALPHABET, True),
+    }
+
+
+def bench_engine(sizes=(1, 16), repeats: int = 3, legacy_max_megabytes: float = 16) -> None:
+    """
+    Compare the original is_pangram with the single-pass early-exit engine.
+
+    Args:
+        sizes (tuple): Input sizes in MiB
+        repeats (int): Number of timed runs; the best is reported (default: 3)
+        legacy_max_megabytes (float): Skip the slow original above this size (default: 16)
+    """
+    print(f"{'MiB':>6} {'case':>12} {'legacy ms':>10} {'engine ms':>10} {'speedup':>8}")
+    for megabytes in sizes:
+        for case, (text, alphabet, expected) in generate_inputs(megabytes).items():
+            assert is_pangram(text, alphabet) is expected
+            engine = min(_timed(is_pangram, text, alphabet) for _ in range(repeats))
+            if megabytes <= legacy_max_megabytes:
+                assert legacy_is_pangram(text, alphabet) is expected
+                legacy = min(_timed(legacy_is_pangram, text, alphabet) for _ in range(repeats))
+                print(f"{megabytes:6g} {case:>12} {legacy * 1e3:10.2f} {engine * 1e3:10.3f} "
+                      f"{legacy / engine:8.0f}")
+            else:
+                print(f"{megabytes:6g} {case:>12} {'-':>10} {engine * 1e3:10.3f} {'-':>8}")
+
+
+def generate_rows(rows: int, seed: int = 0) -> list:
+    """Return short dataset-like rows of random words, about one in ten of them a pangram."""
+    rng = random.Random(seed)
+    words = ["data", "row", "value", "sensor", "signal", "the", "quick", "brown", "fox",
+             "jumps", "over", "lazy", "dog", "telescope", "array", "dish", "karoo"]
+    pangram = "Pack my box with five dozen liquor jugs"
+    return [pangram if rng.random() < 0.1 else " ".join(rng.choices(words, k=8)) for _ in range(rows)]
+
+
+def bench_many(rows: int = 1000000, workers_list=None, repeats: int = 3) -> None:
+    """
+    Compare a Python loop over is_pangram with is_pangram_many on short rows.
+
+    Args:
+        rows (int): Number of rows to check (default: 1M)
+        workers_list (list, optional): Worker counts to try (default: 1 and the CPU count)
+        repeats (int): Number of timed runs; the best is reported (default: 3)
+    """
+    texts = generate_rows(rows)
+    workers_list = workers_list or sorted({1, os.cpu_count() or 1})
+    expected = [is_pangram(text) for text in texts]
+    loop = min(_timed(lambda: [is_pangram(text) for text in texts]) for _ in range(repeats))
+    loop_legacy = _timed(lambda: [legacy_is_pangram(text) for text in texts])
+    print(f"Rows: {rows}, {sum(expected)} pangrams")
+    print(f"{'implementation':>22} {'seconds':>9} {'rows/s':>12}")
+    print(f"{'legacy is_pangram loop':>22} {loop_legacy:9.3f} {rows / loop_legacy:12,.0f}")
+    print(f"{'is_pangram loop':>22} {loop:9.3f} {rows / loop:12,.0f}")
+    for workers in workers_list:
+        best = None
+        for _ in range(repeats):
+            result = is_pangram_many(texts, workers=workers)
+            assert list(result) == expected
+            best = result if best is None or result.seconds < best.seconds else best
+        print(f"{f'many, {workers} workers':>22} {best.seconds:9.3f} {best.per_second:12,.0f}")
+
+
+def bench_alphabets(calls: int = 200000, repeats: int = 3) -> None:
+    """
+    Time repeated is_pangram calls on short strings with custom Unicode alphabets.
+
+    Args:
+        calls (int): Number of calls per timed run (default: 200000)
+        repeats (int): Number of timed runs; the best is reported (default: 3)
+    """
+    cases = {
+        "german": (GERMAN_ALPHABET, "Zwölf Boxkämpfer jagen Viktor quer über den großen Sylter Deich"),
+        "tshivenda": (TSHIVENDA_ALPHABET, "Vhana vha ḓo ṱuṱuwedza muṅwe na muṅwe u ḽa zwiḽiwa"),
+    }
+    print(f"{'alphabet':>10} {'legacy ns':>10} {'uncached ns':>12} {'cached ns':>10} {'speedup':>8}")
+    for name, (alphabet, text) in cases.items():
+        timings = []
+        for function in (legacy_is_pangram, lambda t, a: PangramChecker(a)(t), is_pangram):
+            assert function(text, alphabet) is legacy_is_pangram(text, alphabet)
+            best = min(_timed(lambda: [function(text, alphabet) for _ in range(calls)])
+                       for _ in range(repeats))
+            timings.append(best / calls * 1e9)
+        print(f"{name:>10} {timings[0]:10.0f} {timings[1]:12.0f} {timings[2]:10.0f} "
+              f"{timings[0] / timings[2]:8.1f}")
+
+
+def bench_windows(sizes=(1, 4)) -> None:
+    """
+    Time the shortest pangram window search on random text, to show it scales linearly.
+
+    Args:
+        sizes (tuple): Input sizes in MiB
+    """
+    rng = random.Random(0)
+    print(f"{'MiB':>6} {'seconds':>9} {'ns/char':>8} {'window':>8}")
+    for megabytes in sizes:
+        size = int(megabytes * (1 << 20))
+        text = "".join(rng.choices(string.ascii_letters + "     ,.", k=size))
+        start = time.perf_counter()
+        window = shortest_pangram_window(text)
+        elapsed = time.perf_counter() - start
+        assert window is not None and is_pangram(text[window[0]:window[1]])
+        print(f"{megabytes:6g} {elapsed:9.3f} {elapsed / size * 1e9:8.0f} {window[1] - window[0]:8d}")
+
+
+def _timed(function, *args) -> float:
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pangram checker benchmarks")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    engine = subparsers.add_parser("engine", help="Original versus single-pass is_pangram")
+    engine.add_argument("--megabytes", type=float, nargs="+", default=[1, 16])
+    engine.add_argument("--repeats", type=int, default=3)
+
+    many = subparsers.add_parser("many", help="Batch screening of many short strings")
+    many.add_argument("--rows", type=int, default=1000000)
+    many.add_argument("--workers", type=int, nargs="*")
+    many.add_argument("--repeats", type=int, default=3)
+
+    alphabets = subparsers.add_parser("alphabets", help="Repeated checks with custom alphabets")
+    alphabets.add_argument("--calls", type=int, default=200000)
+    alphabets.add_argument("--repeats", type=int, default=3)
+
+    windows = subparsers.add_parser("windows", help="Shortest pangram window search")
+    windows.add_argument("--megabytes", type=float, nargs="+", default=[1, 4])
+
+    args = parser.parse_args()
+    if args.benchmark == "engine":
+        bench_engine(args.megabytes, args.repeats)
+    elif args.benchmark == "many":
+        bench_many(args.rows, args.workers, args.repeats)
+    elif args.benchmark == "alphabets":
+        bench_alphabets(args.calls, args.repeats)
+    elif args.benchmark == "windows":
+        bench_windows(args.megabytes)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,48 @@
+import codecs
+import os
 import string
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+# Inputs are lowercased and scanned in slices that start small, so pangrams that
+# complete early stop after little work, and grow up to _SCAN_MAX_CHARS
+_SCAN_START_CHARS = 256
+_SCAN_MAX_CHARS = 1 << 18
+
+# Up to this many missing letters, each one is searched for with a substring search,
+# which runs at memory speed; beyond it one hashing pass over the slice is cheaper
+_SEARCH_MAX_LETTERS = 64
+
+_ASCII_LETTERS = frozenset(string.ascii_lowercase)
+
+# English letters from rarest to most common: checking rare letters first rejects most
+# non-pangrams after one or two substring searches
+_ASCII_RARITY_ORDER = "qjzxkvbpgwyfmculdhrsnioate"
+
+# str.lower() maps "Σ" to "ς" or "σ" depending on the neighbouring letters
+_SIGMA_FORMS = frozenset("σς")
+
+# Characters of context kept on each side of a chunk to lowercase "Σ" across chunk
+# boundaries; this covers any text without very long runs of case-ignorable characters
+_SIGMA_CONTEXT_CHARS = 64
+
+# Bytes read at a time by is_pangram_file
+_FILE_BLOCK_BYTES = 1 << 16
+
 
 def is_pangram(input_string: str, alphabet: str = string.ascii_lowercase) -> bool:
     """
     Check if the input string is a pangram (contains every letter of the alphabet at least once).
     
+    The input is lowercased slice by slice, front to back, and each slice is searched
+    for the letters still missing; the scan stops as soon as every letter has been
+    seen. Alphabets are compiled once and kept in an LRU cache (see
+    compile_alphabet), so repeated checks with the same alphabet skip the setup.
+    
     Args:
         input_string: The string to check
         alphabet: The set of characters to check for (default: English lowercase letters)
@@ -22,21 +61,755 @@ def is_pangram(input_string: str, alphabet: str = string.ascii_lowercase) -> boo
     if not alphabet:
         return True
     
-    # Normalize the input to lowercase for case-insensitive comparison
-    input_lower = input_string.lower()
-    
-    # For custom alphabets, check each character exactly as provided
-    if alphabet != string.ascii_lowercase:
-        # Convert to set to remove duplicates and filter non-letters
-        required_chars = {char.lower() for char in alphabet if char.isalpha()}
-        # For empty required chars (e.g., alphabet has no letters), return True
-        if not required_chars:
-            return True
-        # Check if all required characters are present in the input
-        return all(any(c == char for c in input_lower) for char in required_chars)
-    
-    # For standard English alphabet, check a-z
-    return all(any(c == letter for c in input_lower) for letter in string.ascii_lowercase)
+    return compile_alphabet(alphabet).is_pangram(input_string)
+
+
+@lru_cache(maxsize=128)
+def compile_alphabet(alphabet: str = string.ascii_lowercase) -> "PangramChecker":
+    """
+    Return the compiled PangramChecker for an alphabet, from an LRU cache.
+    
+    Checkers hold no per-input state, so one instance is shared by every caller using
+    the same alphabet. Use compile_alphabet.cache_info() to see the cache statistics.
+    
+    Args:
+        alphabet: The set of characters to check for (default: English lowercase letters)
+        
+    Returns:
+        PangramChecker: The shared checker for the alphabet
+        
+    Raises:
+        TypeError: If alphabet is not a string
+    """
+    return PangramChecker(alphabet)
+
+
+def _required_letters(alphabet: str) -> frozenset:
+    """
+    Return the lowercase letters an input must contain to be a pangram of alphabet.
+    
+    Custom alphabets keep only their letters, lowercased, so an alphabet without letters
+    requires nothing. A letter whose lowercase form is several characters (such as "İ")
+    can never be matched by a single input character.
+    """
+    if alphabet == string.ascii_lowercase:
+        return _ASCII_LETTERS
+    return frozenset(char.lower() for char in alphabet if char.isalpha())
+
+
+def _missing_letters(text: str, required: frozenset) -> set:
+    """
+    Return the required letters that do not occur in the lowercased text.
+    
+    Lowercasing slice by slice gives the same characters as text.lower(), except for
+    "Σ", whose lowercase form depends on its neighbours; when that matters, the text is
+    lowercased as a whole.
+    """
+    # Multi-character lowercase forms never equal a single input character
+    unmatchable = {letter for letter in required if len(letter) != 1}
+    missing = set(required) - unmatchable
+    if missing and not missing.isdisjoint(_SIGMA_FORMS) and "Σ" in text:
+        _discard_seen(missing, text.lower())
+        return missing | unmatchable
+    
+    start, size = 0, _SCAN_START_CHARS
+    while missing and start < len(text):
+        _discard_seen(missing, text[start:start + size].lower())
+        start += size
+        size = min(size * 2, _SCAN_MAX_CHARS)
+    return missing | unmatchable
+
+
+def _discard_seen(missing: set, lowered: str) -> None:
+    """
+    Remove the single-character letters that occur in lowered from missing.
+    
+    With up to _SEARCH_MAX_LETTERS missing letters, lowered is searched once per letter,
+    which is O(k * n) for k letters but each search is a C-level scan that stops at the
+    first match; with more letters, it is hashed in a single pass instead.
+    """
+    if len(missing) <= _SEARCH_MAX_LETTERS:
+        missing.difference_update([letter for letter in missing if letter in lowered])
+    else:
+        missing.difference_update(lowered)
+
+class PangramChecker:
+    """
+    An alphabet compiled once for checking many strings.
+    
+    The required letters are worked out on construction, so every check only scans the
+    input. It gives the same answers as is_pangram with the same alphabet.
+    
+    Attributes:
+        alphabet (str): The alphabet the checker was compiled from
+        required (frozenset): The lowercase letters an input must contain
+    """
+    
+    def __init__(self, alphabet: str = string.ascii_lowercase):
+        """
+        Compile an alphabet.
+        
+        Args:
+            alphabet (str): The set of characters to check for (default: English
+                lowercase letters)
+                
+        Raises:
+            TypeError: If alphabet is not a string
+        """
+        if not isinstance(alphabet, str):
+            raise TypeError("Input must be a string")
+        self.alphabet = alphabet
+        self.required = _required_letters(alphabet) if alphabet else frozenset()
+        if self.required == _ASCII_LETTERS:
+            order = _ASCII_RARITY_ORDER
+        else:
+            order = [char.lower() for char in alphabet if char.isalpha()]
+        self._order = tuple(dict.fromkeys(order))
+        self._matchable = all(len(letter) == 1 for letter in self.required)
+        # Large alphabets compare in one hashing pass instead of one search per letter
+        self._use_subset = len(self._order) > _SEARCH_MAX_LETTERS
+    
+    def __call__(self, input_string: str) -> bool:
+        return self.is_pangram(input_string)
+    
+    def is_pangram(self, input_string: str) -> bool:
+        """
+        Check if the input string contains every letter of the compiled alphabet.
+        
+        Args:
+            input_string: The string to check
+            
+        Returns:
+            bool: True if all letters are present in input_string (case-insensitive)
+            
+        Raises:
+            TypeError: If input_string is not a string
+        """
+        if not isinstance(input_string, str):
+            raise TypeError("Input must be a string")
+        if not self._matchable:
+            return False
+        if len(input_string) > _SCAN_START_CHARS:
+            return not _missing_letters(input_string, self.required)
+        # Short inputs are lowercased whole and rejected at the first missing letter
+        lowered = input_string.lower()
+        if self._use_subset:
+            return self.required.issubset(lowered)
+        for letter in self._order:
+            if letter not in lowered:
+                return False
+        return True
+    
+    def check_many(self, texts: Iterable) -> Iterator[bool]:
+        """
+        Lazily check a stream of strings.
+        
+        Args:
+            texts (Iterable): Strings to check
+            
+        Yields:
+            bool: Whether each string is a pangram
+        """
+        return map(self.is_pangram, texts)
+
+
+class PangramBatch:
+    """
+    Results of is_pangram_many: one byte per input (1 for a pangram) and timing.
+    
+    Attributes:
+        flags (bytearray): 1 where the input at that position is a pangram, else 0
+        seconds (float): Wall-clock time the batch took
+    """
+    
+    def __init__(self, flags: bytearray, seconds: float):
+        self.flags = flags
+        self.seconds = seconds
+    
+    def __len__(self) -> int:
+        return len(self.flags)
+    
+    def __getitem__(self, index: int) -> bool:
+        return bool(self.flags[index])
+    
+    def __iter__(self) -> Iterator[bool]:
+        return map(bool, self.flags)
+    
+    @property
+    def pangrams(self) -> int:
+        """Number of inputs that are pangrams."""
+        return self.flags.count(1)
+    
+    @property
+    def per_second(self) -> float:
+        """Throughput in inputs per second."""
+        return len(self.flags) / self.seconds if self.seconds > 0 else float("inf")
+
+
+def is_pangram_many(texts: Iterable, alphabet: str = string.ascii_lowercase, workers: int = 1,
+                    batch_size: int = 10000) -> PangramBatch:
+    """
+    Check many strings against one alphabet, compiling the alphabet only once.
+    
+    The inputs are consumed lazily in batches of batch_size. With more than one worker,
+    batches are checked in a process pool while later batches are still being read, with
+    at most two batches per worker in flight, so memory stays bounded for any number of
+    inputs.
+    
+    Args:
+        texts (Iterable): Strings to check
+        alphabet (str): The set of characters to check for (default: English lowercase
+            letters)
+        workers (int): Number of worker processes; 1 checks in this process and None
+            uses the CPU count (default: 1)
+        batch_size (int): Number of strings per batch (default: 10000)
+        
+    Returns:
+        PangramBatch: One flag per input, in input order, and the throughput
+        
+    Raises:
+        TypeError: If alphabet or any input is not a string
+        ValueError: If batch_size is not positive
+    """
+    if batch_size < 1:
+        raise ValueError("Batch size must be a positive integer")
+    checker = compile_alphabet(alphabet)
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    flags = bytearray()
+    if workers == 1:
+        flags.extend(checker.check_many(texts))
+        return PangramBatch(flags, time.perf_counter() - start)
+    
+    iterator = iter(texts)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if batch:
+                pending.append(pool.submit(_check_batch, alphabet, batch))
+            if pending and (not batch or len(pending) >= 2 * workers):
+                flags.extend(pending.popleft().result())
+            elif not batch:
+                break
+    return PangramBatch(flags, time.perf_counter() - start)
+
+
+def _check_batch(alphabet: str, texts: list) -> bytes:
+    """Check a batch of strings (runs in a worker process)."""
+    return bytes(compile_alphabet(alphabet).check_many(texts))
+
+
+class PangramScan:
+    """
+    Result of scanning a stream or file: whether it is a pangram, and where.
+    
+    The object is truthy exactly when the input is a pangram, so it can be used like
+    the bool returned by is_pangram.
+    
+    Attributes:
+        missing (frozenset): Required letters that were not found
+        first_seen (dict): Offset at which each found letter first occurred, in
+            characters for text streams and in bytes for byte streams and files
+    """
+    
+    def __init__(self, missing: frozenset, first_seen: Dict[str, int]):
+        self.missing = missing
+        self.first_seen = first_seen
+    
+    def __bool__(self) -> bool:
+        return not self.missing
+    
+    def __repr__(self) -> str:
+        return f"PangramScan(missing={sorted(self.missing)!r}, first_seen={self.first_seen!r})"
+
+
+class _StreamScanner:
+    """
+    Finds the letters of an alphabet in text fed piece by piece, recording first offsets.
+    
+    Every piece is lowercased on its own, which matches lowercasing the whole text
+    except for "Σ". When the alphabet contains σ or ς, a piece whose end is near a "Σ"
+    is held back until the next one arrives, and "Σ" is lowercased with the
+    surrounding characters as context.
+    """
+    
+    def __init__(self, checker: PangramChecker):
+        self.required = checker.required
+        self.missing = {letter for letter in self.required if len(letter) == 1}
+        self.first_seen = {}
+        self._contextual = not self.missing.isdisjoint(_SIGMA_FORMS)
+        self._behind = ""
+        self._pending = ""
+        self._pending_start = 0
+    
+    @property
+    def is_complete(self) -> bool:
+        return len(self.first_seen) == len(self.required)
+    
+    def feed(self, text: str, start: int, measure: Callable[[str], int] = len, final: bool = False) -> bool:
+        """
+        Scan the next piece of text.
+        
+        Args:
+            text: The next piece of the input
+            start: Offset of text[0] in the caller's units
+            measure: Returns the length of a piece of text in the caller's units
+            final: Whether this is the last piece, so nothing may be held back
+            
+        Returns:
+            bool: Whether every letter has been seen
+        """
+        if self._pending:
+            text, start = self._pending + text, self._pending_start
+            self._pending = ""
+        if self._contextual and not final and "Σ" in text[-_SIGMA_CONTEXT_CHARS:]:
+            cut = max(0, len(text) - _SIGMA_CONTEXT_CHARS)
+            self._pending = text[cut:]
+            self._pending_start = start + measure(text[:cut])
+            text = text[:cut]
+        if not text or not self.missing:
+            return self.is_complete
+        
+        lowered = self._lower(text)
+        if len(self.missing) > _SEARCH_MAX_LETTERS:
+            found = self.missing.intersection(lowered)
+        else:
+            found = [letter for letter in self.missing if letter in lowered]
+        for letter in found:
+            index = lowered.index(letter)
+            if len(lowered) != len(text):
+                index = _original_index(text, index)
+            self.first_seen[letter] = start + measure(text[:index])
+            self.missing.discard(letter)
+        if self._contextual:
+            self._behind = (self._behind + text)[-_SIGMA_CONTEXT_CHARS:]
+        return self.is_complete
+    
+    def _lower(self, text: str) -> str:
+        """Lowercase text as it would be lowercased within the whole input."""
+        if not self._contextual or "Σ" not in text:
+            return text.lower()
+        # The lowercase form of every character has the same length in any context
+        whole = (self._behind + text + self._pending).lower()
+        offset = len(self._behind.lower())
+        return whole[offset:offset + len(text.lower())]
+
+
+def _original_index(text: str, lowered_index: int) -> int:
+    """Map an index into text.lower() back to the character of text it came from."""
+    position = 0
+    for index, char in enumerate(text):
+        position += len(char.lower())
+        if position > lowered_index:
+            return index
+    return len(text)
+
+
+class PangramTracker:
+    """
+    Watches a growing text and tells the moment it becomes a pangram.
+    
+    Each feed only scans the new text, so watching a stream costs O(total length)
+    overall instead of calling is_pangram on the whole text after every piece. The
+    answers match is_pangram on everything fed since the last reset, except that a "Σ"
+    within the last 64 characters fed is only counted once more text arrives, when the
+    alphabet contains σ or ς.
+    
+    Attributes:
+        checker (PangramChecker): The compiled alphabet
+        position (int): Number of characters fed since the last reset
+    """
+    
+    def __init__(self, alphabet: str = string.ascii_lowercase):
+        """
+        Initialize the tracker.
+        
+        Args:
+            alphabet (str): The set of characters to check for (default: English
+                lowercase letters)
+                
+        Raises:
+            TypeError: If alphabet is not a string
+        """
+        self.checker = compile_alphabet(alphabet)
+        self.reset()
+    
+    def feed(self, text: str) -> bool:
+        """
+        Add text to the stream.
+        
+        Args:
+            text (str): The next piece of the stream
+            
+        Returns:
+            bool: Whether the stream is now a pangram
+            
+        Raises:
+            TypeError: If text is not a string
+        """
+        if not isinstance(text, str):
+            raise TypeError("Input must be a string")
+        complete = self._scanner.feed(text, self.position)
+        self.position += len(text)
+        return complete
+    
+    @property
+    def is_complete(self) -> bool:
+        """Whether every letter has been seen since the last reset."""
+        return self._scanner.is_complete
+    
+    @property
+    def first_seen(self) -> Dict[str, int]:
+        """Character offset at which each letter seen so far first occurred."""
+        return dict(self._scanner.first_seen)
+    
+    def missing(self) -> frozenset:
+        """Return the letters not seen since the last reset."""
+        return frozenset(self.checker.required - self._scanner.first_seen.keys())
+    
+    def reset(self) -> None:
+        """Forget everything fed so far."""
+        self._scanner = _StreamScanner(self.checker)
+        self.position = 0
+
+
+class SlidingPangramTracker:
+    """
+    Tells whether the last window characters of a stream form a pangram.
+    
+    A count per letter of the alphabet is kept for the characters in the window and
+    updated as characters enter and leave it, so each character costs O(1) no matter
+    how large the window is. Each character is lowercased on its own, so "Σ" always
+    counts as "σ"; otherwise the answers match is_pangram on the last window characters.
+    
+    Attributes:
+        checker (PangramChecker): The compiled alphabet
+        window (int): Number of most recent characters considered
+    """
+    
+    def __init__(self, window: int, alphabet: str = string.ascii_lowercase):
+        """
+        Initialize the tracker.
+        
+        Args:
+            window (int): Number of most recent characters considered
+            alphabet (str): The set of characters to check for (default: English
+                lowercase letters)
+                
+        Raises:
+            TypeError: If alphabet is not a string
+            ValueError: If window is not a positive integer
+        """
+        if window < 1:
+            raise ValueError("Window must be a positive integer")
+        self.window = window
+        self.checker = compile_alphabet(alphabet)
+        self.reset()
+    
+    def feed(self, text: str) -> bool:
+        """
+        Add text to the stream.
+        
+        Args:
+            text (str): The next piece of the stream
+            
+        Returns:
+            bool: Whether the last window characters are now a pangram
+            
+        Raises:
+            TypeError: If text is not a string
+        """
+        if not isinstance(text, str):
+            raise TypeError("Input must be a string")
+        if len(text) >= self.window:
+            # Only the last window characters can still be in the window
+            self.reset()
+            text = text[-self.window:]
+        lowered = text.lower()
+        if len(lowered) != len(text) or "Σ" in text:
+            lowered = [char.lower() for char in text]
+        
+        counts, chars, window = self._counts, self._chars, self.window
+        for low in lowered:
+            chars.append(low)
+            for letter in low:
+                count = counts.get(letter)
+                if count is not None:
+                    counts[letter] = count + 1
+                    if not count:
+                        self._present += 1
+            if len(chars) > window:
+                for letter in chars.popleft():
+                    count = counts.get(letter)
+                    if count is not None:
+                        counts[letter] = count - 1
+                        if count == 1:
+                            self._present -= 1
+        return self.is_complete
+    
+    @property
+    def is_complete(self) -> bool:
+        """Whether the last window characters contain every letter."""
+        return self._present == len(self.checker.required)
+    
+    def missing(self) -> frozenset:
+        """Return the letters missing from the last window characters."""
+        return frozenset(letter for letter in self.checker.required if not self._counts.get(letter))
+    
+    def reset(self) -> None:
+        """Forget everything fed so far."""
+        self._counts = {letter: 0 for letter in self.checker.required if len(letter) == 1}
+        self._chars = deque()
+        self._present = 0
+
+
+def is_pangram_stream(chunks: Iterable, alphabet: str = string.ascii_lowercase,
+                      encoding: str = None) -> PangramScan:
+    """
+    Check whether a stream of text chunks is a pangram without joining the chunks.
+    
+    Chunks are read only until every letter has been seen. Chunks may be str, or bytes
+    when an encoding is given; multi-byte characters may be split across byte chunks.
+    
+    Args:
+        chunks (Iterable): Pieces of the input, in order
+        alphabet (str): The set of characters to check for (default: English lowercase
+            letters)
+        encoding (str, optional): Encoding of bytes chunks. Offsets are then in bytes.
+        
+    Returns:
+        PangramScan: Truthy for a pangram, with the missing letters and the offset at
+        which each letter was first seen
+        
+    Raises:
+        TypeError: If alphabet is not a string, or a chunk is not str (bytes with an
+            encoding)
+    """
+    if not isinstance(alphabet, str):
+        raise TypeError("Input must be a string")
+    scanner = _StreamScanner(compile_alphabet(alphabet))
+    if encoding is None:
+        position = 0
+        for chunk in chunks:
+            if not isinstance(chunk, str):
+                raise TypeError("Chunks must be strings unless an encoding is given")
+            if scanner.feed(chunk, position):
+                break
+            position += len(chunk)
+        else:
+            scanner.feed("", position, final=True)
+    else:
+        _scan_bytes(scanner, chunks, encoding)
+    return PangramScan(frozenset(scanner.required - scanner.first_seen.keys()), scanner.first_seen)
+
+
+def is_pangram_file(path: str, alphabet: str = string.ascii_lowercase, encoding: str = "utf-8",
+                    block_size: int = _FILE_BLOCK_BYTES) -> PangramScan:
+    """
+    Check whether a text file is a pangram, reading it in blocks.
+    
+    Reading stops as soon as every letter has been seen, and only one block is held in
+    memory at a time.
+    
+    Args:
+        path (str): Path of the file
+        alphabet (str): The set of characters to check for (default: English lowercase
+            letters)
+        encoding (str): Encoding of the file (default: "utf-8")
+        block_size (int): Number of bytes read at a time (default: 64 KiB)
+        
+    Returns:
+        PangramScan: Truthy for a pangram, with the missing letters and the byte offset
+        at which each letter was first seen
+        
+    Raises:
+        TypeError: If alphabet is not a string
+        ValueError: If block_size is not positive
+    """
+    if block_size < 1:
+        raise ValueError("Block size must be a positive integer")
+    with open(path, "rb") as f:
+        return is_pangram_stream(iter(lambda: f.read(block_size), b""), alphabet, encoding)
+
+
+def _scan_bytes(scanner: _StreamScanner, chunks: Iterable, encoding: str) -> None:
+    """Decode byte chunks incrementally and feed them to scanner with byte offsets."""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    marker = len("".encode(encoding))  # Byte-order mark written by encode(), if any
+    
+    def measure(text):
+        return len(text.encode(encoding)) - marker
+    
+    position = 0
+    for chunk in chunks:
+        buffered = len(decoder.getstate()[0])
+        text = decoder.decode(chunk)
+        start = position
+        # Bytes decoded into text, including any that were buffered from the last chunk
+        position += buffered + len(chunk) - len(decoder.getstate()[0])
+        if start == 0 and text:
+            # The first text starts after any byte-order mark the decoder skipped
+            start = position - measure(text)
+        if scanner.feed(text, start, measure):
+            return
+    scanner.feed(decoder.decode(b"", final=True), position, measure, final=True)
+
+
+class _WindowSearch:
+    """
+    Finds the minimal pangram windows of text fed piece by piece.
+    
+    For every position j, the shortest pangram ending at j starts at the smallest of the
+    last positions of the letters. The last positions are kept in an OrderedDict sorted
+    by position, so that smallest one is always first and each character is handled in
+    O(1) time with O(|alphabet|) memory. The window ending at j is minimal exactly when
+    its start moved forward, since otherwise a shorter one ends before j.
+    """
+    
+    def __init__(self, checker: PangramChecker):
+        self._letters = frozenset(letter for letter in checker.required if len(letter) == 1)
+        self._possible = len(self._letters) == len(checker.required)
+        self._last = OrderedDict()
+        self._start = -1
+        self.position = 0
+    
+    def feed(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Yield the (start, end) offsets of the minimal windows ending within text."""
+        position = self.position
+        self.position += len(text)
+        if not self._possible:
+            return
+        lowered = text.lower()
+        if len(lowered) != len(text) or "Σ" in text:
+            lowered = [char.lower() for char in text]
+        letters, last, needed = self._letters, self._last, len(self._letters)
+        for index, low in enumerate(lowered, position):
+            if len(low) == 1:
+                if low not in letters:
+                    continue
+                last[low] = index
+                last.move_to_end(low)
+            else:
+                found = [letter for letter in low if letter in letters]
+                if not found:
+                    continue
+                for letter in found:
+                    last[letter] = index
+                    last.move_to_end(letter)
+            if len(last) == needed:
+                start = next(iter(last.values()))
+                if start > self._start:
+                    self._start = start
+                    yield start, index + 1
+
+
+def minimal_pangram_windows(input_string: str, alphabet: str = string.ascii_lowercase) -> Iterator[Tuple[int, int]]:
+    """
+    Enumerate the minimal substrings that are pangrams.
+    
+    A window is minimal when it is a pangram but no shorter substring inside it is.
+    Characters are lowercased one at a time, as is_pangram does with the whole input
+    except that "Σ" always counts as "σ". The search takes O(n) time and O(m) memory for
+    an input of n characters and an alphabet of m letters. For an alphabet without
+    letters, only the empty window (0, 0) is reported.
+    
+    Args:
+        input_string: The string to search
+        alphabet: The set of characters to check for (default: English lowercase letters)
+        
+    Yields:
+        tuple: (start, end) offsets of each minimal window, so that
+        input_string[start:end] is a pangram, in increasing order
+        
+    Raises:
+        TypeError: If input_string or alphabet is not a string
+    """
+    if not isinstance(input_string, str) or not isinstance(alphabet, str):
+        raise TypeError("Input must be a string")
+    return minimal_pangram_windows_stream([input_string], alphabet)
+
+
+def shortest_pangram_window(input_string: str,
+                            alphabet: str = string.ascii_lowercase) -> Optional[Tuple[int, int]]:
+    """
+    Find the shortest substring that is a pangram.
+    
+    Args:
+        input_string: The string to search
+        alphabet: The set of characters to check for (default: English lowercase letters)
+        
+    Returns:
+        tuple: (start, end) offsets of the first shortest window, or None if the input
+        is not a pangram
+        
+    Raises:
+        TypeError: If input_string or alphabet is not a string
+    """
+    return _shortest(minimal_pangram_windows(input_string, alphabet))
+
+
+def minimal_pangram_windows_stream(chunks: Iterable, alphabet: str = string.ascii_lowercase) -> Iterator[Tuple[int, int]]:
+    """
+    Enumerate the minimal pangram windows of a stream of text chunks.
+    
+    Windows are yielded as soon as the chunk completing them has been read, with offsets
+    counted in characters from the start of the stream. Chunks are not kept, so memory
+    stays O(m) for an alphabet of m letters however long the stream is.
+    
+    Args:
+        chunks (Iterable): Pieces of the input, in order
+        alphabet (str): The set of characters to check for (default: English lowercase
+            letters)
+        
+    Yields:
+        tuple: (start, end) offsets of each minimal window, in increasing order
+        
+    Raises:
+        TypeError: If alphabet or a chunk is not a string
+    """
+    return _search_windows(chunks, compile_alphabet(alphabet))
+
+
+def _search_windows(chunks: Iterable, checker: PangramChecker) -> Iterator[Tuple[int, int]]:
+    if not checker.required:
+        # Every string, even an empty one, is a pangram of an alphabet without letters
+        yield 0, 0
+        return
+    search = _WindowSearch(checker)
+    for chunk in chunks:
+        if not isinstance(chunk, str):
+            raise TypeError("Input must be a string")
+        yield from search.feed(chunk)
+
+
+def shortest_pangram_window_stream(chunks: Iterable,
+                                   alphabet: str = string.ascii_lowercase) -> Optional[Tuple[int, int]]:
+    """
+    Find the shortest pangram window of a stream of text chunks.
+    
+    Args:
+        chunks (Iterable): Pieces of the input, in order
+        alphabet (str): The set of characters to check for (default: English lowercase
+            letters)
+        
+    Returns:
+        tuple: (start, end) offsets of the first shortest window, or None if the stream
+        is not a pangram
+        
+    Raises:
+        TypeError: If alphabet or a chunk is not a string
+    """
+    return _shortest(minimal_pangram_windows_stream(chunks, alphabet))
+
+
+def _shortest(windows: Iterable) -> Optional[Tuple[int, int]]:
+    best = None
+    for start, end in windows:
+        if best is None or end - start < best[1] - best[0]:
+            best = (start, end)
+    return best
+
 
 # Alias for backward compatibility
 ispangram = is_pangram
@@ -1,8 +1,14 @@
 import pytest
+import random
+import re
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
-from project_1.word_counter import WordCounter
+from project_1.word_counter import (
+    WordCounter, ApproximateWordCounter, CompactWordCounter, SpaceSaving, WindowedWordCounter, WordCountSnapshot,
+    count_file_parallel, count_text_parallel, count_words
+)
+from project_1 import word_counter
 
 class TestWordCounter:
     def test_initialization(self):
@@ -101,5 +107,393 @@ class TestWordCounter:
         assert "right" in words
         assert "user@example.com" not in words  # Should be split
 
+    def test_top_words_index_matches_full_sort(self):
+        """Test that the incremental index returns the same ordering as a full sort"""
+        rng = random.Random(42)
+        counter = WordCounter()
+        vocabulary = ["w" + chr(97 + i % 26) * (i // 26 + 1) for i in range(50)]
+        for step in range(2000):
+            counter.process_word(rng.choice(vocabulary[:rng.randint(1, 50)]))
+            if step % 97 == 0:
+                counter.process_text("alpha beta alpha gamma")
+                expected = sorted(counter.word_counts.items(), key=lambda x: (-x[1], x[0]))
+                for n in (0, 1, 5, 20, 100):
+                    assert counter.get_top_words(n) == expected[:n]
+
+    def test_count_words_matches_per_token_cleanup(self):
+        """Test that the bulk tokenizer matches cleaning every token one by one"""
+        text = ("It's 'quoted' don't_stop x2y 42 ''' __ Ünïcödé İstanbul naïve "
+                "user@example.com O'Neil's rock'n'roll KELVINK end's ") * 3
+        expected = {}
+        for word in re.findall(r"\b[\w']+\b", text.lower()):
+            clean_word = re.sub(r"[^a-z']", '', word)
+            if clean_word and any(c.isalpha() for c in clean_word):
+                expected[clean_word] = expected.get(clean_word, 0) + 1
+        assert count_words(text) == expected
+
+class TestStreaming:
+    TEXT = ("It's a café-day; don't split 'quoted' words, user@example.com, "
+            "naïve_coders and 42 numbers! Ünïcödé ΑΣ test's end ") * 20
+    
+    def _expected(self):
+        counter = WordCounter()
+        counter.process_text(self.TEXT)
+        return counter.word_counts
+    
+    def test_stream_matches_process_text(self):
+        """Test that words split across chunk boundaries are counted once"""
+        for size in (1, 2, 3, 7, 64, 10000):
+            chunks = [self.TEXT[i:i + size] for i in range(0, len(self.TEXT), size)]
+            counter = WordCounter()
+            counter.process_stream(chunks)
+            assert counter.word_counts == self._expected()
+    
+    def test_stream_decodes_split_bytes(self):
+        """Test that multi-byte characters split across bytes chunks are decoded"""
+        data = self.TEXT.encode("utf-8")
+        counter = WordCounter()
+        counter.process_stream(data[i:i + 5] for i in range(0, len(data), 5))
+        assert counter.word_counts == self._expected()
+    
+    def test_process_file(self, tmp_path):
+        """Test processing a memory-mapped file in small chunks"""
+        path = tmp_path / "corpus.txt"
+        path.write_text(self.TEXT, encoding="utf-8")
+        counter = WordCounter()
+        counter.process_file(str(path), chunk_size=11)
+        assert counter.word_counts == self._expected()
+        
+        empty = tmp_path / "empty.txt"
+        empty.write_text("")
+        counter = WordCounter()
+        counter.process_file(str(empty))
+        assert counter.get_top_words() == []
+
+class TestMergeAndParallel:
+    TEXT = "The cat sat. The dog's bone! Über naïve words, don't stop; the end.\n" * 50
+    
+    def test_merge_and_add(self):
+        """Test that merged counters equal a single counter over both inputs"""
+        first, second, combined = WordCounter(), WordCounter(), WordCounter()
+        first.process_text("apple banana apple")
+        second.process_text("banana cherry banana")
+        combined.process_text("apple banana apple banana cherry banana")
+        
+        total = first + second
+        assert total.word_counts == combined.word_counts
+        assert total.get_top_words() == combined.get_top_words()
+        assert first.word_counts == {"apple": 2, "banana": 1}  # __add__ leaves operands alone
+        
+        first.merge(second)
+        assert first.get_top_words() == combined.get_top_words()
+    
+    def test_merge_rejects_other_kinds(self):
+        """Test that exact and approximate counters cannot be mixed"""
+        with pytest.raises(TypeError):
+            WordCounter().merge(ApproximateWordCounter())
+    
+    def test_merge_approximate(self):
+        """Test that merged summaries keep valid error bounds"""
+        rng = random.Random(1)
+        words = [rng.choice("abcdefghij") * rng.randint(1, 3) for _ in range(2000)]
+        first, second = ApproximateWordCounter(capacity=8), ApproximateWordCounter(capacity=8)
+        for word in words[:1000]:
+            first.process_word(word)
+        for word in words[1000:]:
+            second.process_word(word)
+        
+        merged = first + second
+        assert len(merged.word_counts) <= 8
+        for word, count, error in merged.get_top_words(8):
+            assert count - error <= words.count(word) <= count
+    
+    def test_parallel_text_matches_single_process(self):
+        """Test that sharded counting gives identical results"""
+        expected = WordCounter()
+        expected.process_text(self.TEXT)
+        for workers in (1, 3):
+            counter = count_text_parallel(self.TEXT, workers=workers, min_shard_size=1)
+            assert counter.word_counts == expected.word_counts
+            assert counter.get_top_words() == expected.get_top_words()
+    
+    def test_parallel_file_matches_single_process(self, tmp_path):
+        """Test that file shards split on word boundaries"""
+        path = tmp_path / "corpus.txt"
+        path.write_text(self.TEXT, encoding="utf-8")
+        expected = WordCounter()
+        expected.process_text(self.TEXT)
+        counter = count_file_parallel(str(path), workers=4, min_shard_size=1)
+        assert counter.word_counts == expected.word_counts
+    
+    def test_parallel_runs_inline_for_one_shard(self, tmp_path, monkeypatch):
+        """Test that inputs smaller than one shard are counted without a process pool"""
+        def no_pool(*args, **kwargs):
+            raise AssertionError("process pool started")
+        monkeypatch.setattr(word_counter, "ProcessPoolExecutor", no_pool)
+        path = tmp_path / "corpus.txt"
+        path.write_text(self.TEXT, encoding="utf-8")
+        (tmp_path / "empty.txt").write_text("")
+        expected = WordCounter()
+        expected.process_text(self.TEXT)
+        
+        assert count_text_parallel(self.TEXT, workers=4).word_counts == expected.word_counts
+        assert count_file_parallel(str(path), workers=4).word_counts == expected.word_counts
+        assert count_text_parallel(self.TEXT * 8, workers=1, min_shard_size=1).get_top_words(1) == \
+            [(word, count * 8) for word, count in expected.get_top_words(1)]
+        assert count_file_parallel(str(tmp_path / "empty.txt"), workers=4).word_counts == {}
+        with pytest.raises(ValueError):
+            count_text_parallel(self.TEXT, min_shard_size=0)
+
+class TestCompactWordCounter:
+    def test_matches_dict_backend(self):
+        """Test that the compact backend gives the same counts and ordering"""
+        rng = random.Random(3)
+        exact, compact = WordCounter(), CompactWordCounter()
+        for _ in range(3000):
+            word = "".join(rng.choice("abcdé") for _ in range(rng.randint(1, 4)))
+            exact.process_word(word)
+            compact.process_word(word)
+        text = "It's a test. This is only a test, naïve reader!"
+        exact.process_text(text)
+        compact.process_text(text)
+        
+        assert dict(compact.word_counts.items()) == exact.word_counts
+        assert len(compact.word_counts) == len(exact.word_counts)
+        for n in (0, 1, 10, 1000):
+            assert compact.get_top_words(n) == exact.get_top_words(n)
+    
+    def test_word_counts_view(self):
+        """Test the read-only mapping exposed as word_counts"""
+        counter = CompactWordCounter()
+        counter.process_text("apple banana apple")
+        assert counter.word_counts["apple"] == 2
+        assert "cherry" not in counter.word_counts
+        with pytest.raises(KeyError):
+            counter.word_counts["cherry"]
+        assert sorted(counter.word_counts) == ["apple", "banana"]
+    
+    def test_merge_and_save(self, tmp_path):
+        """Test that compact counters merge and save like dict counters"""
+        first, second = CompactWordCounter(), CompactWordCounter()
+        first.process_text("one two two")
+        second.process_text("two three")
+        total = first + second
+        assert total.get_top_words() == [("two", 3), ("one", 1), ("three", 1)]
+        
+        path = str(tmp_path / "compact.wcs")
+        total.save(path)
+        with WordCounter.load(path) as snapshot:
+            assert snapshot.get_top_words() == total.get_top_words()
+
+class TestSnapshot:
+    def test_save_and_load(self, tmp_path):
+        """Test lookups and top-n queries straight from a saved snapshot"""
+        path = str(tmp_path / "counts.wcs")
+        counter = WordCounter()
+        counter.process_text("the cat and the hat and the naïve bat zebra")
+        counter.save(path)
+        
+        with WordCounter.load(path) as snapshot:
+            assert snapshot.get("the") == 3
+            assert snapshot.get("nave") == 1
+            assert snapshot.get("missing") == 0
+            assert "cat" in snapshot and "dog" not in snapshot
+            for n in (0, 1, 3, 100):
+                assert snapshot.get_top_words(n) == counter.get_top_words(n)
+            assert dict(snapshot.items()) == counter.word_counts
+            assert snapshot.to_counter().get_top_words() == counter.get_top_words()
+    
+    def test_append_segments(self, tmp_path):
+        """Test that appended segments are summed and ranked exactly"""
+        path = str(tmp_path / "counts.wcs")
+        rng = random.Random(7)
+        combined = WordCounter()
+        for batch in range(4):
+            counter = WordCounter()
+            for _ in range(300):
+                counter.process_word(rng.choice("abcdefghijklmnopqrstuvwxyz") * rng.randint(1, 2))
+            counter.save(path, append=batch > 0)
+            combined.merge(counter)
+        
+        with WordCountSnapshot(path) as snapshot:
+            assert dict(snapshot.items()) == combined.word_counts
+            for n in (1, 5, 20, 100):
+                assert snapshot.get_top_words(n) == combined.get_top_words(n)
+    
+    @pytest.mark.parametrize("counter_type", [WordCounter, CompactWordCounter, ApproximateWordCounter])
+    def test_append_from_same_counter(self, tmp_path, counter_type):
+        """Test that appending again from the same counter only adds the new counts"""
+        path = str(tmp_path / "counts.wcs")
+        counter = counter_type()
+        counter.process_text("a")
+        counter.save(path)
+        counter.process_text("b a")
+        counter.save(path, append=True)
+        counter.save(path, append=True)
+        counter.process_text("c")
+        counter.save(path, append=True)
+        with WordCountSnapshot(path) as snapshot:
+            assert dict(snapshot.items()) == {"a": 2, "b": 1, "c": 1}
+            reloaded = snapshot.to_counter()
+
+        # A counter loaded from the snapshot only appends what is added after loading
+        reloaded.process_text("b")
+        reloaded.save(path, append=True)
+        with WordCountSnapshot(path) as snapshot:
+            assert dict(snapshot.items()) == {"a": 2, "b": 2, "c": 1}
+
+        # A full save rewrites every count and starts a new delta
+        counter.save(path)
+        counter.process_text("c")
+        counter.save(path, append=True)
+        with WordCountSnapshot(path) as snapshot:
+            assert dict(snapshot.items()) == {"a": 2, "b": 1, "c": 2}
+
+    @pytest.mark.parametrize("counter_type", [WordCounter, CompactWordCounter, ApproximateWordCounter])
+    def test_append_across_paths(self, tmp_path, counter_type):
+        """Test that the counts appended to each path are tracked separately"""
+        path_a, path_b = str(tmp_path / "a.wcs"), str(tmp_path / "b.wcs")
+        counter = counter_type()
+        counter.process_text("x")
+        counter.save(path_a)
+        counter.process_text("z")
+        counter.save(path_b)
+        counter.process_text("w")
+        counter.save(path_a, append=True)
+        counter.process_text("x")
+        counter.save(path_b, append=True)
+        with WordCountSnapshot(path_a) as snapshot:
+            assert dict(snapshot.items()) == {"x": 1, "z": 1, "w": 1}
+        with WordCountSnapshot(path_b) as snapshot:
+            assert dict(snapshot.items()) == {"x": 2, "z": 1, "w": 1}
+
+    @pytest.mark.parametrize("counter_type", [WordCounter, CompactWordCounter, ApproximateWordCounter])
+    def test_append_to_new_path(self, tmp_path, counter_type):
+        """Test that appending to a file that does not exist yet writes every count"""
+        counter = counter_type()
+        counter.process_text("p q")
+        counter.save(str(tmp_path / "old.wcs"))
+        counter.process_text("r")
+        path = str(tmp_path / "new.wcs")
+        counter.save(path, append=True)
+        with WordCountSnapshot(path) as snapshot:
+            assert dict(snapshot.items()) == {"p": 1, "q": 1, "r": 1}
+
+    def test_append_keeps_approximate_memory_bound(self, tmp_path):
+        """Test that appends from a sketch do not remember more words than its capacity"""
+        path = str(tmp_path / "counts.wcs")
+        counter = ApproximateWordCounter(capacity=5)
+        counter.save(path)
+        for i in range(1000):
+            counter.process_word(f"word{i}")
+        counter.save(path, append=True)
+        assert all(len(state) <= 5 for state in counter._saved.values())
+        with WordCountSnapshot(path) as snapshot:
+            assert sum(count for _, count in snapshot.items()) == sum(counter.word_counts.values())
+
+    def test_empty_and_invalid(self, tmp_path):
+        """Test empty snapshots and files that are not snapshots"""
+        path = str(tmp_path / "empty.wcs")
+        WordCounter().save(path)
+        with WordCounter.load(path) as snapshot:
+            assert snapshot.get_top_words() == []
+            assert list(snapshot.items()) == []
+        
+        bogus = tmp_path / "bogus.wcs"
+        bogus.write_bytes(b"not a snapshot at all")
+        with pytest.raises(ValueError):
+            WordCounter.load(str(bogus))
+
+class TestWindowedWordCounter:
+    def test_message_window(self):
+        """Test that only the last N messages are counted"""
+        counter = WindowedWordCounter(window=3, buckets=3, clock=None)
+        messages = ["red green", "red blue", "blue blue", "green", "green yellow"]
+        for i, message in enumerate(messages):
+            counter.process_text(message)
+            expected = WordCounter()
+            for recent in messages[max(0, i - 2):i + 1]:
+                expected.process_text(recent)
+            assert counter.word_counts == expected.word_counts
+            assert counter.get_top_words() == expected.get_top_words()
+    
+    def test_time_window(self):
+        """Test that buckets expire with the clock and the whole window can lapse"""
+        now = [0.0]
+        counter = WindowedWordCounter(window=60, buckets=6, clock=lambda: now[0])
+        counter.process_text("alpha beta")
+        now[0] = 25
+        counter.process_text("beta gamma")
+        assert counter.get_top_words() == [("beta", 2), ("alpha", 1), ("gamma", 1)]
+        
+        now[0] = 65  # The bucket holding the first message has expired
+        assert counter.get_top_words() == [("beta", 1), ("gamma", 1)]
+        
+        now[0] = 500  # Everything has expired
+        assert counter.get_top_words() == []
+        assert counter.word_counts == {}
+        counter.process_word("Delta")
+        assert counter.get_top_words() == [("delta", 1)]
+    
+    def test_top_words_while_counts_fall(self):
+        """Test partial reads of large buckets while words expire and come back"""
+        rng = random.Random(3)
+        vocabulary = [a + b for a in "abcdefghijklmnopqrst" for b in "uvwxyz"]
+        counter = WindowedWordCounter(window=20, buckets=4, clock=None)
+        for _ in range(400):
+            counter.process_text(" ".join(rng.choices(vocabulary, k=rng.randint(1, 40))))
+            expected = sorted(counter.word_counts.items(), key=lambda x: (-x[1], x[0]))
+            for n in (1, 3, 10, 50):
+                assert counter.get_top_words(n) == expected[:n]
+
+    def test_invalid_window(self):
+        """Test that invalid window settings raise errors"""
+        with pytest.raises(ValueError):
+            WindowedWordCounter(window=0)
+        with pytest.raises(ValueError):
+            WindowedWordCounter(buckets=0)
+        with pytest.raises(TypeError):
+            WindowedWordCounter().merge(WindowedWordCounter())
+
+class TestApproximateWordCounter:
+    def test_matches_exact_counts_within_capacity(self):
+        """Test that counts are exact while the vocabulary fits in the capacity"""
+        text = "the cat and the hat and the bat"
+        exact = WordCounter()
+        exact.process_text(text)
+        approx = ApproximateWordCounter(capacity=10)
+        approx.process_text(text)
+        
+        assert [(w, c) for w, c, _ in approx.get_top_words()] == exact.get_top_words()
+        assert all(error == 0 for _, _, error in approx.get_top_words())
+    
+    def test_memory_bounded_by_capacity(self):
+        """Test that no more than capacity words are ever monitored"""
+        counter = ApproximateWordCounter(n=3, capacity=5)
+        for i in range(1000):
+            counter.process_word("word" + "abcdefghij"[i % 10] * (i % 7 + 1))
+        assert len(counter.word_counts) == 5
+    
+    def test_heavy_hitters_and_error_bounds(self):
+        """Test that frequent words are found and true counts lie within the bounds"""
+        words = ["common"] * 300 + ["often"] * 200
+        words += ["rare" + "abcdefghijklmnopqrstuvwxyz"[i % 26] * (i // 26 + 1) for i in range(500)]
+        random.Random(0).shuffle(words)
+        true_counts = {}
+        counter = ApproximateWordCounter(n=2, capacity=20)
+        for word in words:
+            counter.process_word(word)
+            true_counts[word] = true_counts.get(word, 0) + 1
+        
+        top = counter.get_top_words()
+        assert [word for word, _, _ in top] == ["common", "often"]
+        for word, count, error in counter.get_top_words(20):
+            assert count - error <= true_counts[word] <= count
+    
+    def test_invalid_capacity(self):
+        """Test that a non-positive capacity raises an error"""
+        with pytest.raises(ValueError):
+            SpaceSaving(0)
+
 if __name__ == "__main__":
     pytest.main()
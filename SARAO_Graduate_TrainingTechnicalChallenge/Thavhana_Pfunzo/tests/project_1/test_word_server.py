@@ -0,0 +1,151 @@
+import pytest
+import asyncio
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+from project_1.word_counter import WordCounter
+from project_1.word_server import WordCountServer, WordCountClient, run_load
+
+class TestWordCountServer:
+    def test_tcp_ingestion_and_queries(self):
+        """Test that text from several producers is counted and queryable"""
+        texts = ["The cat sat on the mat.", "The dog's bone!\nThe end", "cat CAT cat"]
+        expected = WordCounter()
+        for text in texts * 10:
+            expected.process_text(text)
+
+        async def scenario():
+            server = WordCountServer(batch_bytes=64, max_pending=4)
+            listener = await server.start_tcp("127.0.0.1", 0)
+            port = listener.sockets[0].getsockname()[1]
+
+            async def produce(text):
+                client = await WordCountClient.connect(port=port)
+                for _ in range(10):
+                    await client.send_text(text)
+                await client.flush()
+                await client.close()
+
+            await asyncio.gather(*(produce(text) for text in texts))
+            client = await WordCountClient.connect(port=port)
+            top = await client.top(5)
+            await client.close()
+            await server.close()
+            return top, server.counter
+
+        top, counter = asyncio.run(scenario())
+        assert top == expected.get_top_words(5)
+        assert counter.word_counts == expected.word_counts
+
+    def test_unix_socket_and_load_generator(self, tmp_path):
+        """Test the Unix socket transport with the load generator"""
+        path = str(tmp_path / "words.sock")
+
+        async def scenario():
+            server = WordCountServer()
+            await server.start_unix(path)
+            results = await run_load(path=path, producers=3, messages=50, words_per_message=5)
+            await server.close()
+            return results, server.counter
+
+        results, counter = asyncio.run(scenario())
+        assert results["messages"] == 150
+        assert sum(counter.word_counts.values()) == 150 * 5
+        assert results["queries"] > 0
+
+    def test_long_text_is_split(self):
+        """Test that text longer than the server's line limit is split at spaces and counted"""
+        text = " ".join(f"word{i % 100} ünïcode" for i in range(20000))
+        expected = WordCounter()
+        expected.process_text(text)
+
+        async def scenario():
+            server = WordCountServer(batch_bytes=1024, line_limit=4096)
+            listener = await server.start_tcp("127.0.0.1", 0)
+            client = await WordCountClient.connect(port=listener.sockets[0].getsockname()[1])
+            client.chunk_bytes = 1000
+            await client.send_text(text)
+            await client.send_text("x" * 3000)
+            await client.flush()
+            # A single word beyond the line limit cannot be split and is reported
+            await client.send_text("y" * 5000)
+            with pytest.raises(RuntimeError, match="line too long"):
+                await client.flush()
+            await client.close()
+            await server.close()
+            return server.counter
+
+        counter = asyncio.run(scenario())
+        expected.process_text("x" * 3000)
+        assert counter.word_counts == expected.word_counts
+
+    def test_error_replies_keep_connection_open(self):
+        """Test that overlong lines and bad commands get an ERROR reply instead of a hang-up"""
+        async def scenario():
+            server = WordCountServer(batch_bytes=64, line_limit=1024)
+            listener = await server.start_tcp("127.0.0.1", 0)
+            reader, writer = await asyncio.open_connection("127.0.0.1", listener.sockets[0].getsockname()[1])
+            writer.write(b"TEXT " + b"a " * 5000 + b"\nTOP x\nNOPE\nTOP " + b"1" * 2000 +
+                         b"\nTEXT b\nFLUSH\nTOP 5\nFLUSH\n")
+            await writer.drain()
+            replies = [await reader.readline() for _ in range(6)]
+            writer.close()
+            await server.close()
+            return replies
+
+        replies = asyncio.run(scenario())
+        assert replies[:3] == [b"ERROR invalid count\n", b"ERROR unknown command\n", b"ERROR line too long\n"]
+        assert replies[3] == b"ERROR line too long (1 TEXT lines dropped)\n"
+        assert replies[4] == b'[["b", 1]]\n'
+        assert replies[5] == b"OK\n"
+
+    def test_overlong_text_keeps_replies_in_order(self):
+        """Test that a dropped TEXT line does not shift the replies to later requests"""
+        async def scenario():
+            server = WordCountServer(batch_bytes=64, line_limit=1024)
+            listener = await server.start_tcp("127.0.0.1", 0)
+            client = await WordCountClient.connect(port=listener.sockets[0].getsockname()[1])
+            client.chunk_bytes = 1 << 20
+            await client.send_text("a " * 5000)
+            await client.send_text("b b c")
+            top = await client.top(5)
+            with pytest.raises(RuntimeError, match="1 TEXT lines dropped"):
+                await client.flush()
+            top_after = await client.top(5)
+            await client.flush()
+            # Closing the server also disconnects clients that are still connected
+            await server.close()
+            closed = await client.reader.read()
+            await client.close()
+            return top, top_after, closed
+
+        top, top_after, closed = asyncio.run(scenario())
+        assert all(count <= 2 for _, count in top)
+        assert top_after == [("b", 2), ("c", 1)]
+        assert closed == b""
+
+    def test_flush_checks_reply(self):
+        """Test that flush raises when the server does not confirm with OK"""
+        async def scenario():
+            async def handle(reader, writer):
+                await reader.readline()
+                writer.write(b"ERROR busy\n")
+                await writer.drain()
+                writer.close()
+
+            listener = await asyncio.start_server(handle, "127.0.0.1", 0)
+            client = await WordCountClient.connect(port=listener.sockets[0].getsockname()[1])
+            try:
+                with pytest.raises(RuntimeError, match="busy"):
+                    await client.flush()
+                with pytest.raises(ConnectionError):
+                    await client.flush()
+            finally:
+                await client.close()
+                listener.close()
+                await listener.wait_closed()
+
+        asyncio.run(scenario())
+
+if __name__ == "__main__":
+    pytest.main()
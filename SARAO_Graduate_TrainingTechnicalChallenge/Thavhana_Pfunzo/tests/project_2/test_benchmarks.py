@@ -0,0 +1,32 @@
+import pytest
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+from project_2.benchmarks import run_suite, compare_results
+
+class TestBenchmarkSuite:
+    def test_run_suite(self):
+        """Test that every case of a small sweep is reported"""
+        results = run_suite(windows=(5, 64), blocks=(128,), families=("uniform", "random"),
+                            process_samples=50, batch_samples=512, repeats=1)
+        assert len(results) == 2 * 2 * 2
+        assert {(r["path"], r["block"]) for r in results} == {("process", None), ("batch", 128)}
+        for result in results:
+            assert result["samples_per_second"] > 0
+            assert result["ns_per_sample"] > 0
+            assert result["peak_memory_bytes"] >= 0
+
+    def test_compare_results(self):
+        """Test that only drops beyond the threshold are reported as regressions"""
+        def case(window, speed):
+            return {"path": "batch", "family": "ramp", "window": window, "block": 1024,
+                    "samples_per_second": speed}
+        baseline = [case(5, 100.0), case(50, 100.0), case(500, 100.0)]
+        results = [case(5, 95.0), case(50, 80.0), case(500, 130.0), case(5000, 1.0)]
+        regressions = compare_results(results, baseline, threshold=0.1)
+        assert [r["window"] for r in regressions] == [50]
+        assert regressions[0]["change"] == pytest.approx(-0.2)
+        assert compare_results(results, baseline, threshold=0.25) == []
+
+if __name__ == "__main__":
+    pytest.main()
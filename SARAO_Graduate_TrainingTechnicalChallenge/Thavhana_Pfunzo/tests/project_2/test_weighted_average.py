@@ -2,8 +2,16 @@ import pytest
 import numpy as np
 import sys
 import os
+from collections import deque
+from decimal import Decimal
+from fractions import Fraction
 sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
-from project_2.weighted_average import WeightedAverage, generate_sine_wave
+from project_2.weighted_average import (
+    WeightedAverage, MultiChannelWeightedAverage, generate_sine_wave, choose_convolution_method,
+    sine_wave_blocks, iter_blocks, write_blocks, collect_blocks, filter_file,
+    sine_wave, multi_tone, chirp, noise, cached_sine_wave
+)
+from project_2 import weighted_average
 
 class TestWeightedAverage:
     def test_initialization(self):
@@ -105,6 +113,190 @@ class TestWeightedAverage:
         period = samples / frequency
         assert np.allclose(wave[0], wave[int(period)], atol=1e-10)
 
+class TestProcessBatch:
+    def test_matches_process(self):
+        """Test that batch output matches sample-by-sample processing"""
+        rng = np.random.default_rng(0)
+        weights = list(rng.normal(size=7))
+        signal = rng.normal(size=500)
+        
+        wa = WeightedAverage(weights)
+        expected = [wa.process(x) for x in signal]
+        
+        wa = WeightedAverage(weights)
+        blocks = [signal[:1], signal[1:4], signal[4:200], signal[200:]]
+        result = np.concatenate([wa.process_batch(block) for block in blocks])
+        assert np.allclose(result, expected, rtol=1e-12, atol=1e-12)
+    
+    def test_mixed_with_process(self):
+        """Test that state is shared between process and process_batch"""
+        weights = [0.5, 0.3, 0.2]
+        wa = WeightedAverage(weights)
+        assert np.allclose(wa.process_batch([10, 20]), [10 * 0.5 / 3, (20 * 0.5 + 10 * 0.3) / 3])
+        result = wa.process(30)
+        assert np.isclose(result, (30 * 0.5 + 20 * 0.3 + 10 * 0.2) / 3)
+        assert np.allclose(wa.process_batch([40]), [(40 * 0.5 + 30 * 0.3 + 20 * 0.2) / 3])
+    
+    def test_edge_cases(self):
+        """Test empty blocks, single weights and invalid shapes"""
+        wa = WeightedAverage([2.5])
+        assert wa.process_batch([]).shape == (0,)
+        assert np.allclose(wa.process_batch([10, 20]), [25, 50])
+        with pytest.raises(ValueError):
+            wa.process_batch([[1, 2], [3, 4]])
+
+    @pytest.mark.parametrize("window", [1, 3, 100, 2000])
+    def test_fft_matches_direct(self, window):
+        """Test that overlap-save FFT convolution matches direct convolution"""
+        rng = np.random.default_rng(window)
+        weights = list(rng.normal(size=window))
+        signal = rng.normal(size=10000)
+        direct, fft = WeightedAverage(weights), WeightedAverage(weights)
+        for block in np.array_split(signal, [1, 50, 4000, 4001]):
+            assert np.allclose(fft.process_batch(block, "fft"), direct.process_batch(block, "direct"),
+                               rtol=1e-9, atol=1e-9)
+    
+    def test_method_selection(self):
+        """Test that long windows with large blocks use the FFT engine"""
+        assert choose_convolution_method(5, 100000) == "direct"
+        assert choose_convolution_method(10000, 100000) == "fft"
+        assert choose_convolution_method(100000, 1) == "direct"
+        with pytest.raises(ValueError):
+            WeightedAverage([1, 2]).process_batch([1.0], method="spline")
+
+class TestRunningSums:
+    @pytest.mark.parametrize("weights", [[1] * 5, [5, 4, 3, 2, 1], [0.5] * 64, [1, 3, 5, 7], [2, 2]])
+    def test_matches_direct_sum(self, weights):
+        """Test uniform and ramped weights against the direct weighted sum"""
+        rng = np.random.default_rng(1)
+        signal = rng.normal(loc=1000, scale=50, size=5000)
+        expected = np.convolve(signal, np.asarray(weights, dtype=float))[:len(signal)] / len(weights)
+        
+        wa = WeightedAverage(weights)
+        result = [wa.process(x) for x in signal]
+        assert np.allclose(result, expected, rtol=1e-9, atol=1e-9)
+    
+    def test_state_after_batch(self):
+        """Test that running sums stay consistent after process_batch"""
+        weights = [5, 4, 3, 2, 1]
+        wa, reference = WeightedAverage(weights), WeightedAverage(weights)
+        wa.process_batch([1, 2, 3, 4, 5, 6])
+        for x in [1, 2, 3, 4, 5, 6]:
+            reference.process(x)
+        for x in [7, 8, 9]:
+            assert np.isclose(wa.process(x), reference.process(x))
+
+    @pytest.mark.parametrize("weights", [[1] * 5, [5, 4, 3, 2, 1]])
+    @pytest.mark.parametrize("bad", [float("nan"), float("inf"), float("-inf")])
+    def test_recovers_from_non_finite_sample(self, weights, bad):
+        """Test that a NaN or infinite sample only affects outputs while it is in the window"""
+        wa = WeightedAverage(weights)
+        for _ in range(10):
+            wa.process(1.0)
+        wa.process(bad)
+        inside = [wa.process(1.0) for _ in range(len(weights) - 1)]
+        assert not any(np.isfinite(inside))
+        expected = sum(weights) / len(weights)
+        assert [wa.process(1.0) for _ in range(20)] == pytest.approx([expected] * 20)
+
+    @pytest.mark.parametrize("weights", [[1] * 5, [5, 4, 3, 2, 1]])
+    def test_recovers_from_large_spike(self, weights):
+        """Test that a huge sample does not wipe out the smaller ones after it leaves"""
+        signal = np.ones(100)
+        signal[10] = 1e17
+        expected = np.convolve(signal, np.asarray(weights, dtype=float))[:len(signal)] / len(weights)
+
+        wa = WeightedAverage(weights)
+        result = [wa.process(x) for x in signal]
+        assert np.allclose(result[10 + len(weights):], expected[10 + len(weights):], rtol=1e-12)
+        assert result[-1] == pytest.approx(sum(weights) / len(weights))
+
+    @pytest.mark.parametrize("weights", [[1, 0], [1, 3], [0, 1, 2], [2, 1, 0], [1, 0, -1], [3, 2, 1]])
+    def test_mixed_magnitudes_match_direct_sum(self, weights):
+        """Test ramps through zero and short ramps when large and small samples mix"""
+        signal = np.array([1e17, 1.0, 2.0, 1e17, 3.0, 4.0, 5.0, 6.0] * 4)
+        expected = np.convolve(signal, np.asarray(weights, dtype=float))[:len(signal)] / len(weights)
+
+        wa = WeightedAverage(weights)
+        assert np.allclose([wa.process(x) for x in signal], expected, rtol=1e-12, atol=0)
+
+class TestRingBuffer:
+    @pytest.mark.parametrize("window", [1, 3, 8, 9, 50])
+    def test_matches_deque_reference(self, window):
+        """Test the ring buffer against the original deque implementation"""
+        rng = np.random.default_rng(window)
+        weights = rng.normal(size=window).tolist()
+        signal = rng.normal(size=500).tolist()
+        buffer = deque([0.0] * window, maxlen=window)
+        expected = []
+        for x in signal:
+            buffer.appendleft(x)
+            expected.append(sum(w * v for w, v in zip(weights, buffer)) / window)
+
+        wa = WeightedAverage(weights)
+        assert np.allclose([wa.process(x) for x in signal], expected, rtol=1e-12, atol=1e-12)
+        assert wa.buffer == list(buffer)
+
+    def test_interleaved_with_batches(self):
+        """Test that per-sample and batch calls share the same history"""
+        rng = np.random.default_rng(7)
+        weights = rng.normal(size=6).tolist()
+        signal = rng.normal(size=40)
+        wa, reference = WeightedAverage(weights), WeightedAverage(weights)
+        expected = [reference.process(x) for x in signal]
+        result = [wa.process(x) for x in signal[:3]]
+        result.extend(wa.process_batch(signal[3:5]))
+        result.extend(wa.process(x) for x in signal[5:20])
+        result.extend(wa.process_batch(signal[20:]))
+        assert np.allclose(result, expected)
+        assert wa.buffer == reference.buffer
+
+    def test_buffer_is_a_copy(self):
+        """Test that the buffer property reports most recent first without exposing state"""
+        wa = WeightedAverage([1, 2, 3])
+        wa.process(1)
+        wa.process(2)
+        snapshot = wa.buffer
+        assert snapshot == [2.0, 1.0, 0.0]
+        snapshot[0] = 99.0
+        assert wa.buffer == [2.0, 1.0, 0.0]
+
+class TestMultiChannel:
+    @pytest.mark.parametrize("window", [1, 5, 300])
+    @pytest.mark.parametrize("per_channel", [False, True])
+    def test_matches_single_channel_filters(self, window, per_channel):
+        """Test that every channel matches its own WeightedAverage"""
+        rng = np.random.default_rng(window)
+        channels = 4
+        weights = rng.normal(size=(channels, window) if per_channel else window)
+        signal = rng.normal(size=(channels, 3000))
+        
+        multi = MultiChannelWeightedAverage(weights, channels=channels)
+        result = np.concatenate([multi.process(block) for block in
+                                 np.array_split(signal, [1, 2, 100, 2999], axis=1)], axis=1)
+        for c in range(channels):
+            single = WeightedAverage(list(weights[c] if per_channel else weights))
+            assert np.allclose(result[c], single.process_batch(signal[c], "direct"), rtol=1e-9, atol=1e-9)
+    
+    def test_single_sample(self):
+        """Test processing one sample per channel"""
+        multi = MultiChannelWeightedAverage([0.5, 0.3, 0.2], channels=2)
+        assert np.allclose(multi.process([10, 1]), [10 * 0.5 / 3, 0.5 / 3])
+        assert np.allclose(multi.process([20, 2]), [(20 * 0.5 + 10 * 0.3) / 3, (2 * 0.5 + 0.3) / 3])
+    
+    def test_invalid_configuration(self):
+        """Test invalid weights, channel counts and block shapes"""
+        with pytest.raises(ValueError):
+            MultiChannelWeightedAverage([], channels=2)
+        with pytest.raises(ValueError):
+            MultiChannelWeightedAverage([[1, 1], [0, 0]])
+        with pytest.raises(ValueError):
+            MultiChannelWeightedAverage([1, 1])
+        with pytest.raises(ValueError):
+            MultiChannelWeightedAverage([[1, 1], [2, 2]], channels=3)
+        with pytest.raises(ValueError):
+            MultiChannelWeightedAverage([1, 1], channels=2).process(np.zeros((3, 4)))
+
 class TestEdgeCases:
     def test_empty_weights(self):
         """Test with empty weights (should raise an error)"""
@@ -121,6 +313,243 @@ class TestEdgeCases:
         wa = WeightedAverage([1, 1])
         with pytest.raises(TypeError):
             wa.process("not a number")
+        with pytest.raises(TypeError):
+            wa.process("1.5")
+        with pytest.raises(TypeError):
+            wa.process(None)
+        with pytest.raises(TypeError):
+            wa.process(1 + 2j)
+
+    def test_converted_inputs(self):
+        """Test that Decimal, Fraction and NumPy inputs are converted to float"""
+        wa = WeightedAverage([1, 1])
+        result = wa.process(Decimal("1.5"))
+        assert type(result) is float and result == 0.75
+        result = wa.process(Fraction(1, 2))
+        assert type(result) is float and result == 1.0
+        assert wa.process(np.float32(2.5)) == 1.5
+        assert wa.buffer == [2.5, 0.5]
+
+class TestPipeline:
+    def test_sine_wave_blocks(self):
+        """Test that the chunked source matches generate_sine_wave"""
+        expected = generate_sine_wave(1000, 2.0, 1.5)
+        blocks = list(sine_wave_blocks(1000, 2.0, 1.5, block_size=300))
+        assert [block.size for block in blocks] == [300, 300, 300, 100]
+        assert np.allclose(np.concatenate(blocks), expected, rtol=0, atol=1e-12)
+
+    @pytest.mark.parametrize("samples,block_size", [(1000, 300), (4096, 4096), (7919, 64), (1, 5)])
+    def test_sine_wave_blocks_bit_identical(self, samples, block_size):
+        """Test that the blocks concatenate to exactly the one-shot sine wave"""
+        blocks = np.concatenate(list(sine_wave_blocks(samples, 3.7, 0.9, block_size=block_size)))
+        assert np.array_equal(blocks, sine_wave(samples, 3.7, 0.9))
+
+    def test_chained_filters(self):
+        """Test a pipeline of two filters against per-sample processing"""
+        signal = np.random.default_rng(3).normal(size=2000)
+        first, second = [0.5, 0.3, 0.2], [1, -2, 4, 1]
+        reference_first, reference_second = WeightedAverage(first), WeightedAverage(second)
+        expected = [reference_second.process(reference_first.process(x)) for x in signal]
+
+        stage = WeightedAverage(second).filter_blocks(WeightedAverage(first).filter_blocks(
+            iter_blocks(signal, 128)))
+        assert np.allclose(collect_blocks(stage), expected)
+
+    def test_iter_blocks_from_generator(self):
+        """Test splitting a lazy iterable of samples into blocks"""
+        blocks = list(iter_blocks((float(i) for i in range(10)), 4))
+        assert [block.tolist() for block in blocks] == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+        assert list(iter_blocks(iter([]), 4)) == []
+        with pytest.raises(ValueError):
+            list(iter_blocks([1.0], 0))
+
+    def test_sinks(self, tmp_path):
+        """Test writing blocks to a file and collecting into a preallocated array"""
+        blocks = list(sine_wave_blocks(100, block_size=32))
+        path = tmp_path / "signal.f32"
+        with open(path, "wb") as f:
+            assert write_blocks(blocks, f, np.float32) == 100
+        assert np.allclose(np.fromfile(path, dtype=np.float32), np.concatenate(blocks), atol=1e-6)
+
+        out = np.zeros(128)
+        filled = collect_blocks(blocks, out)
+        assert filled.size == 100 and np.shares_memory(filled, out)
+        with pytest.raises(ValueError):
+            collect_blocks(blocks, np.zeros(50))
+
+class TestFileFiltering:
+    def test_state_round_trip(self):
+        """Test that a saved state resumes filtering exactly"""
+        weights = [0.5, -1, 2, 0.25]
+        signal = np.random.default_rng(4).normal(size=50)
+        wa = WeightedAverage(weights)
+        expected = [wa.process(x) for x in signal]
+        first = WeightedAverage(weights)
+        first.process_batch(signal[:20])
+        resumed = WeightedAverage(weights)
+        resumed.set_state(first.get_state())
+        assert np.allclose(resumed.process_batch(signal[20:]), expected[20:])
+        with pytest.raises(ValueError):
+            resumed.set_state([1.0, 2.0])
+
+    @pytest.mark.parametrize("dtype", [np.float32, np.float64])
+    def test_matches_batch(self, tmp_path, dtype):
+        """Test that filtering a file matches filtering the samples in memory"""
+        signal = np.random.default_rng(5).normal(size=10000).astype(dtype)
+        source, target = tmp_path / "in.raw", tmp_path / "out.raw"
+        signal.tofile(source)
+        reports = []
+        done = filter_file(WeightedAverage([5, 4, 3, 2, 1]), str(source), str(target), dtype,
+                           block_size=3000, progress=lambda done, total: reports.append((done, total)))
+        assert done == 10000
+        assert reports == [(3000, 10000), (6000, 10000), (9000, 10000), (10000, 10000)]
+        expected = WeightedAverage([5, 4, 3, 2, 1]).process_batch(signal)
+        assert np.allclose(np.fromfile(target, dtype=dtype), expected, rtol=1e-5)
+
+    def test_resume_after_interruption(self, tmp_path):
+        """Test that an interrupted run resumes from its checkpoint"""
+        weights = list(np.random.default_rng(6).normal(size=9))
+        signal = np.random.default_rng(7).normal(size=5000)
+        source, target = tmp_path / "in.raw", tmp_path / "out.raw"
+        checkpoint = str(tmp_path / "filter.ckpt")
+        signal.tofile(source)
+
+        def interrupt(done, total):
+            if done >= 2000:
+                raise KeyboardInterrupt
+        with pytest.raises(KeyboardInterrupt):
+            filter_file(WeightedAverage(weights), str(source), str(target), block_size=1000,
+                        progress=interrupt, checkpoint_path=checkpoint)
+        assert os.path.exists(checkpoint)
+
+        assert filter_file(WeightedAverage(weights), str(source), str(target), block_size=1000,
+                           checkpoint_path=checkpoint) == 3000
+        assert not os.path.exists(checkpoint)
+        expected = WeightedAverage(weights).process_batch(signal)
+        assert np.allclose(np.fromfile(target), expected)
+
+    def test_checkpoint_from_other_filter(self, tmp_path):
+        """Test that a checkpoint is not restored into a different filter"""
+        source, target = tmp_path / "in.raw", tmp_path / "out.raw"
+        checkpoint = str(tmp_path / "filter.ckpt")
+        np.arange(100.0).tofile(source)
+
+        def interrupt(done, total):
+            raise KeyboardInterrupt
+        with pytest.raises(KeyboardInterrupt):
+            filter_file(WeightedAverage([1, 2]), str(source), str(target), block_size=10,
+                        progress=interrupt, checkpoint_path=checkpoint)
+        with pytest.raises(ValueError):
+            filter_file(WeightedAverage([2, 1]), str(source), str(target), checkpoint_path=checkpoint)
+
+    def test_empty_input_removes_checkpoint(self, tmp_path):
+        """Test that finishing an empty input still removes the checkpoint"""
+        source, target = tmp_path / "in.raw", tmp_path / "out.raw"
+        checkpoint = str(tmp_path / "filter.ckpt")
+        np.arange(100.0).tofile(source)
+
+        def interrupt(done, total):
+            raise KeyboardInterrupt
+        with pytest.raises(KeyboardInterrupt):
+            filter_file(WeightedAverage([1, 2]), str(source), str(target), block_size=10,
+                        progress=interrupt, checkpoint_path=checkpoint)
+        assert os.path.exists(checkpoint)
+        source.write_bytes(b"")
+        target.write_bytes(b"")
+        assert filter_file(WeightedAverage([1, 2]), str(source), str(target),
+                           checkpoint_path=checkpoint) == 0
+        assert not os.path.exists(checkpoint)
+        assert target.stat().st_size == 0
+
+class TestParallel:
+    @pytest.mark.parametrize("workers,chunk_size", [(1, None), (1, 77), (3, None), (2, 500)])
+    def test_bit_identical_to_serial(self, workers, chunk_size):
+        """Test that chunked parallel filtering matches a serial direct run exactly"""
+        rng = np.random.default_rng(8)
+        weights = list(rng.normal(size=33))
+        signal = rng.normal(size=4000)
+        serial, parallel = WeightedAverage(weights), WeightedAverage(weights)
+        serial.process_batch(signal[:10], "direct")
+        parallel.process_batch(signal[:10], "direct")
+
+        expected = serial.process_batch(signal[10:], "direct")
+        result = parallel.process_parallel(signal[10:], workers=workers, chunk_size=chunk_size)
+        assert np.array_equal(result, expected)
+        assert parallel.buffer == serial.buffer
+        assert parallel.process(1.0) == serial.process(1.0)
+
+    def test_edge_cases(self):
+        """Test empty and short inputs and invalid arguments"""
+        wa = WeightedAverage([1, 2, 3])
+        assert wa.process_parallel([], workers=2).shape == (0,)
+        assert np.allclose(wa.process_parallel([3.0, 6.0], workers=2, chunk_size=1), [1.0, 4.0])
+        with pytest.raises(ValueError):
+            wa.process_parallel([1.0], chunk_size=0)
+        with pytest.raises(ValueError):
+            wa.process_parallel([[1.0]])
+
+    def test_single_chunk_runs_inline(self, monkeypatch):
+        """Test that one chunk or one worker is filtered without a process pool"""
+        def no_pool(*args, **kwargs):
+            raise AssertionError("process pool started")
+        monkeypatch.setattr(weighted_average, "ProcessPoolExecutor", no_pool)
+        signal = np.random.default_rng(9).normal(size=500)
+        expected = WeightedAverage([3, 1, 2]).process_batch(signal, "direct")
+        assert np.array_equal(WeightedAverage([3, 1, 2]).process_parallel(signal, workers=4, chunk_size=500), expected)
+        assert np.array_equal(WeightedAverage([3, 1, 2]).process_parallel(signal, workers=1, chunk_size=7), expected)
+
+class TestSignalGenerators:
+    def test_sine_wave_matches_list_generator(self):
+        """Test that the vectorized sine wave matches generate_sine_wave"""
+        expected = generate_sine_wave(1000, 2.0, 1.5)
+        assert np.allclose(sine_wave(1000, 2.0, 1.5), expected, rtol=0, atol=1e-12)
+        wave = sine_wave(1000, 2.0, 1.5, dtype=np.float32)
+        assert wave.dtype == np.float32
+        assert np.allclose(wave, expected, atol=1e-6)
+
+    def test_fill_preallocated_output(self):
+        """Test that every generator can fill a preallocated buffer"""
+        for generate in (lambda out: sine_wave(64, out=out),
+                         lambda out: multi_tone(64, [1, 3], out=out),
+                         lambda out: chirp(64, 1, 4, out=out),
+                         lambda out: noise(64, seed=1, out=out)):
+            out = np.zeros(64, dtype=np.float32)
+            assert generate(out) is out
+            assert np.any(out != 0)
+        with pytest.raises(ValueError):
+            sine_wave(64, out=np.zeros(32))
+
+    def test_multi_tone_and_chirp(self):
+        """Test multi-tone sums and a chirp with a constant frequency"""
+        tones = multi_tone(500, [1.0, 5.0], [2.0, 0.5])
+        assert np.allclose(tones, sine_wave(500, 1.0, 2.0) + sine_wave(500, 5.0, 0.5))
+        assert np.allclose(chirp(500, 3.0, 3.0, 1.5), sine_wave(500, 3.0, 1.5))
+        with pytest.raises(ValueError):
+            multi_tone(10, [1.0, 2.0], [1.0])
+
+    def test_noise(self):
+        """Test that noise is reproducible with a seed and scaled by amplitude"""
+        assert np.array_equal(noise(1000, seed=3), noise(1000, seed=3))
+        assert abs(np.std(noise(100000, 2.0, seed=4)) - 2.0) < 0.05
+        assert noise(10, seed=5, dtype=np.float32).dtype == np.float32
+
+    def test_cached_sine_wave(self):
+        """Test that cached signals are shared and read-only"""
+        first = cached_sine_wave(256, 2, 1.0, "float64")
+        assert cached_sine_wave(256, 2.0, 1.0, np.float64) is first
+        assert not first.flags.writeable
+        with pytest.raises(ValueError):
+            first[0] = 1.0
+        assert cached_sine_wave(256, 2.0, 1.0, np.float32).dtype == np.float32
+
+    def test_negative_samples(self):
+        """Test that a negative sample count gives an empty signal, like range()"""
+        assert generate_sine_wave(-5) == []
+        assert sine_wave(-5).shape == (0,)
+        assert multi_tone(-5, [1, 2]).shape == (0,)
+        assert chirp(-5, 1, 2).shape == (0,)
+        assert noise(-5, seed=0).shape == (0,)
+        assert list(sine_wave_blocks(-5)) == []
 
 if __name__ == "__main__":
     pytest.main()
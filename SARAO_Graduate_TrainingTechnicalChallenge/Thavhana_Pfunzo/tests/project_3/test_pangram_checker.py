@@ -1,9 +1,16 @@
 import pytest
+import random
 import string
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
-from project_3.pangram_checker import is_pangram, ispangram
+from project_3.pangram_checker import (
+    is_pangram, ispangram, PangramChecker, is_pangram_many, compile_alphabet,
+    is_pangram_stream, is_pangram_file, PangramTracker, SlidingPangramTracker,
+    minimal_pangram_windows, shortest_pangram_window, minimal_pangram_windows_stream,
+    shortest_pangram_window_stream
+)
+from project_3.benchmarks import legacy_is_pangram
 
 class TestPangramChecker:
     def test_english_pangram(self):
@@ -88,5 +95,267 @@ class TestEdgeCases:
         assert is_pangram("abc", "aabbcc") is False  # Missing 'b' and 'c' in input
         assert is_pangram("abcabc", "aabbcc") is True
 
+class TestEngine:
+    ALPHABETS = [string.ascii_lowercase, "abc", "ACGT", "01", "aabbcc", "äöüß" + string.ascii_lowercase,
+                 "αβγσ", "σς", "İi", "ǅx", "ßẞ", "ab1!c"]
+    CHARACTERS = "abcxyzACGTÄÖÜäöüßẞσςΣΑαβΓİIıǅǆ01 .!\n"
+
+    def test_matches_original(self):
+        """Test that the single-pass engine agrees with the original implementation"""
+        rng = random.Random(0)
+        for _ in range(3000):
+            text = "".join(rng.choice(self.CHARACTERS) for _ in range(rng.randint(0, 12)))
+            alphabet = rng.choice(self.ALPHABETS)
+            assert is_pangram(text, alphabet) is legacy_is_pangram(text, alphabet), (text, alphabet)
+
+    def test_final_sigma(self):
+        """Test that Σ is lowercased with its context, as str.lower() does"""
+        assert is_pangram("ΑΣ", "ς") is True
+        assert is_pangram("ΑΣ", "σ") is False
+        assert is_pangram("ΣΑ", "σ") is True
+        assert is_pangram("x" * 100000 + "ΑΣ", "ας") is True
+
+    def test_long_inputs(self):
+        """Test letters found far apart, across several scanned slices"""
+        filler = "the brown fox " * 50000
+        assert is_pangram("q" + filler + "z" + filler + "jumps over lazy dogs, kicking") is True
+        assert is_pangram(filler + "jumps over lazy dogs, kicking") is False
+        assert is_pangram(filler + "Ünd Öl", "üö") is True
+        many = "".join(chr(c) for c in range(0x4e00, 0x4e00 + 200))
+        assert is_pangram(filler + many[::-1], many) is True
+        assert is_pangram(filler + many[1:], many) is False
+
+class TestBatch:
+    def test_checker_matches_original(self):
+        """Test that a compiled checker agrees with the original implementation"""
+        rng = random.Random(1)
+        checkers = {alphabet: PangramChecker(alphabet) for alphabet in TestEngine.ALPHABETS + [""]}
+        for _ in range(3000):
+            text = "".join(rng.choice(TestEngine.CHARACTERS) for _ in range(rng.choice([5, 40, 300])))
+            alphabet = rng.choice(list(checkers))
+            assert checkers[alphabet](text) is legacy_is_pangram(text, alphabet), (text, alphabet)
+
+    def test_checker_type_errors(self):
+        """Test that non-string alphabets and inputs are rejected"""
+        with pytest.raises(TypeError):
+            PangramChecker(123)  # type: ignore
+        with pytest.raises(TypeError):
+            PangramChecker()(None)  # type: ignore
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_is_pangram_many(self, workers):
+        """Test batch results, order and throughput reporting"""
+        texts = ["The quick brown fox jumps over the lazy dog", "Not a pangram", ""] * 50
+        result = is_pangram_many((text for text in texts), workers=workers, batch_size=7)
+        assert list(result) == [is_pangram(text) for text in texts]
+        assert isinstance(result.flags, bytearray) and len(result) == 150
+        assert result.pangrams == 50 and result[0] is True and result[1] is False
+        assert result.per_second > 0
+
+    def test_is_pangram_many_custom_alphabet(self):
+        """Test batches with a custom alphabet and invalid inputs"""
+        assert list(is_pangram_many(["ACGT", "acg", "TGCA"], "ACGT")) == [True, False, True]
+        with pytest.raises(TypeError):
+            is_pangram_many(["abc", 1])
+        with pytest.raises(ValueError):
+            is_pangram_many(["abc"], batch_size=0)
+
+class TestCompiledAlphabets:
+    TSHIVENDA = "abdḓefghiklḽmnṅṋoprstṱuvwxyz"
+
+    def test_cache_reuses_checkers(self):
+        """Test that repeated checks with one alphabet share a compiled checker"""
+        assert compile_alphabet(self.TSHIVENDA) is compile_alphabet(self.TSHIVENDA)
+        before = compile_alphabet.cache_info().hits
+        for _ in range(5):
+            is_pangram("Ṱhoho ya ḓaḓa", self.TSHIVENDA)
+        assert compile_alphabet.cache_info().hits >= before + 5
+        with pytest.raises(TypeError):
+            compile_alphabet(123)  # type: ignore
+
+    def test_unicode_alphabets(self):
+        """Test German and Tshivenda alphabets, including upper case input"""
+        german = string.ascii_lowercase + "äöüß"
+        assert is_pangram("Zwölf Boxkämpfer jagen Viktor quer über den großen Sylter Deich", german) is True
+        assert is_pangram("Zwolf Boxkampfer jagen Viktor quer uber den grossen Sylter Deich", german) is False
+        text = "ABDḒEFGHIKLḼMNṄṊOPRSTṰUVWXYZ"
+        assert is_pangram(text, self.TSHIVENDA) is True
+        assert is_pangram(text.replace("Ṱ", "T"), self.TSHIVENDA) is False
+
+    def test_large_alphabet_short_input(self):
+        """Test the subset fast path for alphabets with many letters"""
+        letters = "".join(chr(c) for c in range(0x4e00, 0x4e00 + 100))
+        checker = PangramChecker(letters)
+        assert checker(letters[::-1]) is True
+        assert checker(letters[:-1]) is False
+        assert checker(letters[::-1]) is legacy_is_pangram(letters[::-1], letters)
+
+class TestStreaming:
+    PANGRAM = "Ünd the quick brown fox jumps over the lazy dog"
+
+    @staticmethod
+    def split(text, rng):
+        cuts = sorted(rng.sample(range(len(text) + 1), min(len(text) + 1, rng.randint(0, 4))))
+        return [text[i:j] for i, j in zip([0] + cuts, cuts + [len(text)])]
+
+    def test_matches_original(self):
+        """Test that randomly chunked streams agree with the original implementation"""
+        rng = random.Random(2)
+        for _ in range(2000):
+            text = "".join(rng.choice(TestEngine.CHARACTERS) for _ in range(rng.randint(0, 12)))
+            alphabet = rng.choice(TestEngine.ALPHABETS)
+            expected = legacy_is_pangram(text, alphabet)
+            assert bool(is_pangram_stream(self.split(text, rng), alphabet)) is expected, (text, alphabet)
+            chunks = self.split(text.encode("utf-8"), rng)
+            assert bool(is_pangram_stream(chunks, alphabet, encoding="utf-8")) is expected, (text, alphabet)
+
+    def test_missing_letters_and_offsets(self):
+        """Test the reported missing letters and first-seen character offsets"""
+        result = is_pangram_stream(["The quick brown ", "fox"])
+        assert not result
+        assert result.missing == frozenset("adgjlmpsvyz")
+        assert result.first_seen["t"] == 0 and result.first_seen["x"] == 18
+        result = is_pangram_stream([self.PANGRAM[:10], self.PANGRAM[10:]])
+        assert result and result.first_seen["q"] == 8 and result.first_seen["u"] == 9
+
+    @pytest.mark.parametrize("encoding", ["utf-8", "utf-8-sig", "utf-16", "latin-1"])
+    def test_byte_offsets(self, encoding):
+        """Test byte offsets with multi-byte characters split across chunks"""
+        data = self.PANGRAM.encode(encoding)
+        result = is_pangram_stream([data[i:i + 3] for i in range(0, len(data), 3)], encoding=encoding)
+        assert result
+        for letter, offset in result.first_seen.items():
+            index = self.PANGRAM.lower().index(letter)
+            # The prefix is encoded with the same byte-order mark as the data
+            assert offset == len(self.PANGRAM[:index].encode(encoding))
+
+    def test_stops_reading_early(self):
+        """Test that no chunk is read after the alphabet is complete"""
+        read = []
+
+        def chunks():
+            for chunk in [self.PANGRAM, "more", "text"]:
+                read.append(chunk)
+                yield chunk
+        assert is_pangram_stream(chunks())
+        assert read == [self.PANGRAM]
+
+    def test_file(self, tmp_path):
+        """Test files read in small blocks"""
+        path = tmp_path / "text.txt"
+        path.write_text("Ωmega " * 1000 + self.PANGRAM + " never read", encoding="utf-8")
+        result = is_pangram_file(str(path), block_size=7)
+        assert result
+        assert result.first_seen["q"] == len(("Ωmega " * 1000 + "Ünd the ").encode("utf-8"))
+        assert not is_pangram_file(str(path), string.ascii_lowercase + "ß")
+        with pytest.raises(ValueError):
+            is_pangram_file(str(path), block_size=0)
+
+    def test_sigma_across_chunks(self):
+        """Test that Σ is lowercased with context from neighbouring chunks"""
+        for text in ["x" * 100 + "ΑΣ b", "x" * 100 + "ΑΣΒ", "ΑΣ", "Α Σ", "ΣΑ" + "y" * 70]:
+            for cut in range(len(text) + 1):
+                for alphabet in ["ς", "σ", "ας"]:
+                    expected = legacy_is_pangram(text, alphabet)
+                    assert bool(is_pangram_stream([text[:cut], text[cut:]], alphabet)) is expected
+
+class TestTrackers:
+    def test_tracker_matches_is_pangram(self):
+        """Test the tracker against is_pangram on everything fed so far"""
+        rng = random.Random(3)
+        characters = TestEngine.CHARACTERS.replace("Σ", "")
+        for alphabet in TestEngine.ALPHABETS:
+            tracker = PangramTracker(alphabet)
+            text = ""
+            for _ in range(40):
+                piece = "".join(rng.choice(characters) for _ in range(rng.randint(0, 3)))
+                text += piece
+                assert tracker.feed(piece) is legacy_is_pangram(text, alphabet), (text, alphabet)
+                assert tracker.is_complete is legacy_is_pangram(text, alphabet)
+            assert tracker.position == len(text)
+
+    def test_tracker_missing_and_reset(self):
+        """Test missing letters, first offsets and reset"""
+        tracker = PangramTracker("abc")
+        assert tracker.feed("xxA") is False
+        assert tracker.missing() == frozenset("bc")
+        assert tracker.feed("cb") is True
+        assert tracker.first_seen == {"a": 2, "c": 3, "b": 4}
+        tracker.reset()
+        assert tracker.is_complete is False and tracker.missing() == frozenset("abc")
+        with pytest.raises(TypeError):
+            tracker.feed(None)  # type: ignore
+
+    @pytest.mark.parametrize("window", [1, 3, 8, 40])
+    def test_sliding_matches_is_pangram(self, window):
+        """Test the sliding window against is_pangram on the last window characters"""
+        rng = random.Random(window)
+        characters = TestEngine.CHARACTERS.replace("Σ", "")
+        for alphabet in ["abc", "ACGT", "İi", "aabbcc", string.ascii_lowercase]:
+            tracker = SlidingPangramTracker(window, alphabet)
+            text = ""
+            for _ in range(200):
+                piece = "".join(rng.choice(characters) for _ in range(rng.choice([1, 1, 2, 50])))
+                text += piece
+                expected = legacy_is_pangram(text[-window:], alphabet)
+                assert tracker.feed(piece) is expected, (text[-window:], alphabet)
+                assert (not tracker.missing()) is expected
+
+    def test_sliding_missing_and_sigma(self):
+        """Test letters leaving the window, Σ and invalid windows"""
+        tracker = SlidingPangramTracker(3, "abc")
+        assert tracker.feed("abc") is True
+        assert tracker.feed("d") is False
+        assert tracker.missing() == frozenset("a")
+        assert SlidingPangramTracker(2, "σ").feed("ΑΣ") is True
+        with pytest.raises(ValueError):
+            SlidingPangramTracker(0)
+
+class TestWindowSearch:
+    @staticmethod
+    def brute_force(text, alphabet):
+        pangrams = [(i, j) for i in range(len(text) + 1) for j in range(i, len(text) + 1)
+                    if legacy_is_pangram(text[i:j], alphabet)]
+        minimal = [(i, j) for i, j in pangrams
+                   if not any((k, l) != (i, j) and i <= k and l <= j for k, l in pangrams)]
+        return sorted(minimal)
+
+    def test_matches_brute_force(self):
+        """Test minimal and shortest windows against checking every substring"""
+        rng = random.Random(4)
+        characters = "abcAB xİi."
+        for _ in range(400):
+            text = "".join(rng.choice(characters) for _ in range(rng.randint(0, 10)))
+            alphabet = rng.choice(["abc", "ab", "aabb", "İi", "xi", "1"])
+            # Every empty substring is a pangram of "1"; only the first one is reported
+            expected = self.brute_force(text, alphabet) if alphabet != "1" else [(0, 0)]
+            assert list(minimal_pangram_windows(text, alphabet)) == expected, (text, alphabet)
+            shortest = min(expected, key=lambda w: w[1] - w[0]) if expected else None
+            assert shortest_pangram_window(text, alphabet) == shortest, (text, alphabet)
+
+    def test_english_text(self):
+        """Test the shortest window in a longer English text"""
+        pangram = "Pack my box with five dozen liquor jugs"
+        text = "Once upon a time. " * 1000 + pangram + " and the end" * 1000
+        start, end = shortest_pangram_window(text)
+        assert is_pangram(text[start:end])
+        assert end - start <= len(pangram)
+        assert shortest_pangram_window("not a pangram") is None
+        assert shortest_pangram_window("anything", "123") == (0, 0)
+
+    def test_stream_matches_string(self):
+        """Test that the streaming search reports stream offsets"""
+        rng = random.Random(5)
+        text = "".join(rng.choice("abcdefghij ") for _ in range(2000))
+        chunks = [text[i:i + 37] for i in range(0, len(text), 37)]
+        expected = list(minimal_pangram_windows(text, "abcdefghij"))
+        assert expected
+        assert list(minimal_pangram_windows_stream(iter(chunks), "abcdefghij")) == expected
+        assert shortest_pangram_window_stream(chunks, "abcdefghij") == shortest_pangram_window(text, "abcdefghij")
+        with pytest.raises(TypeError):
+            minimal_pangram_windows(None)  # type: ignore
+        with pytest.raises(TypeError):
+            list(minimal_pangram_windows_stream([b"abc"], "abc"))
+
 if __name__ == "__main__":
     pytest.main()